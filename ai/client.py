@@ -222,6 +222,14 @@ except Exception as e:
             logging.error(f"Fallback code generation failed: {e}")
             return f"# Error generating code for: {command}\nprint('Unable to process command due to system issues')"
     
+    def warm_up(self) -> None:
+        """Open (or refresh) the HTTPS connection to Gemini ahead of a request"""
+        try:
+            # Cheap metadata call - the pooled connection is then reused by generate_content
+            self.client.models.get(model=self.model)
+        except Exception as e:
+            logging.debug(f"AI client warm-up failed: {e}")
+    
     def generate_function(self, task_description: str, error_context: str = None) -> str:
         """Generate a new function to handle unknown tasks"""
         
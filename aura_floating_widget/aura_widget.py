@@ -11,11 +11,16 @@ Redesigned with:
 
 import sys
 import os
+import re
 import math
 import random
+import time
 import threading
 import queue
+from collections import deque
 from datetime import datetime
+from itertools import islice
+from pathlib import Path
 
 # Add parent directory for AURA imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -24,35 +29,25 @@ try:
     from PyQt5.QtWidgets import (
         QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
         QLabel, QPushButton, QLineEdit, QTextEdit, QFrame,
-        QGraphicsDropShadowEffect, QSystemTrayIcon, QMenu, QAction,
-        QGraphicsOpacityEffect, QStackedWidget
+        QSystemTrayIcon, QMenu, QAction, QStyle, QStyleOption,
+        QGraphicsOpacityEffect, qDrawBorderPixmap
     )
     from PyQt5.QtCore import (
-        Qt, QTimer, QPropertyAnimation, QEasingCurve, 
-        pyqtSignal, QObject, QPoint, QSize, QThread,
-        QSequentialAnimationGroup, QParallelAnimationGroup
+        Qt, QTimer, QPropertyAnimation, QEasingCurve, QEvent,
+        pyqtSignal, QObject, QPoint, QPointF, QRect, QSize, QThread, QMargins,
+        QSequentialAnimationGroup, QParallelAnimationGroup,
+        QMutex, QWaitCondition, QSignalBlocker
     )
     from PyQt5.QtGui import (
         QColor, QPainter, QBrush, QPen, QLinearGradient,
-        QRadialGradient, QFont, QIcon, QPainterPath, QCursor
+        QRadialGradient, QFont, QIcon, QPainterPath, QCursor,
+        QPixmap, QPixmapCache, QRegion, QTextOption
     )
     PYQT_AVAILABLE = True
 except ImportError:
     PYQT_AVAILABLE = False
     print("PyQt5 not found. Install with: pip install PyQt5")
 
-# Import AURA components
-try:
-    from ai.client import ai_client
-    from ai.code_executor import executor
-    from learning.capability_manager import capability_manager
-    from learning.self_improvement import improvement_engine
-    from utils import windows_system as windows_system_utils
-    AURA_AVAILABLE = True
-except ImportError as e:
-    AURA_AVAILABLE = False
-    print(f"AURA components not available: {e}")
-
 # Try to import voice output (TTS)
 try:
     import pyttsx3
@@ -71,26 +66,411 @@ except ImportError:
 VOICE_AVAILABLE = TTS_AVAILABLE  # For backward compatibility
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# AURA v2 - Intelligent Routing (reduces LLM costs by 85%+)
+# AURA backends - imported by the processing worker, not at startup: they pull
+# in google-genai, build the AI client and compile the intent router
 # ═══════════════════════════════════════════════════════════════════════════════
-try:
-    from ui.bridge import aura_bridge
-    from ui.wake_word import KeywordWakeDetector, check_wake_word, extract_command_after_wake
-    AURA_V2_AVAILABLE = True
-    print("AURA v2 intelligent routing enabled")
-except ImportError as e:
-    AURA_V2_AVAILABLE = False
-    print(f"AURA v2 not available, using fallback: {e}")
+AURA_AVAILABLE = False  # Legacy code-generation pipeline
+AURA_V2_AVAILABLE = False  # AURA v2 - Intelligent Routing (reduces LLM costs by 85%+)
+aura_bridge = None
+CommandCancelled = None
+_backends_lock = threading.Lock()
+_backends_loaded = False
+
+
+def _load_backends():
+    """Import the AURA backends once (thread-safe); flags stay False until then"""
+    global _backends_loaded, AURA_AVAILABLE, AURA_V2_AVAILABLE, aura_bridge, CommandCancelled
+    global ai_client, executor, improvement_engine, windows_system_utils
+    with _backends_lock:
+        if _backends_loaded:
+            return
+        _backends_loaded = True
+        
+        try:
+            from ai.client import ai_client
+            from ai.code_executor import executor
+            from learning.capability_manager import capability_manager  # noqa: F401
+            from learning.self_improvement import improvement_engine
+            from utils import windows_system as windows_system_utils
+            AURA_AVAILABLE = True
+        except ImportError as e:
+            print(f"AURA components not available: {e}")
+        
+        try:
+            from ui.bridge import aura_bridge, CommandCancelled
+            AURA_V2_AVAILABLE = True
+            print("AURA v2 intelligent routing enabled")
+        except ImportError as e:
+            print(f"AURA v2 not available, using fallback: {e}")
 
 # TTS Manager for proper voice output
 try:
-    from utils.tts_manager import get_tts_manager, speak as tts_speak, speak_chunked
+    from utils.tts_manager import (
+        get_tts_manager, speak as tts_speak, speak_chunked, stop_speaking, on_speech_idle
+    )
     TTS_MANAGER_AVAILABLE = True
     print("TTS Manager loaded")
 except ImportError:
     TTS_MANAGER_AVAILABLE = False
     tts_speak = None
     speak_chunked = None
+    stop_speaking = None
+    on_speech_idle = None
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Stylesheets - parsed by Qt once per unique string, shared across widgets
+# ═══════════════════════════════════════════════════════════════════════════════
+_CONTAINER_QSS = """
+#container {
+    background: qlineargradient(
+        x1:0, y1:0, x2:0, y2:1,
+        stop:0 rgba(10, 10, 26, 240),
+        stop:1 rgba(25, 25, 50, 240)
+    );
+    border: 1px solid rgba(0, 212, 255, 0.3);
+    border-radius: 20px;
+}
+
+/* Header buttons */
+QPushButton#settings_btn, QPushButton#collapse_btn, QPushButton#minimize_btn {
+    background: rgba(255, 255, 255, 0.1);
+    border: none;
+    border-radius: 14px;
+    color: white;
+    font-size: 14px;
+}
+QPushButton#collapse_btn {
+    font-size: 12px;
+}
+QPushButton#minimize_btn {
+    font-size: 18px;
+    font-weight: bold;
+}
+QPushButton#settings_btn:hover, QPushButton#collapse_btn:hover, QPushButton#minimize_btn:hover {
+    background: rgba(0, 212, 255, 0.3);
+}
+
+QLabel#title {
+    color: #00d4ff;
+    font-family: 'Segoe UI', Arial;
+    font-size: 40px;
+    font-weight: bold;
+    letter-spacing: 11px;
+}
+
+QLabel#status_label {
+    color: rgba(255, 255, 255, 0.5);
+    font-size: 11px;
+    letter-spacing: 2px;
+}
+/* set_status() switches these via the "status" dynamic property */
+QLabel#status_label[status="success"] {
+    color: #00ff88;
+}
+QLabel#status_label[status="error"] {
+    color: #ff6b6b;
+}
+QLabel#status_label[status="warning"] {
+    color: #ffd700;
+}
+QLabel#status_label[status="processing"] {
+    color: #00d4ff;
+}
+
+/* Response / history toggles */
+QPushButton#toggle_response_btn {
+    background: rgba(0, 212, 255, 0.1);
+    border: 1px solid rgba(0, 212, 255, 0.3);
+    border-radius: 8px;
+    color: rgba(0, 212, 255, 0.8);
+    font-size: 10px;
+    padding: 4px;
+}
+QPushButton#toggle_response_btn:hover {
+    background: rgba(0, 212, 255, 0.2);
+    border-color: rgba(0, 212, 255, 0.5);
+}
+QPushButton#toggle_history_btn {
+    background: rgba(147, 112, 219, 0.1);
+    border: 1px solid rgba(147, 112, 219, 0.3);
+    border-radius: 8px;
+    color: rgba(147, 112, 219, 0.8);
+    font-size: 10px;
+    padding: 4px;
+}
+QPushButton#toggle_history_btn:hover {
+    background: rgba(147, 112, 219, 0.2);
+    border-color: rgba(147, 112, 219, 0.5);
+}
+
+/* Response display (built lazily, styled by this sheet when inserted) */
+QTextEdit#response_display {
+    background: rgba(0, 0, 0, 0.3);
+    border: 1px solid rgba(0, 212, 255, 0.2);
+    border-radius: 10px;
+    padding: 10px;
+    color: rgba(255, 255, 255, 0.9);
+    font-size: 12px;
+    font-family: 'Segoe UI', Arial;
+    selection-background-color: rgba(0, 212, 255, 0.3);
+}
+QTextEdit#response_display QScrollBar:vertical {
+    background: rgba(0, 0, 0, 0.3);
+    width: 8px;
+    border-radius: 4px;
+}
+QTextEdit#response_display QScrollBar::handle:vertical {
+    background: rgba(0, 212, 255, 0.5);
+    border-radius: 4px;
+    min-height: 20px;
+}
+QTextEdit#response_display QScrollBar::handle:vertical:hover {
+    background: rgba(0, 212, 255, 0.7);
+}
+
+/* History display + clear button (built lazily) */
+QTextEdit#history_display {
+    background: rgba(20, 20, 30, 0.5);
+    border: 1px solid rgba(147, 112, 219, 0.2);
+    border-radius: 10px;
+    padding: 8px;
+    color: rgba(255, 255, 255, 0.85);
+    font-size: 11px;
+    font-family: 'Segoe UI', Arial;
+}
+QTextEdit#history_display QScrollBar:vertical {
+    background: rgba(0, 0, 0, 0.3);
+    width: 6px;
+    border-radius: 3px;
+}
+QTextEdit#history_display QScrollBar::handle:vertical {
+    background: rgba(147, 112, 219, 0.5);
+    border-radius: 3px;
+}
+QPushButton#clear_history_btn {
+    background: rgba(255, 100, 100, 0.1);
+    border: 1px solid rgba(255, 100, 100, 0.3);
+    border-radius: 6px;
+    color: rgba(255, 150, 150, 0.8);
+    font-size: 9px;
+    padding: 3px 8px;
+}
+QPushButton#clear_history_btn:hover {
+    background: rgba(255, 100, 100, 0.2);
+}
+
+/* Voice input buttons - switched via the "active" dynamic property */
+QPushButton#mic_btn, QPushButton#hands_free_btn {
+    background: rgba(255, 255, 255, 0.1);
+    border-radius: 22px;
+    color: white;
+    font-size: 18px;
+}
+QPushButton#mic_btn {
+    border: 1px solid rgba(0, 212, 255, 0.3);
+}
+QPushButton#mic_btn:hover {
+    background: rgba(0, 212, 255, 0.3);
+    border-color: rgba(0, 212, 255, 0.6);
+}
+QPushButton#mic_btn[active="true"] {
+    background: rgba(255, 71, 87, 0.5);
+    border: 2px solid rgba(255, 71, 87, 0.8);
+}
+QPushButton#hands_free_btn {
+    border: 1px solid rgba(123, 104, 238, 0.3);
+}
+QPushButton#hands_free_btn:hover {
+    background: rgba(123, 104, 238, 0.3);
+    border-color: rgba(123, 104, 238, 0.6);
+}
+QPushButton#hands_free_btn[active="true"] {
+    background: rgba(0, 255, 136, 0.4);
+    border: 2px solid rgba(0, 255, 136, 0.8);
+}
+"""
+
+_INPUT_QSS = """
+QLineEdit {
+    background: rgba(0, 0, 0, 0.4);
+    border: 1px solid rgba(0, 212, 255, 0.3);
+    border-radius: 12px;
+    padding: 12px 18px;
+    color: white;
+    font-size: 13px;
+}
+QLineEdit:focus {
+    border-color: rgba(0, 212, 255, 0.7);
+}
+QLineEdit::placeholder {
+    color: rgba(255, 255, 255, 0.4);
+}
+"""
+
+_BTN_CLOSE_QSS = """
+QPushButton {
+    background: rgba(255, 255, 255, 0.1);
+    border: none;
+    border-radius: 14px;
+    color: white;
+    font-size: 18px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background: rgba(255, 71, 87, 0.5);
+}
+"""
+
+_BTN_SEND_QSS = """
+QPushButton {
+    background: qlineargradient(
+        x1:0, y1:0, x2:1, y2:1,
+        stop:0 #00d4ff, stop:1 #7b68ee
+    );
+    border: none;
+    border-radius: 22px;
+    color: white;
+    font-size: 16px;
+}
+QPushButton:hover {
+    background: qlineargradient(
+        x1:0, y1:0, x2:1, y2:1,
+        stop:0 #00e5ff, stop:1 #9370db
+    );
+}
+QPushButton:pressed {
+    background: #00d4ff;
+}
+"""
+
+_LOADING_LETTER_QSS = """
+color: #00d4ff;
+font-family: 'Segoe UI', Arial;
+font-size: 48px;
+font-weight: bold;
+letter-spacing: 4px;
+"""
+
+_SETTINGS_CONTAINER_QSS = """
+#settings_container {
+    background: qlineargradient(
+        x1:0, y1:0, x2:0, y2:1,
+        stop:0 rgba(15, 15, 35, 250),
+        stop:1 rgba(30, 30, 60, 250)
+    );
+    border: 1px solid rgba(0, 212, 255, 0.4);
+    border-radius: 15px;
+}
+QLabel#settings_title {
+    color: #00d4ff;
+    font-size: 18px;
+    font-weight: bold;
+    letter-spacing: 2px;
+}
+
+/* Status line - switched via the "status" dynamic property */
+QLabel#settings_status {
+    color: rgba(255, 255, 255, 0.6);
+    font-size: 11px;
+}
+QLabel#settings_status[status="ok"] {
+    color: #00ff88;
+}
+QLabel#settings_status[status="warn"] {
+    color: #ffd700;
+}
+QLabel#settings_status[status="err"] {
+    color: #ff6b6b;
+}
+
+/* Voice buttons - switched via the "voice" dynamic property */
+QPushButton[voice="active"] {
+    background: qlineargradient(
+        x1:0, y1:0, x2:1, y2:1,
+        stop:0 #00d4ff, stop:1 #7b68ee
+    );
+    border: none;
+    border-radius: 8px;
+    color: white;
+    font-size: 12px;
+    font-weight: bold;
+}
+QPushButton[voice="inactive"] {
+    background: rgba(255, 255, 255, 0.1);
+    border: 1px solid rgba(0, 212, 255, 0.3);
+    border-radius: 8px;
+    color: rgba(255, 255, 255, 0.7);
+    font-size: 12px;
+}
+QPushButton[voice="inactive"]:hover {
+    background: rgba(0, 212, 255, 0.2);
+}
+"""
+
+_SETTINGS_LABEL_QSS = """
+color: rgba(255, 255, 255, 0.7);
+font-size: 12px;
+"""
+
+_SETTINGS_INPUT_QSS = """
+QLineEdit {
+    background: rgba(0, 0, 0, 0.4);
+    border: 1px solid rgba(0, 212, 255, 0.3);
+    border-radius: 10px;
+    padding: 10px 15px;
+    color: white;
+    font-size: 13px;
+}
+QLineEdit:focus {
+    border-color: rgba(0, 212, 255, 0.7);
+}
+"""
+
+_SETTINGS_CLOSE_QSS = """
+QPushButton {
+    background: rgba(255, 255, 255, 0.1);
+    border: none;
+    border-radius: 12px;
+    color: white;
+    font-size: 16px;
+}
+QPushButton:hover {
+    background: rgba(255, 71, 87, 0.5);
+}
+"""
+
+_BTN_SAVE_QSS = """
+QPushButton {
+    background: qlineargradient(
+        x1:0, y1:0, x2:1, y2:1,
+        stop:0 #00d4ff, stop:1 #7b68ee
+    );
+    border: none;
+    border-radius: 10px;
+    color: white;
+    font-size: 13px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background: qlineargradient(
+        x1:0, y1:0, x2:1, y2:1,
+        stop:0 #00e5ff, stop:1 #9370db
+    );
+}
+"""
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Colors - shared, never mutated (copy before changing)
+# ═══════════════════════════════════════════════════════════════════════════════
+_CYAN = QColor(0, 212, 255)
+_PURPLE = QColor(123, 104, 238)
+_LISTENING_RED = QColor(255, 100, 100)
+_TRANSPARENT = QColor(0, 0, 0, 0)
+_WHITE_220 = QColor(255, 255, 255, 220)
+_WHITE_200 = QColor(255, 255, 255, 200)
+_WHITE_0 = QColor(255, 255, 255, 0)
 
 
 class AuraPersonality:
@@ -204,31 +584,49 @@ class AuraPersonality:
 
 
 class VoiceThread(QThread):
-    """Background thread for text-to-speech - Uses TTS Manager"""
+    """Persistent pyttsx3 fallback worker - one thread, utterances queued
     
-    def __init__(self, text):
+    Only used when the TTS Manager (which has its own queue thread) is
+    not available; see AuraFloatingWidget._speak.
+    """
+    
+    def __init__(self):
         super().__init__()
-        self.text = text
+        self._queue = queue.Queue()
         
-    def run(self):
-        if not self.text:
-            return
+    def speak(self, text):
+        """Queue text to be spoken"""
+        if text:
+            self._queue.put(text)
+    
+    def on_idle(self, callback):
+        """Call callback (on this thread) once everything queued so far is spoken"""
+        self._queue.put(callback)
+    
+    def stop(self):
+        """Finish the current utterance and exit"""
+        self._queue.put(None)
         
-        # Use TTS Manager if available
-        if TTS_MANAGER_AVAILABLE and tts_speak:
-            tts_speak(self.text)
-        elif TTS_AVAILABLE:
-            # Fallback to direct pyttsx3
+    def run(self):
+        engine = None
+        while True:
+            text = self._queue.get()
+            if text is None:
+                break
+            if callable(text):
+                text()
+                continue
             try:
-                import pyttsx3
-                engine = pyttsx3.init()
-                engine.setProperty('rate', 175)
-                engine.say(self.text)
+                if engine is None:
+                    import pyttsx3
+                    engine = pyttsx3.init()
+                    engine.setProperty('rate', 175)
+                engine.say(text)
                 engine.runAndWait()
-                engine.stop()
             except Exception as e:
                 print(f"Voice error: {e}")
-
+        if engine is not None:
+            engine.stop()
 
 
 class SpeechRecognitionThread(QThread):
@@ -280,23 +678,70 @@ class SpeechRecognitionThread(QThread):
 
 
 class ProcessingThread(QThread):
-    """Background thread for AI processing - AURA v2 with intelligent routing"""
-    finished = pyqtSignal(str, str, bool)  # response, type, success
+    """Persistent background worker for AI processing - AURA v2 with intelligent routing
     
-    def __init__(self, message, context):
+    One thread serves every command: submit() queues a command and returns a
+    job id, and the result is emitted with that id when it is done. cancel()
+    is cooperative - queued commands are skipped and the running one stops at
+    its next checkpoint without emitting a result.
+    """
+    finished = pyqtSignal(int, str, str, bool)  # job id, response, type, success
+    partial = pyqtSignal(int, str)  # job id, streamed reply text (conversation only)
+    
+    def __init__(self):
         super().__init__()
-        self.message = message
-        self.context = context
+        self._queue = queue.Queue()
+        self._next_job_id = 0
+        self._cancelled_through = 0  # Jobs with id <= this are cancelled
+    
+    def submit(self, message, context):
+        """Queue a command for processing and return its job id"""
+        self._next_job_id += 1
+        self._queue.put((self._next_job_id, message, context))
+        return self._next_job_id
+    
+    def cancel(self):
+        """Cancel every command submitted so far (returns immediately)"""
+        self._cancelled_through = self._next_job_id
+    
+    def _is_cancelled(self, job_id):
+        return job_id <= self._cancelled_through
+    
+    def _emit_partial(self, job_id, text):
+        # Raising here aborts the reply stream of a cancelled command
+        if self._is_cancelled(job_id):
+            raise CommandCancelled()
+        self.partial.emit(job_id, text)
+    
+    def stop(self):
+        """Finish the current command and exit"""
+        self._queue.put(None)
         
     def run(self):
+        _load_backends()  # Off the UI thread - commands queued meanwhile just wait
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            job_id, message, context = job
+            if self._is_cancelled(job_id):
+                continue
+            result = self.process(job_id, message, context)
+            if result is not None and not self._is_cancelled(job_id):
+                self.finished.emit(job_id, *result)
+    
+    def process(self, job_id, message, context):
+        """Run one command; returns (response, type, success), or None if cancelled"""
         # ═══════════════════════════════════════════════════════════════════
         # AURA v2: Use intelligent routing (saves 85%+ LLM tokens)
         # ═══════════════════════════════════════════════════════════════════
         if AURA_V2_AVAILABLE:
             try:
                 response, success, used_gemini = aura_bridge.process(
-                    self.message, 
-                    self.context
+                    message, 
+                    context,
+                    on_token=lambda text: self._emit_partial(job_id, text),
+                    is_cancelled=lambda: self._is_cancelled(job_id)
                 )
                 
                 # Log routing stats periodically
@@ -307,36 +752,33 @@ class ProcessingThread(QThread):
                           f"Saved={stats['tokens_saved']} tokens")
                 
                 msg_type = "success" if success else "error"
-                self.finished.emit(response, msg_type, success)
-                return
+                return response, msg_type, success
                 
+            except CommandCancelled:
+                return None
             except Exception as e:
                 print(f"AURA v2 error, falling back: {e}")
                 # Fall through to legacy processing
+                if self._is_cancelled(job_id):
+                    return None
         
         # ═══════════════════════════════════════════════════════════════════
         # Legacy fallback (if AURA v2 not available)
         # ═══════════════════════════════════════════════════════════════════
         if not AURA_AVAILABLE:
-            self.finished.emit(
-                "AURA backend not available.",
-                "warning",
-                False
-            )
-            return
+            return "AURA backend not available.", "warning", False
             
         try:
-            code = ai_client.generate_code(self.message, self.context)
+            code = ai_client.generate_code(message, context)
+            
+            # Never execute generated code for a command that was cancelled meanwhile
+            if self._is_cancelled(job_id):
+                return None
             
             if not code:
-                self.finished.emit(
-                    "Couldn't understand that.",
-                    "error",
-                    False
-                )
-                return
+                return "Couldn't understand that.", "error", False
             
-            exec_context = {'context': self.context, 'print': print}
+            exec_context = {'context': context, 'print': print}
             for attr_name in dir(windows_system_utils):
                 if not attr_name.startswith('_'):
                     exec_context[attr_name] = getattr(windows_system_utils, attr_name)
@@ -344,24 +786,57 @@ class ProcessingThread(QThread):
             success, output, result = executor.execute(code, exec_context)
             
             if success:
-                self.finished.emit(output or "Done.", "success", True)
+                return output or "Done.", "success", True
             else:
+                if self._is_cancelled(job_id):
+                    return None
                 improved, msg, exec_output = improvement_engine.handle_execution_failure(
-                    self.message, code, output
+                    message, code, output
                 )
                 if improved:
-                    self.finished.emit(exec_output or msg, "success", True)
+                    return exec_output or msg, "success", True
                 else:
-                    self.finished.emit(output or "Task failed.", "error", False)
+                    return output or "Task failed.", "error", False
                     
         except Exception as e:
-            self.finished.emit(str(e), "error", False)
+            return str(e), "error", False
+
+
+# Wake word matching for hands-free mode. Single-word forms (including common
+# misrecognitions of "Aura", some Hindi/regional) are matched by token
+# membership; multi-word forms are matched on word boundaries, so short ones
+# like "or a" / "for a" do not fire inside "color and" or "for all".
+_WAKE_TOKENS = frozenset({
+    # Common English mishearings
+    "aura", "tora", "hora", "ora", "ura", "aora",
+    "dora", "laura", "aurora", "euro",
+    "aira", "era", "ara", "oreo", "aura's",
+    # Hindi/Regional mishearings
+    "hamara", "howrah", "porus", "bhanwra", "bhawra",
+    "honour", "horror", "horra",
+    # Other variations
+    "arra", "awara", "awra", "aara", "ahura",
+    "flora", "cora", "nora",
+})
+_WAKE_PHRASES = ("hey aura", "ok aura", "or a", "for a")
+# Fallback forms for _extract_command, tried in this order after the configured wake words
+_WAKE_MISRECOGNITIONS = (
+    "tora", "hora", "ora", "or a", "ura", "aora",
+    "dora", "laura", "aurora", "euro", "aira", "era", "ara",
+    "hamara", "howrah", "porus", "bhanwra", "bhawra",
+    "honour", "horror", "horra", "arra", "awara", "awra",
+    "for a", "flora", "cora", "nora",
+)
+_WORD_RE = re.compile(r"[\w']+")
 
 
 class ContinuousListeningThread(QThread):
     """
     AURA v2: Continuous listening thread with wake word detection.
     Enables true hands-free operation.
+    
+    Created once and reused: pause()/resume() gate the listen loop (the
+    microphone is released while paused), stop() ends the thread.
     """
     wake_word_detected = pyqtSignal()
     command_recognized = pyqtSignal(str)
@@ -372,9 +847,19 @@ class ContinuousListeningThread(QThread):
     def __init__(self, wake_words=None):
         super().__init__()
         self.wake_words = wake_words or ["aura", "hey aura", "ok aura"]
+        wake_lower = [w.lower() for w in self.wake_words]
+        self._wake_tokens = _WAKE_TOKENS.union(w for w in wake_lower if " " not in w)
+        wake_phrases = _WAKE_PHRASES + tuple(w for w in wake_lower if " " in w)
+        self._wake_phrase_re = re.compile(r"\b(?:" + "|".join(map(re.escape, wake_phrases)) + r")\b")
+        self._extract_forms = tuple(wake_lower) + _WAKE_MISRECOGNITIONS
         self.is_running = False
         self.awaiting_command = False
         self._stop_requested = False
+        self._paused = False
+        
+        # Interruptible back-off / pause gate (woken by pause(), resume() and stop())
+        self._mutex = QMutex()
+        self._wait = QWaitCondition()
         
     def run(self):
         import sys
@@ -398,6 +883,9 @@ class ContinuousListeningThread(QThread):
         loop_count = 0
         
         while self.is_running and not self._stop_requested:
+            if self._paused:
+                self._wait_while_paused()
+                continue
             loop_count += 1
             try:
                 with sr.Microphone() as source:
@@ -426,7 +914,10 @@ class ContinuousListeningThread(QThread):
                         text_lower = text.lower().strip()
                         print(f"[Hands-Free] Heard: '{text}'")
                         
-                        if self.awaiting_command:
+                        if self._paused:
+                            # Hands-free was switched off while this phrase was captured
+                            pass
+                        elif self.awaiting_command:
                             # We're waiting for a command after wake word
                             print(f"[Hands-Free] Command received: '{text}'")
                             self.awaiting_command = False
@@ -456,92 +947,116 @@ class ContinuousListeningThread(QThread):
                     except sr.RequestError as e:
                         print(f"[Hands-Free] API error: {e}")
                         self.error.emit(f"Recognition service error")
-                        import time
-                        time.sleep(1)  # Brief pause before retry
+                        self._pause(1000)  # Brief pause before retry
                         
             except OSError as e:
                 # Microphone access error
                 print(f"[Hands-Free] Microphone error: {e}")
                 self.error.emit(f"Microphone error")
-                import time
-                time.sleep(2)
+                self._pause(2000)
             except Exception as e:
                 if not self._stop_requested:
                     print(f"[Hands-Free] Error: {e}")
-                import time
-                time.sleep(0.5)
+                self._pause(500)
         
         print("[Hands-Free] Stopped listening")
         self.status_update.emit("Hands-free stopped")
     
     def _check_wake_word(self, text: str) -> bool:
-        """Check if text contains wake word"""
+        """Check if text contains wake word (or a common misrecognition)"""
         text_lower = text.lower()
-        for wake in self.wake_words:
-            if wake.lower() in text_lower:
-                return True
-        # Also check common misrecognitions of "Aura"
-        # Including Hindi/regional misrecognitions
-        misrecognitions = [
-            # Common English mishearings
-            "tora", "hora", "ora", "or a", "ura", "aora", 
-            "dora", "laura", "aura", "aurora", "euro",
-            "aira", "era", "ara", "oreo", "aura's",
-            # Hindi/Regional mishearings
-            "hamara", "howrah", "porus", "bhanwra", "bhawra",
-            "honour", "horror", "hora", "horra",
-            # Other variations
-            "arra", "awara", "awra", "aara", "ahura",
-            "for a", "flora", "cora", "nora"
-        ]
-        for mis in misrecognitions:
-            if mis in text_lower:
-                return True
-        return False
+        if not self._wake_tokens.isdisjoint(_WORD_RE.findall(text_lower)):
+            return True
+        return self._wake_phrase_re.search(text_lower) is not None
     
     def _extract_command(self, text: str) -> str:
         """Extract command after wake word"""
         text_lower = text.lower()
         
-        # Check primary wake words first
-        for wake in self.wake_words:
-            wake_lower = wake.lower()
-            if wake_lower in text_lower:
-                idx = text_lower.find(wake_lower)
-                cmd = text[idx + len(wake_lower):].strip()
-                cmd = cmd.lstrip(',.!? ')
-                return cmd
-        
-        # Check misrecognitions (same list as _check_wake_word)
-        misrecognitions = [
-            "tora", "hora", "ora", "or a", "ura", "aora", 
-            "dora", "laura", "aurora", "euro", "aira", "era", "ara",
-            "hamara", "howrah", "porus", "bhanwra", "bhawra",
-            "honour", "horror", "horra", "arra", "awara", "awra",
-            "for a", "flora", "cora", "nora"
-        ]
-        for mis in misrecognitions:
-            if mis in text_lower:
-                idx = text_lower.find(mis)
-                cmd = text[idx + len(mis):].strip()
-                cmd = cmd.lstrip(',.!? ')
-                return cmd
+        # Primary wake words first, then misrecognitions; one find() per form
+        for form in self._extract_forms:
+            idx = text_lower.find(form)
+            if idx != -1:
+                cmd = text[idx + len(form):].strip()
+                return cmd.lstrip(',.!? ')
         
         return text
     
+    def _pause(self, ms: int):
+        """Wait before retrying; returns immediately once paused or stopped"""
+        self._mutex.lock()
+        try:
+            if not self._stop_requested and not self._paused:
+                self._wait.wait(self._mutex, ms)
+        finally:
+            self._mutex.unlock()
+    
+    def _wait_while_paused(self):
+        """Block (without holding the microphone) until resume() or stop()"""
+        self._mutex.lock()
+        try:
+            while self._paused and not self._stop_requested:
+                self._wait.wait(self._mutex)
+        finally:
+            self._mutex.unlock()
+        if not self._stop_requested:
+            self.status_update.emit("Listening for 'Aura'...")
+    
+    def pause(self):
+        """Stop listening until resume() - returns immediately"""
+        print("[Hands-Free] Pause requested")
+        self._mutex.lock()
+        self._paused = True
+        self.awaiting_command = False
+        self._wait.wakeAll()
+        self._mutex.unlock()
+    
+    def resume(self):
+        """Resume listening after pause()"""
+        self._mutex.lock()
+        self._paused = False
+        self._wait.wakeAll()
+        self._mutex.unlock()
+    
     def stop(self):
         """Stop the continuous listening"""
         print("[Hands-Free] Stop requested")
+        self._mutex.lock()
         self._stop_requested = True
         self.is_running = False
+        self._wait.wakeAll()
+        self._mutex.unlock()
 
 
-class PulsingOrb(QWidget):
-    """Smooth pulsing glow orb - centered, minimal animation"""
+def _blank_pixmap(extent, ratio):
+    """Transparent extent x extent (logical px) pixmap at the screen's pixel ratio"""
+    pixmap = QPixmap(math.ceil(extent * ratio), math.ceil(extent * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.transparent)
+    return pixmap
+
+
+class _OrbBase(QWidget):
+    """
+    Shared renderer for the pulsing orbs (full widget and collapsed mode).
+    
+    Glow layers are rasterized once into QPixmapCache, keyed by
+    state/size/layer, a quantized color step and the device pixel ratio,
+    so both orbs share rendered glyphs and switching between full and mini
+    mode does not re-rasterize them. Subclasses only set the geometry below.
+    """
+    ORB_SIZE = 300
+    GLOW_RADIUS = 35   # Innermost glow layer radius
+    GLOW_STEP = 10     # Radius increase per glow layer
+    ORB_RADIUS = 28    # Main orb base radius
+    ORB_PULSE = 4      # Main orb pulse amplitude
+    CORE_RADIUS = 12   # Inner bright core radius
+    GLOW_LAYERS = 4
+    COLOR_STEPS = 16   # Quantization of the animated glow color
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setFixedSize(300, 300)
+        self.setFixedSize(self.ORB_SIZE, self.ORB_SIZE)
         
         # Animation state
         self.pulse_phase = 0
@@ -549,13 +1064,42 @@ class PulsingOrb(QWidget):
         self.glow_intensity = 0.6
         
         # Colors
-        self.primary_color = QColor(0, 212, 255)  # Cyan
-        self.secondary_color = QColor(123, 104, 238)  # Purple
+        self.primary_color = _CYAN
+        self.secondary_color = _PURPLE
+        
+        # Paint objects built once and reused when rasterizing cached pixmaps
+        self._center_point = self.rect().center()
+        self._cx, self._cy = self._center_point.x(), self._center_point.y()  # Fixed size
+        self._color1 = QColor(self.primary_color)
+        self._color2 = QColor(self.secondary_color)
+        
+        self._orb_gradient = QRadialGradient(QPointF(self._center_point), self.ORB_RADIUS)
+        self._orb_gradient.setColorAt(0, _WHITE_220)
+        
+        # Per-layer (pixmap offset from center, base opacity) - fixed for the orb's lifetime
+        self._glow_layers = tuple(
+            (self.GLOW_RADIUS + layer * self.GLOW_STEP + 1, 0.15 - layer * 0.03)
+            for layer in range(self.GLOW_LAYERS)
+        )
         
-        # Smooth animation timer
-        self.timer = QTimer()
+        # Only the outermost glow's square ever changes - repaint that, not the whole widget
+        extent = self._glow_layers[-1][0]
+        self._paint_rect = QRect(self._center_point.x() - extent, self._center_point.y() - extent,
+                                 2 * extent, 2 * extent)
+        
+        # Smooth animation timer - runs only while the orb is visible (see show/hideEvent)
+        self.timer = QTimer(self)
+        self.timer.setInterval(50)  # 20 FPS for smooth pulsing
         self.timer.timeout.connect(self.animate)
-        self.timer.start(50)  # 20 FPS for smooth pulsing
+        
+    def showEvent(self, event):
+        self.timer.start()
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        # Collapsed to the mini orb, hidden to tray, or still on the loading screen
+        self.timer.stop()
+        super().hideEvent(event)
         
     def set_state(self, state):
         self.state = state
@@ -577,71 +1121,134 @@ class PulsingOrb(QWidget):
             # Smooth, calm pulsing for idle
             self.glow_intensity = 0.5 + 0.3 * math.sin(self.pulse_phase)
             
-        self.update()
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
+        self.update(self._paint_rect)
+    
+    def _glow_step(self):
+        """Quantized position of the animated glow color for the current frame"""
+        if self.state == "processing":
+            hue_shift = int(self.pulse_phase * 30) % 360
+            return hue_shift * self.COLOR_STEPS // 360
+        if self.state == "listening":
+            return 0
+        # Blend between cyan and purple
+        blend = (math.sin(self.pulse_phase * 0.5) + 1) / 2
+        return round(blend * (self.COLOR_STEPS - 1))
+    
+    def _glow_color(self, state, step):
+        """Full-opacity glow color for a state and color step"""
+        if state == "processing":
+            return QColor.fromHsv(step * 360 // self.COLOR_STEPS, 180, 255)
+        if state == "listening":
+            return _LISTENING_RED
+        blend = step / (self.COLOR_STEPS - 1)
+        r = int(self.primary_color.red() * (1 - blend) + self.secondary_color.red() * blend)
+        g = int(self.primary_color.green() * (1 - blend) + self.secondary_color.green() * blend)
+        b = int(self.primary_color.blue() * (1 - blend) + self.secondary_color.blue() * blend)
+        return QColor(r, g, b)
+    
+    def _render_glow(self, state, size, layer, step, ratio):
+        """Get (or rasterize and cache) one glow layer as a pixmap"""
+        key = f"orb:{state}:{size}:{layer}:{step}:{ratio}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+        
+        radius = self.GLOW_RADIUS + layer * self.GLOW_STEP
+        extent = 2 * radius + 2
+        center = QPointF(radius + 1, radius + 1)
+        
+        gradient = QRadialGradient(center, radius)
+        gradient.setColorAt(0, self._glow_color(state, step))
+        gradient.setColorAt(1, _TRANSPARENT)
+        
+        pixmap = _blank_pixmap(extent, ratio)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(gradient)
+        painter.drawEllipse(center, radius, radius)
+        painter.end()
         
-        center = self.rect().center()
-        
-        # Outer glow layers (pulsing)
-        for i in range(4):
-            glow_radius = 35 + i * 10
-            glow_opacity = (0.15 - i * 0.03) * self.glow_intensity
-            
-            glow_gradient = QRadialGradient(center, glow_radius)
-            
-            # Color shift based on state
-            if self.state == "processing":
-                hue_shift = int(self.pulse_phase * 30) % 360
-                glow_color = QColor.fromHsv(hue_shift, 180, 255)
-            elif self.state == "listening":
-                glow_color = QColor(255, 100, 100)  # Red tint
-            else:
-                # Blend between cyan and purple
-                blend = (math.sin(self.pulse_phase * 0.5) + 1) / 2
-                r = int(self.primary_color.red() * (1 - blend) + self.secondary_color.red() * blend)
-                g = int(self.primary_color.green() * (1 - blend) + self.secondary_color.green() * blend)
-                b = int(self.primary_color.blue() * (1 - blend) + self.secondary_color.blue() * blend)
-                glow_color = QColor(r, g, b)
-            
-            glow_color.setAlphaF(glow_opacity)
-            glow_gradient.setColorAt(0, glow_color)
-            glow_gradient.setColorAt(1, QColor(0, 0, 0, 0))
-            
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(glow_gradient)
-            painter.drawEllipse(center, int(glow_radius), int(glow_radius))
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
         
-        # Main orb gradient
-        orb_size = 28 + 4 * math.sin(self.pulse_phase)
-        gradient = QRadialGradient(center, orb_size)
+    def _render_orb(self, state, size, radius, step, ratio):
+        """Get (or rasterize and cache) the main orb with its inner core as a pixmap"""
+        key = f"orb_core:{state}:{size}:{radius}:{step}:{ratio}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
         
-        if self.state == "processing":
-            hue_shift = int(self.pulse_phase * 50) % 360
-            color1 = QColor.fromHsv(hue_shift, 200, 255)
-            color2 = QColor.fromHsv((hue_shift + 60) % 360, 200, 200)
+        color1 = self._color1
+        color2 = self._color2
+        if state == "processing":
+            hue_shift = step * 360 // self.COLOR_STEPS
+            color1.setHsv(hue_shift, 200, 255)
+            color2.setHsv((hue_shift + 60) % 360, 200, 200)
         else:
-            color1 = self.primary_color
-            color2 = self.secondary_color
-            
+            color1.setRgb(self.primary_color.rgb())
+            color2.setRgb(self.secondary_color.rgb())
         color1.setAlphaF(0.9)
         color2.setAlphaF(0.7)
         
-        gradient.setColorAt(0, QColor(255, 255, 255, 220))
+        extent = 2 * radius + 2
+        center = QPointF(radius + 1, radius + 1)
+        
+        gradient = self._orb_gradient
+        gradient.setCenter(center)
+        gradient.setFocalPoint(center)
+        gradient.setRadius(radius)
         gradient.setColorAt(0.3, color1)
         gradient.setColorAt(1, color2)
         
-        painter.setBrush(gradient)
-        painter.drawEllipse(center, int(orb_size), int(orb_size))
+        inner_gradient = QRadialGradient(center, self.CORE_RADIUS)
+        inner_gradient.setColorAt(0, _WHITE_200)
+        inner_gradient.setColorAt(1, _WHITE_0)
         
-        # Inner bright core
-        inner_gradient = QRadialGradient(center, 12)
-        inner_gradient.setColorAt(0, QColor(255, 255, 255, 200))
-        inner_gradient.setColorAt(1, QColor(255, 255, 255, 0))
+        pixmap = _blank_pixmap(extent, ratio)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(gradient)
+        painter.drawEllipse(center, radius, radius)
         painter.setBrush(inner_gradient)
-        painter.drawEllipse(center, 12, 12)
+        painter.drawEllipse(center, self.CORE_RADIUS, self.CORE_RADIUS)
+        painter.end()
+        
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        
+        cx, cy = self._cx, self._cy
+        state, size, phase = self.state, self.ORB_SIZE, self.pulse_phase
+        # Rasterize at device pixels so HiDPI screens get a crisp orb
+        ratio = self.devicePixelRatioF()
+        
+        # Outer glow layers (pulsing) - cached pixmaps, layer alpha applied by the painter
+        step = self._glow_step()
+        intensity = self.glow_intensity
+        render_glow = self._render_glow
+        for layer, (offset, base_opacity) in enumerate(self._glow_layers):
+            painter.setOpacity(base_opacity * intensity)
+            painter.drawPixmap(cx - offset, cy - offset, render_glow(state, size, layer, step, ratio))
+        painter.setOpacity(1.0)
+        
+        # Main orb + inner core - cached per (state, radius, color step)
+        radius = int(self.ORB_RADIUS + self.ORB_PULSE * math.sin(phase))
+        if state == "processing":
+            step = int(phase * 50) % 360 * self.COLOR_STEPS // 360
+        else:
+            step = 0
+        offset = radius + 1
+        painter.drawPixmap(cx - offset, cy - offset, self._render_orb(state, size, radius, step, ratio))
+
+
+class PulsingOrb(_OrbBase):
+    """Smooth pulsing glow orb - centered, minimal animation"""
 
 
 class AuraLoadingScreen(QWidget):
@@ -667,22 +1274,11 @@ class AuraLoadingScreen(QWidget):
         self.letters = []
         for char in "AURA":
             label = QLabel(char)
-            label.setStyleSheet("""
-                color: #00d4ff;
-                font-family: 'Segoe UI', Arial;
-                font-size: 48px;
-                font-weight: bold;
-                letter-spacing: 4px;
-            """)
+            label.setStyleSheet(_LOADING_LETTER_QSS)
             label.setAlignment(Qt.AlignCenter)
-            
-            # Add opacity effect
-            opacity_effect = QGraphicsOpacityEffect(label)
-            opacity_effect.setOpacity(0)
-            label.setGraphicsEffect(opacity_effect)
-            
-            self.letters.append((label, opacity_effect))
+            self.letters.append(label)
             letters_layout.addWidget(label)
+        self._hide_letters()
         
         layout.addStretch()
         layout.addWidget(self.letters_container)
@@ -693,12 +1289,18 @@ class AuraLoadingScreen(QWidget):
         self.fade_timer = QTimer()
         self.fade_timer.timeout.connect(self.animate_next_letter)
         
+    def _hide_letters(self):
+        """Give every letter a fully transparent opacity effect"""
+        for label in self.letters:
+            opacity_effect = QGraphicsOpacityEffect(label)
+            opacity_effect.setOpacity(0)
+            label.setGraphicsEffect(opacity_effect)  # Replaces (and deletes) any previous one
+        
     def start_animation(self):
         """Start the sequential fade-in animation"""
         self.current_letter = 0
         # Reset all letters to invisible
-        for label, effect in self.letters:
-            effect.setOpacity(0)
+        self._hide_letters()
         
         # Start animation after a brief delay
         QTimer.singleShot(200, self.animate_next_letter)
@@ -710,10 +1312,10 @@ class AuraLoadingScreen(QWidget):
             QTimer.singleShot(500, self.animation_complete.emit)
             return
         
-        label, opacity_effect = self.letters[self.current_letter]
+        label = self.letters[self.current_letter]
         
         # Create fade-in animation
-        animation = QPropertyAnimation(opacity_effect, b"opacity")
+        animation = QPropertyAnimation(label.graphicsEffect(), b"opacity")
         animation.setDuration(300)  # 300ms per letter
         animation.setStartValue(0)
         animation.setEndValue(1)
@@ -721,109 +1323,203 @@ class AuraLoadingScreen(QWidget):
         
         # Move to next letter when this animation finishes
         self.current_letter += 1
-        animation.finished.connect(lambda: QTimer.singleShot(100, self.animate_next_letter))
+        animation.finished.connect(lambda: self._letter_faded_in(label))
         
         animation.start()
         # Keep reference to prevent garbage collection
         self._current_animation = animation
+    
+    def _letter_faded_in(self, label):
+        # Fully opaque now - drop the effect so the letter paints directly,
+        # without an offscreen pass, for the rest of the intro
+        label.setGraphicsEffect(None)
+        QTimer.singleShot(100, self.animate_next_letter)
 
 
-class MiniOrb(QWidget):
+class MiniOrb(_OrbBase):
     """Mini pulsing orb for collapsed mode - 200px"""
+    ORB_SIZE = 200
+    GLOW_RADIUS = 40
+    GLOW_STEP = 12
+    ORB_RADIUS = 35
+    ORB_PULSE = 5
+    CORE_RADIUS = 15
+
+
+# Primary screen geometry, cached until the screen setup changes
+_screen_geometry = None
+_watched_screens = []
+
+
+def _invalidate_screen_geometry(*_):
+    global _screen_geometry
+    _screen_geometry = None
+
+
+def _primary_screen_geometry():
+    """Primary screen geometry, queried from the windowing system only when stale"""
+    global _screen_geometry
+    if _screen_geometry is None:
+        app = QApplication.instance()
+        screen = app.primaryScreen()
+        if not _watched_screens:
+            app.primaryScreenChanged.connect(_invalidate_screen_geometry)
+            app.screenRemoved.connect(_invalidate_screen_geometry)
+        if screen not in _watched_screens:
+            screen.geometryChanged.connect(_invalidate_screen_geometry)
+            _watched_screens.append(screen)
+        _screen_geometry = screen.geometry()
+    return _screen_geometry
+
+
+# Tray / window icon, loaded (and rasterized by the icon engine) once per process
+_APP_ICON_PATH = Path(__file__).resolve().parent.parent / "Installer" / "jarvis_icon.ico"
+_app_icon = None
+
+
+def _get_app_icon():
+    """The AURA icon, falling back to a standard style icon if the .ico is missing"""
+    global _app_icon
+    if _app_icon is None:
+        icon = QIcon(str(_APP_ICON_PATH)) if _APP_ICON_PATH.exists() else QIcon()
+        if icon.isNull():
+            icon = QApplication.style().standardIcon(QStyle.SP_ComputerIcon)
+        _app_icon = icon
+    return _app_icon
+
+
+class _HaloMixin:
+    """Soft glow around a frameless window's content frame
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setFixedSize(200, 200)
-        
-        # Animation state
-        self.pulse_phase = 0
-        self.state = "idle"
-        self.glow_intensity = 0.6
-        
-        # Colors
-        self.primary_color = QColor(0, 212, 255)
-        self.secondary_color = QColor(123, 104, 238)
-        
-        # Animation timer
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(50)
-        
-    def set_state(self, state):
-        self.state = state
-        
-    def animate(self):
-        self.pulse_phase += 0.08
-        
-        if self.state == "processing":
-            self.glow_intensity = 0.5 + 0.4 * math.sin(self.pulse_phase * 3)
-        else:
-            self.glow_intensity = 0.5 + 0.3 * math.sin(self.pulse_phase)
-            
-        self.update()
+    Painted from a small cached 9-slice pixmap instead of a
+    QGraphicsDropShadowEffect, which re-blurs the whole widget subtree on
+    every repaint. The window's layout margin should equal HALO_MARGIN.
+    """
+    HALO_MARGIN = 10
+    HALO_RADIUS = 15   # Corner radius of the content frame
+    HALO_ALPHA = 60
+    
+    def _halo_pixmap(self):
+        """Get (or rasterize and cache) the 9-slice glow for this window class"""
+        margin, radius, peak = self.HALO_MARGIN, self.HALO_RADIUS, self.HALO_ALPHA
+        ratio = self.devicePixelRatioF()
+        key = f"halo:{margin}:{radius}:{peak}:{ratio}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+        
+        # Corners plus a 1px stretchable middle row/column
+        size = 2 * (margin + radius) + 1
+        pixmap = _blank_pixmap(size, ratio)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(Qt.NoBrush)
+        
+        # Concentric rings, fading out towards the window edge
+        for i in range(margin):
+            alpha = int(peak * ((margin - i) / margin) ** 2)
+            painter.setPen(QPen(QColor(0, 212, 255, alpha), 1))
+            inset = margin - i
+            ring_radius = radius + i
+            painter.drawRoundedRect(
+                inset, inset, size - 2 * inset - 1, size - 2 * inset - 1,
+                ring_radius, ring_radius
+            )
+        painter.end()
         
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+    
     def paintEvent(self, event):
+        edge = self.HALO_MARGIN + self.HALO_RADIUS
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        center = self.rect().center()
-        
-        # Outer glow
-        for i in range(4):
-            glow_radius = 40 + i * 12
-            glow_opacity = (0.15 - i * 0.03) * self.glow_intensity
-            
-            glow_gradient = QRadialGradient(center, glow_radius)
-            
-            if self.state == "processing":
-                hue_shift = int(self.pulse_phase * 30) % 360
-                glow_color = QColor.fromHsv(hue_shift, 180, 255)
-            else:
-                blend = (math.sin(self.pulse_phase * 0.5) + 1) / 2
-                r = int(self.primary_color.red() * (1 - blend) + self.secondary_color.red() * blend)
-                g = int(self.primary_color.green() * (1 - blend) + self.secondary_color.green() * blend)
-                b = int(self.primary_color.blue() * (1 - blend) + self.secondary_color.blue() * blend)
-                glow_color = QColor(r, g, b)
-            
-            glow_color.setAlphaF(glow_opacity)
-            glow_gradient.setColorAt(0, glow_color)
-            glow_gradient.setColorAt(1, QColor(0, 0, 0, 0))
-            
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(glow_gradient)
-            painter.drawEllipse(center, int(glow_radius), int(glow_radius))
-        
-        # Main orb
-        orb_size = 35 + 5 * math.sin(self.pulse_phase)
-        gradient = QRadialGradient(center, orb_size)
-        
-        if self.state == "processing":
-            hue_shift = int(self.pulse_phase * 50) % 360
-            color1 = QColor.fromHsv(hue_shift, 200, 255)
-            color2 = QColor.fromHsv((hue_shift + 60) % 360, 200, 200)
+        qDrawBorderPixmap(painter, self.rect(), QMargins(edge, edge, edge, edge), self._halo_pixmap())
+        painter.end()
+
+
+class _ThrottledDragMixin:
+    """
+    Coalesces window drags to at most one move per frame (~60 Hz).
+    
+    mouseMoveEvent fires for every pixel of motion; each move() is a full
+    window reposition + compositor update. Moves arriving faster than the
+    frame interval are held and the latest one is applied by a timer.
+    """
+    DRAG_INTERVAL_MS = 16
+    
+    def _init_drag_throttle(self):
+        self._last_move_ts = 0.0
+        self._pending_pos = None
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.timeout.connect(self._flush_drag)
+    
+    def _throttled_move(self, pos):
+        elapsed_ms = (time.monotonic() - self._last_move_ts) * 1000
+        if elapsed_ms >= self.DRAG_INTERVAL_MS:
+            self._pending_pos = pos
+            self._flush_drag()
         else:
-            color1 = self.primary_color
-            color2 = self.secondary_color
-            
-        color1.setAlphaF(0.9)
-        color2.setAlphaF(0.7)
-        
-        gradient.setColorAt(0, QColor(255, 255, 255, 220))
-        gradient.setColorAt(0.3, color1)
-        gradient.setColorAt(1, color2)
-        
-        painter.setBrush(gradient)
-        painter.drawEllipse(center, int(orb_size), int(orb_size))
-        
-        # Inner core
-        inner_gradient = QRadialGradient(center, 15)
-        inner_gradient.setColorAt(0, QColor(255, 255, 255, 200))
-        inner_gradient.setColorAt(1, QColor(255, 255, 255, 0))
-        painter.setBrush(inner_gradient)
-        painter.drawEllipse(center, 15, 15)
+            self._pending_pos = pos
+            if not self._drag_timer.isActive():
+                self._drag_timer.start(int(self.DRAG_INTERVAL_MS - elapsed_ms))
+    
+    def _flush_drag(self):
+        self._drag_timer.stop()
+        if self._pending_pos is not None:
+            self._last_move_ts = time.monotonic()
+            self.move(self._pending_pos)
+            self._pending_pos = None
 
 
-class MiniOrbWidget(QWidget):
+class _CachedFrame(QFrame):
+    """
+    QFrame whose stylesheet background and border are rasterized once per size.
+    
+    The orb animates on top of the main container, and every orb frame
+    makes Qt repaint the container beneath it. With a gradient + rounded
+    border in the stylesheet, that means re-running the stylesheet painter
+    20x/sec. Here the style paints into a pixmap once and frames are blits.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._background = None
+        # We paint the styled background ourselves (from the cache)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+    
+    def _render_background(self):
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        option = QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
+        self.drawFrame(painter)
+        painter.end()
+        return pixmap
+    
+    def paintEvent(self, event):
+        if self._background is None:
+            self._background = self._render_background()
+        # The painter is clipped to the damaged region, so only that part is copied
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background)
+        painter.end()
+    
+    def resizeEvent(self, event):
+        self._background = None
+        super().resizeEvent(event)
+    
+    def changeEvent(self, event):
+        if event.type() in (QEvent.StyleChange, QEvent.PaletteChange):
+            self._background = None
+        super().changeEvent(event)
+
+
+class MiniOrbWidget(_ThrottledDragMixin, QWidget):
     """Mini orb widget - collapsed mode at top-right corner"""
     expand_requested = pyqtSignal()
     
@@ -842,6 +1538,10 @@ class MiniOrbWidget(QWidget):
         self.setFixedSize(220, 220)
         self.setCursor(QCursor(Qt.PointingHandCursor))
         
+        # Clicks within 80px of center expand (circle tested on the Qt side)
+        center = self.rect().center()
+        self._orb_hit_region = QRegion(center.x() - 80, center.y() - 80, 160, 160, QRegion.Ellipse)
+        
         # Layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -856,10 +1556,11 @@ class MiniOrbWidget(QWidget):
         # Enable dragging
         self.dragging = False
         self.drag_position = QPoint()
+        self._init_drag_throttle()
         
     def position_window(self):
         """Position at top-right corner with 20px margin"""
-        screen = QApplication.primaryScreen().geometry()
+        screen = _primary_screen_geometry()
         x = screen.width() - self.width() - 20
         y = 20
         self.move(x, y)
@@ -870,33 +1571,56 @@ class MiniOrbWidget(QWidget):
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             # Check if click is on the orb area (center)
-            center = self.rect().center()
-            click_pos = event.pos()
-            distance = ((click_pos.x() - center.x())**2 + (click_pos.y() - center.y())**2)**0.5
-            
-            if distance < 80:  # Click on orb
+            if self._orb_hit_region.contains(event.pos()):  # Click on orb
                 self.expand_requested.emit()
             else:
                 # Start dragging
                 self.dragging = True
-                self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
+                self.drag_position = event.globalPos() - self.pos()
             event.accept()
             
     def mouseMoveEvent(self, event):
         if self.dragging:
-            self.move(event.globalPos() - self.drag_position)
+            self._throttled_move(event.globalPos() - self.drag_position)
             event.accept()
             
     def mouseReleaseEvent(self, event):
         self.dragging = False
+        self._flush_drag()
+
+
+# Status kinds understood by AuraFloatingWidget.set_status (see _CONTAINER_QSS)
+_STATUS_TYPES = frozenset({"normal", "success", "error", "warning", "processing"})
+
+# Commands handled by the widget itself (matched against the casefolded command)
+_STOP_CMDS = frozenset({"stop", "cancel", "shut up", "stop talking", "be quiet", "quiet"})
+_EXIT_CMDS = frozenset({"exit", "quit", "goodbye", "bye"})
+_HANDS_FREE_EXIT_CMDS = _EXIT_CMDS | {"stop listening"}
+_STATUS_CMDS = frozenset({"status", "how are you"})
+
+# Gemini connection warm-up while the user types/speaks; kept under the HTTP
+# client's keep-alive window (5 s) so the warmed connection is still pooled
+_PREWARM_INTERVAL_S = 4.0
 
+# Streamed replies are spoken a sentence at a time (same split as speak_chunked)
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+')
 
-class SettingsDialog(QWidget):
+# API keys the settings dialog reports as current (first one set wins)
+_KNOWN_API_KEYS = ('GEMINI_API_KEY', 'OPENROUTER_API_KEY')
+
+
+class SettingsDialog(_ThrottledDragMixin, _HaloMixin, QWidget):
     """Settings dialog for API key configuration"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_widget = parent
+        
+        # Use user home directory (~/.aura/.env) - always writable
+        self._env_path = Path.home() / ".aura" / ".env"
+        self._env_path.parent.mkdir(parents=True, exist_ok=True)
+        self._env_lines = None  # .env file lines, read on first write then kept in sync
+        
         self.init_ui()
         
     def init_ui(self):
@@ -911,22 +1635,14 @@ class SettingsDialog(QWidget):
         
         # Main layout
         layout = QVBoxLayout(self)
-        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setContentsMargins(
+            self.HALO_MARGIN, self.HALO_MARGIN, self.HALO_MARGIN, self.HALO_MARGIN
+        )
         
         # Container
         container = QFrame()
         container.setObjectName("settings_container")
-        container.setStyleSheet("""
-            #settings_container {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(15, 15, 35, 250),
-                    stop:1 rgba(30, 30, 60, 250)
-                );
-                border: 1px solid rgba(0, 212, 255, 0.4);
-                border-radius: 15px;
-            }
-        """)
+        container.setStyleSheet(_SETTINGS_CONTAINER_QSS)
         
         container_layout = QVBoxLayout(container)
         container_layout.setContentsMargins(20, 15, 20, 20)
@@ -936,40 +1652,21 @@ class SettingsDialog(QWidget):
         header = QHBoxLayout()
         
         title = QLabel("⚙️ Settings")
-        title.setStyleSheet("""
-            color: #00d4ff;
-            font-size: 18px;
-            font-weight: bold;
-            letter-spacing: 2px;
-        """)
+        title.setObjectName("settings_title")
         header.addWidget(title)
         header.addStretch()
         
         close_btn = QPushButton("×")
         close_btn.setFixedSize(24, 24)
         close_btn.clicked.connect(self.close)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                border: none;
-                border-radius: 12px;
-                color: white;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 71, 87, 0.5);
-            }
-        """)
+        close_btn.setStyleSheet(_SETTINGS_CLOSE_QSS)
         header.addWidget(close_btn)
         
         container_layout.addLayout(header)
         
         # User Name input
         name_label = QLabel("Your Name")
-        name_label.setStyleSheet("""
-            color: rgba(255, 255, 255, 0.7);
-            font-size: 12px;
-        """)
+        name_label.setStyleSheet(_SETTINGS_LABEL_QSS)
         container_layout.addWidget(name_label)
         
         name_layout = QHBoxLayout()
@@ -978,19 +1675,7 @@ class SettingsDialog(QWidget):
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("Enter your name...")
         self.name_input.returnPressed.connect(self.save_user_name)
-        self.name_input.setStyleSheet("""
-            QLineEdit {
-                background: rgba(0, 0, 0, 0.4);
-                border: 1px solid rgba(0, 212, 255, 0.3);
-                border-radius: 10px;
-                padding: 10px 15px;
-                color: white;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border-color: rgba(0, 212, 255, 0.7);
-            }
-        """)
+        self.name_input.setStyleSheet(_SETTINGS_INPUT_QSS)
         
         # Load current name
         try:
@@ -1005,35 +1690,14 @@ class SettingsDialog(QWidget):
         save_name_btn = QPushButton("Save")
         save_name_btn.setFixedSize(70, 40)
         save_name_btn.clicked.connect(self.save_user_name)
-        save_name_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #00d4ff, stop:1 #7b68ee
-                );
-                border: none;
-                border-radius: 10px;
-                color: white;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #00e5ff, stop:1 #9370db
-                );
-            }
-        """)
+        save_name_btn.setStyleSheet(_BTN_SAVE_QSS)
         name_layout.addWidget(save_name_btn)
         
         container_layout.addLayout(name_layout)
         
         # API Key input
         api_label = QLabel("Gemini API Key")
-        api_label.setStyleSheet("""
-            color: rgba(255, 255, 255, 0.7);
-            font-size: 12px;
-        """)
+        api_label.setStyleSheet(_SETTINGS_LABEL_QSS)
         container_layout.addWidget(api_label)
         
         input_layout = QHBoxLayout()
@@ -1043,53 +1707,20 @@ class SettingsDialog(QWidget):
         self.api_input.setPlaceholderText("Enter your API key...")
         self.api_input.setEchoMode(QLineEdit.Password)
         self.api_input.returnPressed.connect(self.save_api_key)
-        self.api_input.setStyleSheet("""
-            QLineEdit {
-                background: rgba(0, 0, 0, 0.4);
-                border: 1px solid rgba(0, 212, 255, 0.3);
-                border-radius: 10px;
-                padding: 10px 15px;
-                color: white;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border-color: rgba(0, 212, 255, 0.7);
-            }
-        """)
+        self.api_input.setStyleSheet(_SETTINGS_INPUT_QSS)
         input_layout.addWidget(self.api_input)
         
         save_btn = QPushButton("Save")
         save_btn.setFixedSize(70, 40)
         save_btn.clicked.connect(self.save_api_key)
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #00d4ff, stop:1 #7b68ee
-                );
-                border: none;
-                border-radius: 10px;
-                color: white;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #00e5ff, stop:1 #9370db
-                );
-            }
-        """)
+        save_btn.setStyleSheet(_BTN_SAVE_QSS)
         input_layout.addWidget(save_btn)
         
         container_layout.addLayout(input_layout)
         
         # Voice selection
         voice_label = QLabel("Voice")
-        voice_label.setStyleSheet("""
-            color: rgba(255, 255, 255, 0.7);
-            font-size: 12px;
-        """)
+        voice_label.setStyleSheet(_SETTINGS_LABEL_QSS)
         container_layout.addWidget(voice_label)
         
         voice_layout = QHBoxLayout()
@@ -1098,73 +1729,79 @@ class SettingsDialog(QWidget):
         # Get current voice preference
         current_voice = os.environ.get('AURA_VOICE', 'male').lower()
         
-        self.male_btn = QPushButton("🔊 Male")
-        self.male_btn.setFixedHeight(36)
-        self.male_btn.clicked.connect(lambda: self.set_voice('male'))
-        self.male_btn.setCheckable(True)
-        self.male_btn.setChecked(current_voice == 'male')
+        self._voice_buttons = {}  # voice type -> button
+        self.male_btn = self._make_voice_button("🔊 Male", 'male', current_voice == 'male')
         voice_layout.addWidget(self.male_btn)
-        
-        self.female_btn = QPushButton("🔊 Female")
-        self.female_btn.setFixedHeight(36)
-        self.female_btn.clicked.connect(lambda: self.set_voice('female'))
-        self.female_btn.setCheckable(True)
-        self.female_btn.setChecked(current_voice == 'female')
+        self.female_btn = self._make_voice_button("🔊 Female", 'female', current_voice == 'female')
         voice_layout.addWidget(self.female_btn)
         
+        self._voice_checked_cached = None
         self.update_voice_button_styles()
         
         container_layout.addLayout(voice_layout)
         
         # Status label
         self.status_label = QLabel("")
+        self.status_label.setObjectName("settings_status")
+        self.status_label.setTextFormat(Qt.PlainText)
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("color: rgba(255, 255, 255, 0.6); font-size: 11px;")
         container_layout.addWidget(self.status_label)
         
-        layout.addWidget(container)
+        # One reusable timer for the close-after-save delay (repeated saves restart it)
+        self._close_timer = QTimer(self)
+        self._close_timer.setSingleShot(True)
+        self._close_timer.timeout.connect(self.close)
         
-        # Add shadow
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(30)
-        shadow.setColor(QColor(0, 212, 255, 60))
-        shadow.setOffset(0, 0)
-        container.setGraphicsEffect(shadow)
+        layout.addWidget(container)
         
         # Enable dragging
         self.dragging = False
         self.drag_position = QPoint()
+        self._init_drag_throttle()
         
         # Load current key if exists
         self.load_current_key()
         
+    def _rewrite_env(self, updates):
+        """Update or add keys in .env (file read at most once, one write per call)"""
+        if self._env_lines is None:
+            try:
+                self._env_lines = self._env_path.read_text().splitlines()
+            except FileNotFoundError:
+                self._env_lines = []
+        lines = list(self._env_lines)
+        
+        pending = dict(updates)
+        for i, line in enumerate(lines):
+            key, sep, _ = line.partition('=')
+            if sep and key in pending:
+                lines[i] = f'{key}={pending.pop(key)}'
+                if not pending:
+                    break
+        lines.extend(f'{key}={value}' for key, value in pending.items())
+        
+        self._env_path.write_text('\n'.join(lines) + '\n')
+        self._env_lines = lines
+    
     def load_current_key(self):
-        """Load current API key from .env file in user home directory"""
-        from pathlib import Path
-        
-        # Use user home directory (~/.aura/.env)
-        env_path = Path.home() / ".aura" / ".env"
+        """Show the current API key (masked)
         
-        if env_path.exists():
-            try:
-                with open(env_path, 'r') as f:
-                    for line in f:
-                        if line.startswith('GEMINI_API_KEY=') or line.startswith('OPENROUTER_API_KEY='):
-                            key = line.split('=', 1)[1].strip()
-                            if key and not key.startswith('#'):
-                                # Show masked key
-                                self.api_input.setPlaceholderText(f"Current: {key[:8]}...{key[-4:]}")
-                                break
-            except:
-                pass
+        ~/.aura/.env is loaded into os.environ once at startup and every save
+        writes through to os.environ, so the environment is authoritative here.
+        """
+        for name in _KNOWN_API_KEYS:
+            key = os.environ.get(name)
+            if key and not key.startswith('#'):
+                # Show masked key
+                self.api_input.setPlaceholderText(f"Current: {key[:8]}...{key[-4:]}")
+                break
     
     def save_user_name(self):
         """Save user name to config file"""
         name = self.name_input.text().strip()
         
         if not name:
-            self.status_label.setStyleSheet("color: #ff6b6b; font-size: 11px;")
-            self.status_label.setText("Please enter your name")
+            self._show_status("Please enter your name", "err")
             return
         
         try:
@@ -1175,169 +1812,127 @@ class SettingsDialog(QWidget):
             if self.parent_widget and hasattr(self.parent_widget, 'personality'):
                 self.parent_widget.personality.user_name = name
             
-            self.status_label.setStyleSheet("color: #00ff88; font-size: 11px;")
-            self.status_label.setText(f"Name saved! Hello, {name}!")
+            self._show_status(f"Name saved! Hello, {name}!", "ok")
             
         except Exception as e:
-            self.status_label.setStyleSheet("color: #ff6b6b; font-size: 11px;")
-            self.status_label.setText(f"Error: {str(e)[:30]}")
+            self._show_status(f"Error: {str(e)[:30]}", "err")
     
     def save_api_key(self):
         """Save API key to .env file"""
         api_key = self.api_input.text().strip()
         
         if not api_key:
-            self.status_label.setStyleSheet("color: #ff6b6b; font-size: 11px;")
-            self.status_label.setText("Please enter an API key")
+            self._show_status("Please enter an API key", "err")
             return
         
         if not api_key.startswith('AIza'):
-            self.status_label.setStyleSheet("color: #ffd700; font-size: 11px;")
-            self.status_label.setText("Warning: Key should start with 'AIza'")
-        
-        from pathlib import Path
-        
-        # Use user home directory - always writable
-        config_dir = Path.home() / ".aura"
-        config_dir.mkdir(exist_ok=True)
-        env_path = config_dir / ".env"
+            self._show_status("Warning: Key should start with 'AIza'", "warn")
         
         try:
-            # Read existing content
-            lines = []
-            key_found = False
-            
-            if os.path.exists(env_path):
-                with open(env_path, 'r') as f:
-                    lines = f.readlines()
-                
-                # Update or add GEMINI_API_KEY
-                for i, line in enumerate(lines):
-                    if line.startswith('GEMINI_API_KEY='):
-                        lines[i] = f'GEMINI_API_KEY={api_key}\n'
-                        key_found = True
-                        break
-            
-            if not key_found:
-                lines.append(f'\nGEMINI_API_KEY={api_key}\n')
-            
-            # Write back
-            with open(env_path, 'w') as f:
-                f.writelines(lines)
+            self._rewrite_env({'GEMINI_API_KEY': api_key})
             
             # Update environment variable
             os.environ['GEMINI_API_KEY'] = api_key
             
-            self.status_label.setStyleSheet("color: #00ff88; font-size: 11px;")
-            self.status_label.setText("✓ API key saved successfully!")
+            self._show_status("✓ API key saved successfully!", "ok")
             
             # Close after delay
-            QTimer.singleShot(1500, self.close)
+            self._close_timer.start(1500)
             
         except Exception as e:
-            self.status_label.setStyleSheet("color: #ff6b6b; font-size: 11px;")
-            self.status_label.setText(f"Error: {str(e)[:30]}")
+            self._show_status(f"Error: {str(e)[:30]}", "err")
     
     def set_voice(self, voice_type):
         """Set voice preference and save to .env"""
-        self.male_btn.setChecked(voice_type == 'male')
-        self.female_btn.setChecked(voice_type == 'female')
+        for btn_voice, btn in self._voice_buttons.items():
+            blocker = QSignalBlocker(btn)  # No toggled() churn while syncing the group
+            btn.setChecked(btn_voice == voice_type)
+            blocker.unblock()
         self.update_voice_button_styles()
         
         # Save to .env
-        from pathlib import Path
-        
-        # Use user home directory
-        config_dir = Path.home() / ".aura"
-        config_dir.mkdir(exist_ok=True)
-        env_path = config_dir / ".env"
-        
         try:
-            lines = []
-            voice_found = False
-            
-            if os.path.exists(env_path):
-                with open(env_path, 'r') as f:
-                    lines = f.readlines()
-                
-                for i, line in enumerate(lines):
-                    if line.startswith('AURA_VOICE='):
-                        lines[i] = f'AURA_VOICE={voice_type}\n'
-                        voice_found = True
-                        break
-            
-            if not voice_found:
-                lines.append(f'\nAURA_VOICE={voice_type}\n')
-            
-            with open(env_path, 'w') as f:
-                f.writelines(lines)
+            self._rewrite_env({'AURA_VOICE': voice_type})
             
             # Update environment variable
             os.environ['AURA_VOICE'] = voice_type
             
-            self.status_label.setStyleSheet("color: #00ff88; font-size: 11px;")
-            self.status_label.setText(f"✓ Voice set to {voice_type.title()}")
+            self._show_status(f"✓ Voice set to {voice_type.title()}", "ok")
             
         except Exception as e:
-            self.status_label.setStyleSheet("color: #ff6b6b; font-size: 11px;")
-            self.status_label.setText(f"Error: {str(e)[:30]}")
+            self._show_status(f"Error: {str(e)[:30]}", "err")
+    
+    def _make_voice_button(self, label, voice_type, is_current):
+        """Create a checkable voice choice button wired to set_voice"""
+        btn = QPushButton(label)
+        btn.setFixedHeight(36)
+        btn.clicked.connect(lambda: self.set_voice(voice_type))
+        btn.setCheckable(True)
+        btn.setChecked(is_current)
+        self._voice_buttons[voice_type] = btn
+        return btn
+    
+    def _show_status(self, text, status=""):
+        """Show a status message; status is "ok", "warn", "err" or "" (neutral)"""
+        if self.status_label.property("status") != status:
+            self.status_label.setProperty("status", status)
+            style = self.status_label.style()
+            style.unpolish(self.status_label)
+            style.polish(self.status_label)
+        self.status_label.setText(text)
     
     def update_voice_button_styles(self):
-        """Update button styles based on selection"""
-        active_style = """
-            QPushButton {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #00d4ff, stop:1 #7b68ee
-                );
-                border: none;
-                border-radius: 8px;
-                color: white;
-                font-size: 12px;
-                font-weight: bold;
-            }
-        """
-        inactive_style = """
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(0, 212, 255, 0.3);
-                border-radius: 8px;
-                color: rgba(255, 255, 255, 0.7);
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background: rgba(0, 212, 255, 0.2);
-            }
-        """
-        
-        self.male_btn.setStyleSheet(active_style if self.male_btn.isChecked() else inactive_style)
-        self.female_btn.setStyleSheet(active_style if self.female_btn.isChecked() else inactive_style)
+        """Update button styles based on selection (only when it changed)"""
+        buttons = tuple(self._voice_buttons.values())
+        checked = tuple(btn.isChecked() for btn in buttons)
+        if checked == self._voice_checked_cached:
+            return
+        self._voice_checked_cached = checked
+        
+        # Rules live in the container sheet; only the selector match re-runs
+        for btn, is_checked in zip(buttons, checked):
+            btn.setProperty("voice", "active" if is_checked else "inactive")
+            style = btn.style()
+            style.unpolish(btn)
+            style.polish(btn)
     
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.dragging = True
-            self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
+            self.drag_position = event.globalPos() - self.pos()
             event.accept()
             
     def mouseMoveEvent(self, event):
         if self.dragging:
-            self.move(event.globalPos() - self.drag_position)
+            self._throttled_move(event.globalPos() - self.drag_position)
             event.accept()
             
     def mouseReleaseEvent(self, event):
         self.dragging = False
+        self._flush_drag()
     
     def showEvent(self, event):
-        """Center on screen when shown"""
-        screen = QApplication.primaryScreen().geometry()
+        """Reset transient fields and center on screen when shown"""
+        self._close_timer.stop()
+        self.api_input.clear()
+        self._show_status("")
+        self.load_current_key()
+        
+        screen = _primary_screen_geometry()
         x = (screen.width() - self.width()) // 2
         y = (screen.height() - self.height()) // 2
         self.move(x, y)
         super().showEvent(event)
 
-class AuraFloatingWidget(QWidget):
+class AuraFloatingWidget(_ThrottledDragMixin, _HaloMixin, QWidget):
     """Main floating widget window - Minimal JARVIS-style interface"""
     
+    HALO_RADIUS = 20
+    HALO_ALPHA = 80
+    QUIT_SPEECH_TIMEOUT_MS = 5000  # Quit anyway if the TTS engine never reports back
+    
+    speech_idle = pyqtSignal()  # Emitted from a TTS thread once queued speech has finished
+    
     def __init__(self):
         super().__init__()
         
@@ -1351,7 +1946,10 @@ class AuraFloatingWidget(QWidget):
         }
         
         # Message queue and processing
-        self.processing_thread = None
+        self.processing_thread = None  # Persistent worker (see _ensure_processing_thread)
+        self._processing_handlers = {}  # job id -> completion slot
+        self._unspoken_stream = {}  # job id -> streamed reply text not yet spoken
+        self._last_prewarm = 0.0  # time.monotonic() of the last Gemini warm-up
         self.voice_thread = None
         self.speech_thread = None
         self.is_listening = False
@@ -1362,18 +1960,28 @@ class AuraFloatingWidget(QWidget):
         self.hands_free_mode = False
         self.continuous_listening_thread = None
         
-        # Mini orb widget for collapsed mode
+        # Mini orb widget for collapsed mode / settings dialog (created on first use)
         self.mini_orb_widget = None
+        self.settings_dialog = None
+        self._tray_hint_shown = False  # "Double-click to bring me back" balloon, once per run
         
-        # Last response text (for UI/history)
+        # Last command/response text (for UI/history)
+        self.last_command = ""
         self.last_response = ""
         
+        # Delayed status reset - one timer, rescheduled instead of stacking singleShots
+        self._status_reset_timer = QTimer(self)
+        self._status_reset_timer.setSingleShot(True)
+        self._status_reset_timer.timeout.connect(self._reset_status)
+        self._pending_status = None  # (text, status_type, hands_free_only)
+        
         # Setup UI
         self.init_ui()
         self.setup_tray_icon()
         
-        # Start with loading animation
+        # Start with loading animation; the backends load meanwhile on the worker
         self.show_loading_animation()
+        self._ensure_processing_thread()
         
     def init_ui(self):
         # Window properties - frameless, transparent, always on top
@@ -1387,34 +1995,24 @@ class AuraFloatingWidget(QWidget):
         
         # Main layout
         self.main_layout = QVBoxLayout(self)
-        self.main_layout.setContentsMargins(10, 10, 10, 10)
+        self.main_layout.setContentsMargins(
+            self.HALO_MARGIN, self.HALO_MARGIN, self.HALO_MARGIN, self.HALO_MARGIN
+        )
         self.main_layout.setSpacing(0)
         
-        # Stacked widget for loading/main views
-        self.stacked_widget = QStackedWidget()
-        
-        # Loading screen
+        # Loading screen - shown first, then discarded for the main container
         self.loading_screen = AuraLoadingScreen()
         self.loading_screen.animation_complete.connect(self.show_main_widget)
         
         # Main container
-        self.main_container = QFrame()
+        self.main_container = _CachedFrame()
         self.main_container.setObjectName("container")
-        self.main_container.setStyleSheet("""
-            #container {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(10, 10, 26, 240),
-                    stop:1 rgba(25, 25, 50, 240)
-                );
-                border: 1px solid rgba(0, 212, 255, 0.3);
-                border-radius: 20px;
-            }
-        """)
+        self.main_container.setStyleSheet(_CONTAINER_QSS)
         
         container_layout = QVBoxLayout(self.main_container)
         container_layout.setContentsMargins(20, 15, 20, 20)
         container_layout.setSpacing(15)
+        self._container_layout = container_layout
         
         # Header with control buttons only
         header = QHBoxLayout()
@@ -1424,18 +2022,7 @@ class AuraFloatingWidget(QWidget):
         self.settings_btn.setFixedSize(28, 28)
         self.settings_btn.clicked.connect(self.open_settings)
         self.settings_btn.setToolTip("Settings")
-        self.settings_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                border: none;
-                border-radius: 14px;
-                color: white;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: rgba(0, 212, 255, 0.3);
-            }
-        """)
+        self.settings_btn.setObjectName("settings_btn")
         header.addWidget(self.settings_btn)
         
         # Collapse button (triangle)
@@ -1443,18 +2030,7 @@ class AuraFloatingWidget(QWidget):
         self.collapse_btn.setFixedSize(28, 28)
         self.collapse_btn.clicked.connect(self.collapse_to_orb)
         self.collapse_btn.setToolTip("Collapse to mini orb")
-        self.collapse_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                border: none;
-                border-radius: 14px;
-                color: white;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background: rgba(0, 212, 255, 0.3);
-            }
-        """)
+        self.collapse_btn.setObjectName("collapse_btn")
         header.addWidget(self.collapse_btn)
         
         header.addStretch()
@@ -1463,37 +2039,13 @@ class AuraFloatingWidget(QWidget):
         self.minimize_btn = QPushButton("−")
         self.minimize_btn.setFixedSize(28, 28)
         self.minimize_btn.clicked.connect(self.toggle_minimize)
-        self.minimize_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                border: none;
-                border-radius: 14px;
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: rgba(0, 212, 255, 0.3);
-            }
-        """)
+        self.minimize_btn.setObjectName("minimize_btn")
         header.addWidget(self.minimize_btn)
         
         self.close_btn = QPushButton("×")
         self.close_btn.setFixedSize(28, 28)
         self.close_btn.clicked.connect(self.hide_to_tray)
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                border: none;
-                border-radius: 14px;
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: rgba(255, 71, 87, 0.5);
-            }
-        """)
+        self.close_btn.setStyleSheet(_BTN_CLOSE_QSS)
         header.addWidget(self.close_btn)
         
         container_layout.addLayout(header)
@@ -1501,13 +2053,7 @@ class AuraFloatingWidget(QWidget):
         # AURA Title (centered)
         self.title = QLabel("AURA")
         self.title.setAlignment(Qt.AlignCenter)
-        self.title.setStyleSheet("""
-            color: #00d4ff;
-            font-family: 'Segoe UI', Arial;
-            font-size: 40px;
-            font-weight: bold;
-            letter-spacing: 11px;
-        """)
+        self.title.setObjectName("title")
         container_layout.addWidget(self.title)
         
         # Pulsing Orb (centered)
@@ -1521,138 +2067,44 @@ class AuraFloatingWidget(QWidget):
         # Status label (minimal, below orb)
         self.status_label = QLabel("Ready")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("""
-            color: rgba(255, 255, 255, 0.5);
-            font-size: 11px;
-            letter-spacing: 2px;
-        """)
+        self.status_label.setObjectName("status_label")
+        # Status echoes speech/LLM text - never sniff it for rich text
+        self.status_label.setTextFormat(Qt.PlainText)
         container_layout.addWidget(self.status_label)
         
         # Response display area (collapsible)
         self.response_area_visible = False
-        self.response_display = QTextEdit()
-        self.response_display.setReadOnly(True)
-        self.response_display.setMaximumHeight(200)  # Max height when expanded
-        self.response_display.setMinimumHeight(0)
-        self.response_display.hide()  # Hidden by default (minimal mode)
-        self.response_display.setStyleSheet("""
-            QTextEdit {
-                background: rgba(0, 0, 0, 0.3);
-                border: 1px solid rgba(0, 212, 255, 0.2);
-                border-radius: 10px;
-                padding: 10px;
-                color: rgba(255, 255, 255, 0.9);
-                font-size: 12px;
-                font-family: 'Segoe UI', Arial;
-                selection-background-color: rgba(0, 212, 255, 0.3);
-            }
-            QTextEdit QScrollBar:vertical {
-                background: rgba(0, 0, 0, 0.3);
-                width: 8px;
-                border-radius: 4px;
-            }
-            QTextEdit QScrollBar::handle:vertical {
-                background: rgba(0, 212, 255, 0.5);
-                border-radius: 4px;
-                min-height: 20px;
-            }
-            QTextEdit QScrollBar::handle:vertical:hover {
-                background: rgba(0, 212, 255, 0.7);
-            }
-        """)
-        container_layout.addWidget(self.response_display)
+        self.response_display = None  # Built on first use (see _ensure_response_display)
+        self._response_text = ""  # Text the display should show once it's visible
+        self._response_loaded = True  # Whether _response_text is already in the document
         
         # Toggle button for response area (only show when there's content)
         self.toggle_response_btn = QPushButton("▼ Show Response")
         self.toggle_response_btn.setFixedHeight(24)
         self.toggle_response_btn.hide()  # Hidden until there's a response
         self.toggle_response_btn.clicked.connect(self.toggle_response_area)
-        self.toggle_response_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(0, 212, 255, 0.1);
-                border: 1px solid rgba(0, 212, 255, 0.3);
-                border-radius: 8px;
-                color: rgba(0, 212, 255, 0.8);
-                font-size: 10px;
-                padding: 4px;
-            }
-            QPushButton:hover {
-                background: rgba(0, 212, 255, 0.2);
-                border-color: rgba(0, 212, 255, 0.5);
-            }
-        """)
+        self.toggle_response_btn.setObjectName("toggle_response_btn")
         container_layout.addWidget(self.toggle_response_btn)
         
         # Conversation history panel (collapsible)
         self.history_visible = False
-        self.conversation_history = []  # List of {"question": str, "answer": str}
+        # Formatted "▸ Q: ...\n  A: ..." entries, oldest first; the oldest drops off past 20
+        self.conversation_history = deque(maxlen=20)
+        self._history_text = None  # Joined panel text, rebuilt only after history changes
+        self._history_shown = None  # Text currently in history_display
         
         # History toggle button
-        self.toggle_history_btn = QPushButton("📜 History (0)")
+        self._history_btn_text = "📜 History (0)"
+        self.toggle_history_btn = QPushButton(self._history_btn_text)
         self.toggle_history_btn.setFixedHeight(24)
         self.toggle_history_btn.clicked.connect(self.toggle_history_panel)
-        self.toggle_history_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(147, 112, 219, 0.1);
-                border: 1px solid rgba(147, 112, 219, 0.3);
-                border-radius: 8px;
-                color: rgba(147, 112, 219, 0.8);
-                font-size: 10px;
-                padding: 4px;
-            }
-            QPushButton:hover {
-                background: rgba(147, 112, 219, 0.2);
-                border-color: rgba(147, 112, 219, 0.5);
-            }
-        """)
+        self.toggle_history_btn.setObjectName("toggle_history_btn")
         container_layout.addWidget(self.toggle_history_btn)
         
-        # History display area
-        self.history_display = QTextEdit()
-        self.history_display.setReadOnly(True)
-        self.history_display.setMaximumHeight(150)
-        self.history_display.hide()
-        self.history_display.setStyleSheet("""
-            QTextEdit {
-                background: rgba(20, 20, 30, 0.5);
-                border: 1px solid rgba(147, 112, 219, 0.2);
-                border-radius: 10px;
-                padding: 8px;
-                color: rgba(255, 255, 255, 0.85);
-                font-size: 11px;
-                font-family: 'Segoe UI', Arial;
-            }
-            QTextEdit QScrollBar:vertical {
-                background: rgba(0, 0, 0, 0.3);
-                width: 6px;
-                border-radius: 3px;
-            }
-            QTextEdit QScrollBar::handle:vertical {
-                background: rgba(147, 112, 219, 0.5);
-                border-radius: 3px;
-            }
-        """)
-        container_layout.addWidget(self.history_display)
+        # History display area + clear button (built on first use, see _ensure_history_display)
+        self.history_display = None
+        self.clear_history_btn = None
         
-        # Clear history button
-        self.clear_history_btn = QPushButton("🗑️ Clear History")
-        self.clear_history_btn.setFixedHeight(22)
-        self.clear_history_btn.hide()
-        self.clear_history_btn.clicked.connect(self.clear_conversation_history)
-        self.clear_history_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 100, 100, 0.1);
-                border: 1px solid rgba(255, 100, 100, 0.3);
-                border-radius: 6px;
-                color: rgba(255, 150, 150, 0.8);
-                font-size: 9px;
-                padding: 3px 8px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 100, 100, 0.2);
-            }
-        """)
-        container_layout.addWidget(self.clear_history_btn)
         
         container_layout.addSpacing(10)
         
@@ -1663,22 +2115,8 @@ class AuraFloatingWidget(QWidget):
         self.input_field = QLineEdit()
         self.input_field.setPlaceholderText("Speak or type command...")
         self.input_field.returnPressed.connect(self.send_command)
-        self.input_field.setStyleSheet("""
-            QLineEdit {
-                background: rgba(0, 0, 0, 0.4);
-                border: 1px solid rgba(0, 212, 255, 0.3);
-                border-radius: 12px;
-                padding: 12px 18px;
-                color: white;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border-color: rgba(0, 212, 255, 0.7);
-            }
-            QLineEdit::placeholder {
-                color: rgba(255, 255, 255, 0.4);
-            }
-        """)
+        self.input_field.textEdited.connect(self._prewarm_backend)
+        self.input_field.setStyleSheet(_INPUT_QSS)
         input_layout.addWidget(self.input_field)
         
         # Microphone button
@@ -1686,19 +2124,7 @@ class AuraFloatingWidget(QWidget):
         self.mic_btn.setFixedSize(44, 44)
         self.mic_btn.clicked.connect(self.toggle_voice_input)
         self.mic_btn.setToolTip("Click to speak")
-        self.mic_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(0, 212, 255, 0.3);
-                border-radius: 22px;
-                color: white;
-                font-size: 18px;
-            }
-            QPushButton:hover {
-                background: rgba(0, 212, 255, 0.3);
-                border-color: rgba(0, 212, 255, 0.6);
-            }
-        """)
+        self.mic_btn.setObjectName("mic_btn")
         input_layout.addWidget(self.mic_btn)
         
         # AURA v2: Hands-free mode button (continuous listening with wake word)
@@ -1706,95 +2132,65 @@ class AuraFloatingWidget(QWidget):
         self.hands_free_btn.setFixedSize(44, 44)
         self.hands_free_btn.clicked.connect(self.toggle_hands_free_mode)
         self.hands_free_btn.setToolTip("Hands-free mode (say 'Aura' to activate)")
-        self.hands_free_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(123, 104, 238, 0.3);
-                border-radius: 22px;
-                color: white;
-                font-size: 18px;
-            }
-            QPushButton:hover {
-                background: rgba(123, 104, 238, 0.3);
-                border-color: rgba(123, 104, 238, 0.6);
-            }
-        """)
+        self.hands_free_btn.setObjectName("hands_free_btn")
         input_layout.addWidget(self.hands_free_btn)
         
         # Send button
         self.send_btn = QPushButton("▶")
         self.send_btn.setFixedSize(44, 44)
         self.send_btn.clicked.connect(self.send_command)
-        self.send_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #00d4ff, stop:1 #7b68ee
-                );
-                border: none;
-                border-radius: 22px;
-                color: white;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #00e5ff, stop:1 #9370db
-                );
-            }
-            QPushButton:pressed {
-                background: #00d4ff;
-            }
-        """)
+        self.send_btn.setStyleSheet(_BTN_SEND_QSS)
         input_layout.addWidget(self.send_btn)
         
         container_layout.addLayout(input_layout)
         
-        # Add both screens to stacked widget
-        self.stacked_widget.addWidget(self.loading_screen)
-        self.stacked_widget.addWidget(self.main_container)
-        
-        self.main_layout.addWidget(self.stacked_widget)
-        
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(40)
-        shadow.setColor(QColor(0, 212, 255, 80))
-        shadow.setOffset(0, 0)
-        self.setGraphicsEffect(shadow)
+        # Loading screen and main container are siblings; only one is visible.
+        # The intro reserves the container's size so the centered window does
+        # not grow (downwards, off-center) when the container replaces it.
+        self.loading_screen.setMinimumSize(self.main_container.sizeHint())
+        self.main_container.hide()
+        self.main_layout.addWidget(self.loading_screen)
+        self.main_layout.addWidget(self.main_container)
         
         # Enable dragging
         self.dragging = False
         self.drag_position = QPoint()
+        self._init_drag_throttle()
         
         # Position window
         self.position_window()
         
     def show_loading_animation(self):
         """Show the loading animation"""
-        self.stacked_widget.setCurrentWidget(self.loading_screen)
         self.loading_screen.start_animation()
         
     def show_main_widget(self):
         """Transition from loading to main widget"""
-        self.stacked_widget.setCurrentWidget(self.main_container)
+        # The loading screen is one-shot - free its labels, effects and timer
+        if self.loading_screen is not None:
+            self.main_layout.removeWidget(self.loading_screen)
+            self.loading_screen.hide()
+            self.loading_screen.deleteLater()
+            self.loading_screen = None
+        self.main_container.show()
         self.input_field.setFocus()
         # Speak greeting
         if VOICE_AVAILABLE:
-            self.voice_thread = VoiceThread(self.personality.get_greeting())
-            self.voice_thread.start()
+            self._speak(self.personality.get_greeting())
         
     def position_window(self):
         """Position window at center of screen"""
-        screen = QApplication.primaryScreen().geometry()
+        screen = _primary_screen_geometry()
         x = (screen.width() - self.width()) // 2
         y = (screen.height() - self.height()) // 2
         self.move(x, y)
     
     def open_settings(self):
-        """Open settings dialog"""
-        self.settings_dialog = SettingsDialog(self)
+        """Open settings dialog (built on first use, then reused)"""
+        if self.settings_dialog is None:
+            self.settings_dialog = SettingsDialog(self)
         self.settings_dialog.show()
+        self.settings_dialog.raise_()
     
     def collapse_to_orb(self):
         """Collapse widget to mini orb at top-right corner"""
@@ -1815,6 +2211,14 @@ class AuraFloatingWidget(QWidget):
         self.hide()
         self.mini_orb_widget.show()
     
+    def _set_orb_state(self, state):
+        """Set the main orb's state and mirror it on the mini orb, if one exists"""
+        if state == self.orb.state:
+            return
+        self.orb.set_state(state)
+        if self.mini_orb_widget is not None:
+            self.mini_orb_widget.set_state(state)
+    
     def expand_from_orb(self):
         """Expand from mini orb back to full widget"""
         if not self.is_collapsed:
@@ -1834,7 +2238,7 @@ class AuraFloatingWidget(QWidget):
         
     def setup_tray_icon(self):
         """Setup system tray icon"""
-        self.tray_icon = QSystemTrayIcon(self)
+        self.tray_icon = QSystemTrayIcon(_get_app_icon(), self)
         self.tray_icon.setToolTip("AURA - Neural Interface")
         
         tray_menu = QMenu()
@@ -1859,6 +2263,9 @@ class AuraFloatingWidget(QWidget):
             
     def hide_to_tray(self):
         self.hide()
+        if self._tray_hint_shown:
+            return
+        self._tray_hint_shown = True
         self.tray_icon.showMessage(
             "AURA",
             "Double-click to bring me back.",
@@ -1875,43 +2282,82 @@ class AuraFloatingWidget(QWidget):
         """Minimize to system tray (hide window)"""
         self.hide_to_tray()
         
+    def _speak(self, text):
+        """Queue text for speech on a persistent worker (no thread per utterance)"""
+        if TTS_MANAGER_AVAILABLE and tts_speak:
+            tts_speak(text)
+            return
+        if not TTS_AVAILABLE:
+            return
+        if self.voice_thread is None:
+            self.voice_thread = VoiceThread()
+            QApplication.instance().aboutToQuit.connect(self.voice_thread.stop)
+            self.voice_thread.start()
+        self.voice_thread.speak(text)
+    
     def quit_application(self):
+        """Say goodbye, then quit as soon as the farewell has been spoken"""
         if VOICE_AVAILABLE:
-            self.voice_thread = VoiceThread(self.personality.get_farewell())
-            self.voice_thread.start()
-        QTimer.singleShot(1500, QApplication.quit)
+            self._speak(self.personality.get_farewell())
+        # Queued connection: the TTS thread emits, quit runs on the GUI thread
+        self.speech_idle.connect(QApplication.quit)
+        if VOICE_AVAILABLE and TTS_MANAGER_AVAILABLE and on_speech_idle:
+            on_speech_idle(self.speech_idle.emit)
+        elif VOICE_AVAILABLE and self.voice_thread is not None:
+            self.voice_thread.on_idle(self.speech_idle.emit)
+        else:
+            QApplication.quit()
+            return
+        QTimer.singleShot(self.QUIT_SPEECH_TIMEOUT_MS, QApplication.quit)
         
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.dragging = True
-            self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
+            self.drag_position = event.globalPos() - self.pos()
             event.accept()
             
     def mouseMoveEvent(self, event):
         if self.dragging:
-            self.move(event.globalPos() - self.drag_position)
+            self._throttled_move(event.globalPos() - self.drag_position)
             event.accept()
             
     def mouseReleaseEvent(self, event):
         self.dragging = False
+        self._flush_drag()
         
+    def _schedule_status_reset(self, ms, text="Ready", status_type="normal", hands_free_only=False):
+        """Show text/status_type after ms, unless another status is set first"""
+        self._pending_status = (text, status_type, hands_free_only)
+        self._status_reset_timer.start(ms)
+    
+    def _reset_status(self):
+        text, status_type, hands_free_only = self._pending_status
+        if self.hands_free_mode or not hands_free_only:
+            self.set_status(text, status_type)
+    
     def set_status(self, text, status_type="normal"):
-        """Update status label"""
-        colors = {
-            "normal": "rgba(255, 255, 255, 0.5)",
-            "success": "#00ff88",
-            "error": "#ff6b6b",
-            "warning": "#ffd700",
-            "processing": "#00d4ff",
-        }
-        color = colors.get(status_type, colors["normal"])
-        self.status_label.setStyleSheet(f"""
-            color: {color};
-            font-size: 11px;
-            letter-spacing: 2px;
-        """)
+        """Update status label (cancels any pending delayed reset)"""
+        self._status_reset_timer.stop()
+        if status_type not in _STATUS_TYPES:
+            status_type = "normal"
+        # Colors live in the container sheet; only repolish when the kind changes
+        if self.status_label.property("status") != status_type:
+            self.status_label.setProperty("status", status_type)
+            style = self.status_label.style()
+            style.unpolish(self.status_label)
+            style.polish(self.status_label)
         self.status_label.setText(text)
         
+    @staticmethod
+    def _set_button_active(button, active):
+        """Switch a voice button's look via its "active" property (rules in the container sheet)"""
+        if button.property("active") == active:
+            return
+        button.setProperty("active", active)
+        style = button.style()
+        style.unpolish(button)
+        style.polish(button)
+        
     def send_command(self):
         """Send command to AURA"""
         command = self.input_field.text().strip()
@@ -1920,32 +2366,31 @@ class AuraFloatingWidget(QWidget):
 
         # Global stop/cancel commands: stop current speech/automation instead of
         # routing through intent handling.
-        lower_cmd = command.lower()
-        if lower_cmd in ["stop", "cancel", "shut up", "stop talking", "be quiet", "quiet"]:
+        lower_cmd = command.casefold()
+        if lower_cmd in _STOP_CMDS:
             # Stop hands-free mode if active
             if self.hands_free_mode:
                 self.stop_hands_free_mode()
 
             # Stop TTS playback (end current speech)
             if TTS_MANAGER_AVAILABLE:
-                try:
-                    from tts_manager import stop_speaking
-                    stop_speaking()
-                except Exception as e:
-                    print(f"[TTS] Stop error: {e}")
+                stop_speaking()
             
-            # Cancel any ongoing processing
-            if self.processing_thread and self.processing_thread.isRunning():
-                self.processing_thread.terminate()
-                self.processing_thread.wait(1000)
+            # Cancel any ongoing processing (cooperative - never blocks the UI)
+            if self.processing_thread is not None:
+                self.processing_thread.cancel()
+            self._processing_handlers.clear()
+            self._unspoken_stream.clear()
 
+            self._set_orb_state("idle")
             self.set_status("Stopped.", "warning")
             self.input_field.clear()
             return
 
         # Clear previous response display when starting new command
-        self.response_display.clear()
-        self.response_display.hide()
+        self._set_response_text("")
+        if self.response_display is not None:
+            self.response_display.hide()
         self.toggle_response_btn.hide()
         self.last_response = ""
 
@@ -1953,40 +2398,81 @@ class AuraFloatingWidget(QWidget):
         self.context["command_count"] += 1
         
         # Check for exit commands
-        if command.lower() in ['exit', 'quit', 'goodbye', 'bye']:
+        if lower_cmd in _EXIT_CMDS:
             self.quit_application()
             return
             
         # Check for status
-        if command.lower() in ['status', 'how are you']:
+        if lower_cmd in _STATUS_CMDS:
             self.set_status("Systems Online", "success")
             if VOICE_AVAILABLE:
-                self.voice_thread = VoiceThread(self.personality.get_status_report())
-                self.voice_thread.start()
+                self._speak(self.personality.get_status_report())
             return
             
         # Show processing
         self.set_status("Processing...", "processing")
-        self.orb.set_state("processing")
+        self._set_orb_state("processing")
         
         # Store command for history tracking
         self.last_command = command
         
         # Process in background
-        self.processing_thread = ProcessingThread(command, self.context)
-        self.processing_thread.finished.connect(self.on_processing_complete)
-        self.processing_thread.start()
+        self._process_in_background(command, self.on_processing_complete)
         
         # Auto-collapse to mini orb while processing
         self.collapse_to_orb()
         
-    def on_processing_complete(self, response, msg_type, success):
+    def _ensure_processing_thread(self):
+        """Start the persistent processing worker (it loads the backends first)"""
+        if self.processing_thread is None:
+            self.processing_thread = ProcessingThread()
+            self.processing_thread.finished.connect(self._on_processing_finished)
+            self.processing_thread.partial.connect(self._on_processing_partial)
+            QApplication.instance().aboutToQuit.connect(self.processing_thread.stop)
+            self.processing_thread.start()
+    
+    def _prewarm_backend(self, *_):
+        """Open the Gemini connection while a command is still being typed/spoken"""
+        if not AURA_V2_AVAILABLE:
+            return
+        now = time.monotonic()
+        if now - self._last_prewarm < _PREWARM_INTERVAL_S:
+            return
+        self._last_prewarm = now
+        threading.Thread(target=aura_bridge.warm_up, daemon=True).start()
+    
+    def _process_in_background(self, command, on_complete):
+        """Queue a command on the processing worker; on_complete gets its result"""
+        self._ensure_processing_thread()
+        job_id = self.processing_thread.submit(command, self.context)
+        self._processing_handlers[job_id] = on_complete
+    
+    def _on_processing_partial(self, job_id, text):
+        """Speak each complete sentence of a streamed reply as soon as it arrives"""
+        if job_id not in self._processing_handlers:
+            return  # Cancelled
+        *sentences, pending = _SENTENCE_BREAK_RE.split(self._unspoken_stream.get(job_id, "") + text)
+        self._unspoken_stream[job_id] = pending
+        for sentence in sentences:
+            self._speak(sentence)
+    
+    def _on_processing_finished(self, job_id, response, msg_type, success):
+        """Route a worker result to the slot that queued it (unless cancelled)"""
+        unspoken = self._unspoken_stream.pop(job_id, None)
+        on_complete = self._processing_handlers.pop(job_id, None)
+        if on_complete is None:
+            return
+        if unspoken is None:
+            on_complete(response, msg_type, success)
+            return
+        # Streamed reply - all but the last sentence has been spoken already
+        if unspoken.strip():
+            self._speak(unspoken)
+        on_complete(response, msg_type, success, speak=False)
+    
+    def on_processing_complete(self, response, msg_type, success, speak=True):
         """Handle processing completion"""
-        self.orb.set_state("idle")
-        
-        # Also update mini orb state if collapsed
-        if self.is_collapsed and self.mini_orb_widget:
-            self.mini_orb_widget.set_state("idle")
+        self._set_orb_state("idle")
         
         if success:
             # For conversational / Butler responses, speak and print the actual answer
@@ -1996,11 +2482,11 @@ class AuraFloatingWidget(QWidget):
                 self.last_response = response
                 
                 # Add to conversation history (if this looks like a Q&A)
-                if hasattr(self, 'last_command') and self.last_command:
+                if self.last_command:
                     self.add_to_conversation_history(self.last_command, response)
                 
-                # Display response in UI
-                self.response_display.setPlainText(response)
+                # Display response in UI (laid out only once the display is shown)
+                self._set_response_text(response)
                 
                 # Show toggle button if response is long enough to warrant display
                 if len(response) > 50:  # Show toggle for substantial responses
@@ -2010,19 +2496,16 @@ class AuraFloatingWidget(QWidget):
                         self.expand_response_area()
                 else:
                     # Short responses: show inline, hide toggle
-                    self.response_display.setMaximumHeight(60)
+                    self._load_response_display().setMaximumHeight(60)
                     self.response_display.show()
                     self.toggle_response_btn.hide()
                 
                 self.set_status("Done", "success")
                 
-                # Use chunked TTS for long responses (interruptible)
-                if TTS_MANAGER_AVAILABLE:
-                    words = response.split()
-                    if len(words) > 30 and speak_chunked:  # Long response
-                        speak_chunked(response)
-                    elif tts_speak:  # Short response
-                        tts_speak(response)
+                # Single chunked path: sentences are queued one by one so the
+                # first one starts playing while the rest are still queued
+                if speak and TTS_MANAGER_AVAILABLE and speak_chunked:
+                    speak_chunked(response)
             else:
                 self.set_status("Done", "success")
                 if TTS_MANAGER_AVAILABLE and tts_speak:
@@ -2031,13 +2514,78 @@ class AuraFloatingWidget(QWidget):
             self.set_status("Error", "error")
             # Show error in response area
             error_msg = response if response else "An error occurred."
-            self.response_display.setPlainText(f"❌ Error: {error_msg}")
-            self.response_display.setMaximumHeight(80)
+            self._set_response_text(f"❌ Error: {error_msg}")
+            self._load_response_display().setMaximumHeight(80)
             self.response_display.show()
             self.toggle_response_btn.hide()
         
         # Reset status after delay
-        QTimer.singleShot(3000, lambda: self.set_status("Ready", "normal"))
+        self._schedule_status_reset(3000)
+    
+    @staticmethod
+    def _make_text_display(object_name):
+        """Read-only text display whose document keeps no undo history"""
+        display = QTextEdit()
+        display.setReadOnly(True)
+        display.setObjectName(object_name)
+        display.setWordWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+        # Contents are only ever replaced wholesale - an undo stack just holds stale copies
+        document = display.document()
+        document.setUndoRedoEnabled(False)
+        document.setMaximumBlockCount(2000)
+        return display
+    
+    def _set_response_text(self, text):
+        """Record the response to display; the document is filled when it's shown"""
+        self._response_text = text
+        self._response_loaded = False
+    
+    def _load_response_display(self):
+        """Return the response display with the current response text laid out"""
+        display = self._ensure_response_display()
+        if not self._response_loaded:
+            display.setPlainText(self._response_text)
+            self._response_loaded = True
+        return display
+    
+    def _ensure_response_display(self):
+        """Create the response display on first use and insert it above its toggle button"""
+        if self.response_display is not None:
+            return self.response_display
+        
+        response_display = self._make_text_display("response_display")
+        response_display.setMaximumHeight(200)  # Max height when expanded
+        response_display.setMinimumHeight(0)
+        response_display.hide()  # Hidden by default (minimal mode)
+        
+        layout = self._container_layout
+        layout.insertWidget(layout.indexOf(self.toggle_response_btn), response_display)
+        self.response_display = response_display
+        return response_display
+    
+    def _ensure_history_display(self):
+        """Create the history display and clear button on first use"""
+        if self.history_display is not None:
+            return self.history_display
+        
+        history_display = self._make_text_display("history_display")
+        history_display.setMaximumHeight(150)
+        history_display.hide()
+        
+        # Clear history button
+        clear_history_btn = QPushButton("🗑️ Clear History")
+        clear_history_btn.setFixedHeight(22)
+        clear_history_btn.hide()
+        clear_history_btn.clicked.connect(self.clear_conversation_history)
+        clear_history_btn.setObjectName("clear_history_btn")
+        
+        layout = self._container_layout
+        index = layout.indexOf(self.toggle_history_btn) + 1
+        layout.insertWidget(index, history_display)
+        layout.insertWidget(index + 1, clear_history_btn)
+        self.history_display = history_display
+        self.clear_history_btn = clear_history_btn
+        return history_display
     
     def toggle_response_area(self):
         """Toggle response display area visibility"""
@@ -2049,7 +2597,7 @@ class AuraFloatingWidget(QWidget):
     def expand_response_area(self):
         """Expand response display area"""
         self.response_area_visible = True
-        self.response_display.setMaximumHeight(200)
+        self._load_response_display().setMaximumHeight(200)
         self.response_display.show()
         self.toggle_response_btn.setText("▲ Hide Response")
         # Scroll to top
@@ -2058,7 +2606,8 @@ class AuraFloatingWidget(QWidget):
     def collapse_response_area(self):
         """Collapse response display area"""
         self.response_area_visible = False
-        self.response_display.hide()
+        if self.response_display is not None:
+            self.response_display.hide()
         self.toggle_response_btn.setText("▼ Show Response")
     
     def toggle_history_panel(self):
@@ -2067,45 +2616,47 @@ class AuraFloatingWidget(QWidget):
             self.history_display.hide()
             self.clear_history_btn.hide()
             self.history_visible = False
-            self.toggle_history_btn.setText(f"📜 History ({len(self.conversation_history)})")
+            self._update_history_btn_text()
         else:
+            self._ensure_history_display()
             self.update_history_display()
             self.history_display.show()
             self.clear_history_btn.show()
             self.history_visible = True
-            self.toggle_history_btn.setText(f"▲ Hide History ({len(self.conversation_history)})")
+            self._update_history_btn_text()
+    
+    def _update_history_btn_text(self):
+        """Relabel the history toggle, skipping setText (and its re-layout) if unchanged"""
+        template = "▲ Hide History ({})" if self.history_visible else "📜 History ({})"
+        text = template.format(len(self.conversation_history))
+        if text != self._history_btn_text:
+            self.toggle_history_btn.setText(text)
+            self._history_btn_text = text
     
     def update_history_display(self):
         """Update the history display with recent Q&A pairs"""
-        if not self.conversation_history:
-            self.history_display.setPlainText("No conversation history yet.")
-            return
-        
-        # Build formatted history (newest first)
-        history_text = ""
-        for i, entry in enumerate(reversed(self.conversation_history[-10:]), 1):  # Last 10
-            q = entry.get("question", "")[:50] + ("..." if len(entry.get("question", "")) > 50 else "")
-            a = entry.get("answer", "")[:100] + ("..." if len(entry.get("answer", "")) > 100 else "")
-            history_text += f"▸ Q: {q}\n  A: {a}\n\n"
+        if self._history_text is None:
+            if self.conversation_history:
+                # Entries are formatted when added; last 10, newest first
+                self._history_text = "\n\n".join(islice(reversed(self.conversation_history), 10))
+            else:
+                self._history_text = "No conversation history yet."
         
-        self.history_display.setPlainText(history_text.strip())
+        # Re-showing the panel without new entries doesn't re-layout the document
+        if self._history_shown != self._history_text:
+            self.history_display.setPlainText(self._history_text)
+            self._history_shown = self._history_text
         self.history_display.verticalScrollBar().setValue(0)
     
     def add_to_conversation_history(self, question: str, answer: str):
         """Add a Q&A pair to the conversation history"""
-        self.conversation_history.append({
-            "question": question,
-            "answer": answer
-        })
-        # Keep only last 20 entries
-        if len(self.conversation_history) > 20:
-            self.conversation_history = self.conversation_history[-20:]
+        q = question[:50] + ("..." if len(question) > 50 else "")
+        a = answer[:100] + ("..." if len(answer) > 100 else "")
+        self.conversation_history.append(f"▸ Q: {q}\n  A: {a}")
+        self._history_text = None
         
         # Update button text
-        self.toggle_history_btn.setText(
-            f"▲ Hide History ({len(self.conversation_history)})" if self.history_visible 
-            else f"📜 History ({len(self.conversation_history)})"
-        )
+        self._update_history_btn_text()
         
         # Update display if visible
         if self.history_visible:
@@ -2113,16 +2664,16 @@ class AuraFloatingWidget(QWidget):
     
     def clear_conversation_history(self):
         """Clear all conversation history"""
-        self.conversation_history = []
-        self.history_display.setPlainText("History cleared.")
-        self.toggle_history_btn.setText("📜 History (0)")
+        self.conversation_history.clear()
+        self._history_text = None
+        if self.history_display is not None:
+            self.history_display.setPlainText("History cleared.")
+            self._history_shown = "History cleared."
+        self._update_history_btn_text()
         
         # Also clear the AURA bridge conversation history
-        try:
-            from aura_v2_bridge import aura_bridge
+        if AURA_V2_AVAILABLE:
             aura_bridge.clear_conversation_history()
-        except Exception as e:
-            print(f"[History] Could not clear bridge history: {e}")
     
     def toggle_voice_input(self):
         """Toggle voice input - start/stop listening"""
@@ -2138,17 +2689,10 @@ class AuraFloatingWidget(QWidget):
     def start_listening(self):
         """Start listening for voice input"""
         self.is_listening = True
-        self.orb.set_state("listening")
+        self._prewarm_backend()
+        self._set_orb_state("listening")
         self.set_status("Listening...", "warning")
-        self.mic_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 71, 87, 0.5);
-                border: 2px solid rgba(255, 71, 87, 0.8);
-                border-radius: 22px;
-                color: white;
-                font-size: 18px;
-            }
-        """)
+        self._set_button_active(self.mic_btn, True)
         
         self.speech_thread = SpeechRecognitionThread()
         self.speech_thread.recognized.connect(self.on_speech_recognized)
@@ -2159,21 +2703,9 @@ class AuraFloatingWidget(QWidget):
     def stop_listening(self):
         """Stop listening and reset UI"""
         self.is_listening = False
-        self.orb.set_state("idle")
+        self._set_orb_state("idle")
         self.set_status("Ready", "normal")
-        self.mic_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(0, 212, 255, 0.3);
-                border-radius: 22px;
-                color: white;
-                font-size: 18px;
-            }
-            QPushButton:hover {
-                background: rgba(0, 212, 255, 0.3);
-                border-color: rgba(0, 212, 255, 0.6);
-            }
-        """)
+        self._set_button_active(self.mic_btn, False)
     
     def on_speech_recognized(self, text):
         """Handle recognized speech"""
@@ -2186,7 +2718,7 @@ class AuraFloatingWidget(QWidget):
         """Handle speech recognition error"""
         self.stop_listening()
         self.set_status("Didn't catch that", "error")
-        QTimer.singleShot(2000, lambda: self.set_status("Ready", "normal"))
+        self._schedule_status_reset(2000)
     
     # ═══════════════════════════════════════════════════════════════════════════
     # AURA v2: HANDS-FREE MODE - Continuous listening with wake word
@@ -2209,74 +2741,57 @@ class AuraFloatingWidget(QWidget):
         
         # Update UI
         self.set_status("Hands-free: Say 'Aura'", "success")
-        self.hands_free_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(0, 255, 136, 0.4);
-                border: 2px solid rgba(0, 255, 136, 0.8);
-                border-radius: 22px;
-                color: white;
-                font-size: 18px;
-            }
-        """)
+        self._set_button_active(self.hands_free_btn, True)
         self.hands_free_btn.setToolTip("Hands-free mode ACTIVE - Click to stop")
         
-        # Start continuous listening thread
-        self.continuous_listening_thread = ContinuousListeningThread(
-            wake_words=["aura", "hey aura", "ok aura"]
-        )
-        self.continuous_listening_thread.wake_word_detected.connect(self.on_wake_word_detected)
-        self.continuous_listening_thread.command_recognized.connect(self.on_hands_free_command)
-        self.continuous_listening_thread.status_update.connect(lambda s: self.set_status(s, "normal"))
-        self.continuous_listening_thread.error.connect(self.on_hands_free_error)
-        self.continuous_listening_thread.start()
-        
-        # Voice confirmation using TTS Manager
-        if TTS_MANAGER_AVAILABLE:
-            tts_speak("Hands-free mode activated. Say Aura to wake me.")
-        elif VOICE_AVAILABLE:
-            self.voice_thread = VoiceThread("Hands-free mode activated. Say Aura to wake me.")
-            self.voice_thread.start()
+        # Start continuous listening thread (created once, paused/resumed afterwards)
+        if self.continuous_listening_thread is None:
+            self.continuous_listening_thread = ContinuousListeningThread(
+                wake_words=["aura", "hey aura", "ok aura"]
+            )
+            self.continuous_listening_thread.wake_word_detected.connect(self.on_wake_word_detected)
+            self.continuous_listening_thread.command_recognized.connect(self.on_hands_free_command)
+            self.continuous_listening_thread.status_update.connect(self.on_hands_free_status)
+            self.continuous_listening_thread.error.connect(self.on_hands_free_error)
+            QApplication.instance().aboutToQuit.connect(self.continuous_listening_thread.stop)
+            self.continuous_listening_thread.start()
+        else:
+            self.continuous_listening_thread.resume()
+            if not self.continuous_listening_thread.isRunning():
+                self.continuous_listening_thread.start()
+        
+        # Voice confirmation (TTS Manager, else fallback voice thread)
+        self._speak("Hands-free mode activated. Say Aura to wake me.")
     
     def stop_hands_free_mode(self):
         """Stop continuous listening"""
         self.hands_free_mode = False
         
-        # Stop the thread
-        if self.continuous_listening_thread:
-            self.continuous_listening_thread.stop()
-            self.continuous_listening_thread.quit()
-            self.continuous_listening_thread.wait(2000)
-            self.continuous_listening_thread = None
+        # Pause the thread (returns immediately; kept for the next start)
+        if self.continuous_listening_thread is not None:
+            self.continuous_listening_thread.pause()
         
         # Reset UI
         self.set_status("Ready", "normal")
-        self.orb.set_state("idle")
-        self.hands_free_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(123, 104, 238, 0.3);
-                border-radius: 22px;
-                color: white;
-                font-size: 18px;
-            }
-            QPushButton:hover {
-                background: rgba(123, 104, 238, 0.3);
-                border-color: rgba(123, 104, 238, 0.6);
-            }
-        """)
+        self._set_orb_state("idle")
+        self._set_button_active(self.hands_free_btn, False)
         self.hands_free_btn.setToolTip("Hands-free mode (say 'Aura' to activate)")
         
-        # Voice confirmation using TTS Manager
-        if TTS_MANAGER_AVAILABLE:
-            tts_speak("Hands-free mode deactivated.")
-        elif VOICE_AVAILABLE:
-            self.voice_thread = VoiceThread("Hands-free mode deactivated.")
-            self.voice_thread.start()
+        # Voice confirmation (TTS Manager, else fallback voice thread)
+        self._speak("Hands-free mode deactivated.")
+    
+    def on_hands_free_status(self, text):
+        """Show listening-thread status while hands-free mode is on"""
+        if self.hands_free_mode:
+            self.set_status(text, "normal")
     
     def on_wake_word_detected(self):
         """Handle wake word detection - AURA heard her name"""
-        self.orb.set_state("listening")
+        if not self.hands_free_mode:
+            return  # Queued before hands-free was switched off
+        self._set_orb_state("listening")
         self.set_status("Yes?", "success")
+        self._prewarm_backend()
         
         # Voice acknowledgment using TTS Manager
         if TTS_MANAGER_AVAILABLE and AURA_V2_AVAILABLE:
@@ -2285,12 +2800,13 @@ class AuraFloatingWidget(QWidget):
         elif TTS_MANAGER_AVAILABLE:
             tts_speak("Yes?")
         elif VOICE_AVAILABLE:
-            self.voice_thread = VoiceThread("Yes?")
-            self.voice_thread.start()
+            self._speak("Yes?")
     
     def on_hands_free_command(self, command):
         """Handle command from hands-free mode"""
-        self.orb.set_state("processing")
+        if not self.hands_free_mode:
+            return  # Queued before hands-free was switched off
+        self._set_orb_state("processing")
         self.set_status(f"Processing: {command[:25]}...", "processing")
         
         # Put command in input field (for visibility)
@@ -2300,34 +2816,33 @@ class AuraFloatingWidget(QWidget):
         self.context["command_count"] += 1
         
         # Check for exit commands
-        if command.lower() in ['exit', 'quit', 'goodbye', 'bye', 'stop listening']:
+        if command.casefold() in _HANDS_FREE_EXIT_CMDS:
             self.stop_hands_free_mode()
             return
         
         # Process in background thread
-        self.processing_thread = ProcessingThread(command, self.context)
-        self.processing_thread.finished.connect(self.on_hands_free_complete)
-        self.processing_thread.start()
+        self._process_in_background(command, self.on_hands_free_complete)
     
-    def on_hands_free_complete(self, response, msg_type, success):
+    def on_hands_free_complete(self, response, msg_type, success, speak=True):
         """Handle completion in hands-free mode"""
-        self.orb.set_state("idle")
+        self._set_orb_state("idle")
         
         if success:
             self.set_status("Done - Say 'Aura'", "success")
         else:
             self.set_status("Error - Say 'Aura'", "error")
         
-        # Speak the response using TTS Manager
-        if TTS_MANAGER_AVAILABLE and response:
-            tts_speak(response)
-        elif VOICE_AVAILABLE and response:
-            self.voice_thread = VoiceThread(response)
-            self.voice_thread.start()
+        # Speak the response - chunked like typed commands, so long replies start
+        # playing sooner and stay interruptible; fallback voice thread otherwise
+        if response and speak:
+            if TTS_MANAGER_AVAILABLE and speak_chunked:
+                speak_chunked(response)
+            else:
+                self._speak(response)
         
         # Clear input and reset after delay
         self.input_field.clear()
-        QTimer.singleShot(3000, lambda: self.set_status("Hands-free: Say 'Aura'", "success") if self.hands_free_mode else None)
+        self._schedule_status_reset(3000, "Hands-free: Say 'Aura'", "success", hands_free_only=True)
     
     def on_hands_free_error(self, error_msg):
         """Handle error in hands-free mode"""
@@ -2344,11 +2859,21 @@ def main():
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
     
+    # Room for the orb glow/core atlas (both orb sizes, all animation steps)
+    QPixmapCache.setCacheLimit(32768)
+    
     font = QFont("Segoe UI", 10)
     app.setFont(font)
+    app.setWindowIcon(_get_app_icon())
     
     # API key setup is handled via Settings dialog (click orb)
-    # Key is stored in ~/.aura/.env
+    # Key is stored in ~/.aura/.env, loaded into os.environ once here
+    # (config.config does it on import; the backends that also import it are
+    # only loaded later, by the processing worker)
+    try:
+        import config.config  # noqa: F401
+    except Exception as e:
+        print(f"Could not load ~/.aura/.env: {e}")
     
     widget = AuraFloatingWidget()
     widget.show()
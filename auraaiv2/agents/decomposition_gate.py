@@ -12,11 +12,63 @@ If the user request requires performing actions in SEQUENCE
 (e.g., open X then do Y), classify as MULTI even if it's one sentence.
 """
 
+import atexit
+import copy
+import hashlib
+import json
 import logging
-from typing import Dict, Any, List
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, List, Optional
 from models.model_manager import get_model_manager
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# FAST PATH: obviously-single commands skip the LLM
+# Anything with a sequencing cue, more than one action verb, or of more than
+# trivial length still goes to the model.
+# ═══════════════════════════════════════════════════════════════════════════════
+_FAST_PATH_MAX_CHARS = 60
+
+_MULTI_CUE_RE = re.compile(r"\b(?:and|then|after|afterwards|before|also|while|plus)\b|[,;&]", re.IGNORECASE)
+
+_ACTION_VERBS = frozenset({
+    "open", "close", "launch", "start", "quit", "exit", "run", "kill",
+    "type", "write", "append", "press", "click", "scroll", "paste", "copy",
+    "search", "find", "google", "browse", "go", "navigate", "visit",
+    "take", "capture", "record", "save", "download", "upload",
+    "create", "make", "delete", "remove", "move", "rename", "read", "list",
+    "play", "pause", "resume", "stop", "skip", "mute", "unmute",
+    "increase", "decrease", "raise", "lower", "set", "turn", "switch", "toggle",
+    "minimize", "maximize", "focus", "snap", "lock", "shutdown", "restart",
+    "send", "install", "show", "hide",
+})
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Input verbs that name a target window/app ("type hello in notepad") need a
+# focus step first (rule 3 of the gate prompt), so the model must split them
+_TARGETED_INPUT_RE = re.compile(
+    r"\b(?:type|press|click|paste|scroll|search|play)\b.*\b(?:in|on|into)\b", re.IGNORECASE
+)
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PERSISTED CACHE: model segmentations survive restarts
+# Stored in ~/.aura/gate_cache.json, tagged with a fingerprint of the prompt and
+# model so editing the few-shot examples or switching models invalidates it.
+# New results are written in one batch a few seconds after the first of them
+# (and at exit), via a temp file swapped in atomically.
+# ═══════════════════════════════════════════════════════════════════════════════
+_PERSIST_MAX_ENTRIES = 512
+_PERSIST_DEBOUNCE_S = 5.0
+_PERSIST_RETENTION_DAYS = 7
+
+
 class DecompositionGate:
     """Semantic segmentation gate with action extraction.
     
@@ -129,11 +181,74 @@ User: "create a folder called projects and put a readme.txt inside it"
 - "do X" = SINGLE (one action only)
 """
     
-    def __init__(self):
+    _PROMPT_PREFIX = """You are an action segmentation agent.
+
+Your job: Count executable actions in a user request and detect dependencies.
+
+""" + FEW_SHOT_EXAMPLES + """
+
+---
+
+NOW ANALYZE THIS INPUT:
+User: \""""
+    
+    _PROMPT_SUFFIX = """\"
+
+RULES:
+1. Count how many DISTINCT executable actions exist
+2. If actions must happen in sequence (open X THEN do Y), classify as MULTI
+3. Detect implicit dependencies (e.g., typing requires a focused window)
+4. The word "and" between verbs usually means MULTI
+5. Do NOT consider feasibility or system capabilities
+
+Return JSON with:
+- classification: "single" or "multi"
+- reasoning: brief explanation (1 sentence)
+- actions: list of actions with depends_on_previous flag
+"""
+    
+    def __init__(self, cache_path: Optional[Path] = None):
         # Use planner model (mistral:7b) for verb + dependency reasoning
         self.model = get_model_manager().get_planner_model()
+        # Repeated commands skip the LLM call; failed calls raise and are not cached
+        self._segment_cached = lru_cache(maxsize=512)(self._segment)
+        self.fast_path_hits = 0
+        
+        # On-disk copy of model results (loaded once, rewritten in debounced batches)
+        if cache_path is None:
+            cache_path = Path.home() / ".aura" / "gate_cache.json"
+        self.cache_path = cache_path
+        self._fingerprint = hashlib.sha1(
+            f"{getattr(self.model, 'model', type(self.model).__name__)}\n"
+            f"{self._PROMPT_PREFIX}{self._PROMPT_SUFFIX}".encode()
+        ).hexdigest()
+        self._persisted: Dict[str, Dict[str, Any]] = {}
+        self._persist_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False
+        self._load_persisted()
+        atexit.register(self.flush_cache)
+        
         logging.info("DecompositionGate v2 initialized (semantic segmentation)")
     
+    def clear_cache(self) -> None:
+        """Forget memoized segmentations (e.g. after switching models)."""
+        self._segment_cached.cache_clear()
+        with self._persist_lock:
+            self._persisted.clear()
+            self._dirty = True
+        self.flush_cache()
+    
+    def flush_cache(self) -> None:
+        """Write any pending segmentations to disk now (also runs at exit)."""
+        with self._persist_lock:
+            timer, self._save_timer = self._save_timer, None
+            dirty, self._dirty = self._dirty, False
+        if timer is not None:
+            timer.cancel()
+        if dirty:
+            self._save_persisted()
+    
     def classify(self, user_input: str) -> str:
         """Classify input as single or multi-goal.
         
@@ -165,42 +280,23 @@ User: "create a folder called projects and put a readme.txt inside it"
                 ]
             }
         """
-        prompt = f"""You are an action segmentation agent.
-
-Your job: Count executable actions in a user request and detect dependencies.
-
-{self.FEW_SHOT_EXAMPLES}
-
----
-
-NOW ANALYZE THIS INPUT:
-User: "{user_input}"
-
-RULES:
-1. Count how many DISTINCT executable actions exist
-2. If actions must happen in sequence (open X THEN do Y), classify as MULTI
-3. Detect implicit dependencies (e.g., typing requires a focused window)
-4. The word "and" between verbs usually means MULTI
-5. Do NOT consider feasibility or system capabilities
-
-Return JSON with:
-- classification: "single" or "multi"
-- reasoning: brief explanation (1 sentence)
-- actions: list of actions with depends_on_previous flag
-"""
+        if self._is_obviously_single(user_input):
+            self.fast_path_hits += 1
+            logging.info(f"DecompositionGate: '{user_input[:50]}' → single (fast path, {self.fast_path_hits} total)")
+            return {
+                "classification": "single",
+                "reasoning": "Fast path: one action verb, no sequencing cues",
+                "actions": [{"description": user_input.strip(), "depends_on_previous": False}]
+            }
         
         try:
-            result = self.model.generate(prompt, schema=self.GATE_SCHEMA)
+            # Key on whitespace-normalized input only - case can matter for
+            # action text (file names, typed content). Cached results are
+            # shared, so callers get their own copy.
+            result = copy.deepcopy(self._segment_cached(" ".join(user_input.split())))
             
             classification = result.get("classification", "single")
             actions = result.get("actions", [])
-            reasoning = result.get("reasoning", "No reasoning provided")
-            
-            # Safety: if we got multiple actions, force multi classification
-            if len(actions) > 1 and classification == "single":
-                logging.warning(f"Gate conflict: {len(actions)} actions but classified as single, forcing multi")
-                classification = "multi"
-                result["classification"] = "multi"
             
             logging.info(
                 f"DecompositionGate: '{user_input[:50]}...' → {classification} "
@@ -218,6 +314,98 @@ Return JSON with:
                 "actions": [{"description": user_input, "depends_on_previous": False}]
             }
     
+    @staticmethod
+    def _is_obviously_single(user_input: str) -> bool:
+        """Short input with at most one action verb, no sequencing cue and no input target."""
+        text = user_input.strip()
+        if not text or len(text) >= _FAST_PATH_MAX_CHARS or _MULTI_CUE_RE.search(text):
+            return False
+        if _TARGETED_INPUT_RE.search(text):
+            return False
+        verbs = sum(1 for word in _WORD_RE.findall(text.lower()) if word in _ACTION_VERBS)
+        return verbs <= 1
+    
+    def _segment(self, user_input: str) -> Dict[str, Any]:
+        """Run the LLM segmentation for one normalized input (or reuse a persisted one)."""
+        with self._persist_lock:
+            entry = self._persisted.get(user_input)
+        if entry is not None:
+            return entry["result"]
+        
+        # Static text around the input is built once, so the few-shot block
+        # is a byte-identical prefix across calls (reused by the model's KV cache)
+        prompt = self._PROMPT_PREFIX + user_input + self._PROMPT_SUFFIX
+        result = self.model.generate(prompt, schema=self.GATE_SCHEMA)
+        
+        actions = result.get("actions", [])
+        
+        # Safety: if we got multiple actions, force multi classification
+        if len(actions) > 1 and result.get("classification", "single") == "single":
+            logging.warning(f"Gate conflict: {len(actions)} actions but classified as single, forcing multi")
+            result["classification"] = "multi"
+        
+        with self._persist_lock:
+            self._persisted[user_input] = {"result": result, "timestamp": datetime.now().isoformat()}
+            if len(self._persisted) > _PERSIST_MAX_ENTRIES:
+                oldest = min(self._persisted, key=lambda k: self._persisted[k]["timestamp"])
+                del self._persisted[oldest]
+            # Batch writes: the first new result schedules one save for all that follow
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(_PERSIST_DEBOUNCE_S, self.flush_cache)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+        
+        return result
+    
+    def _load_persisted(self) -> None:
+        """Load persisted segmentations (fail-soft: start empty on any problem)."""
+        if not self.cache_path.exists():
+            return
+        
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            if data.get("fingerprint") != self._fingerprint:
+                logging.debug("DecompositionGate: prompt/model changed, ignoring persisted cache")
+                return
+            
+            cutoff = (datetime.now() - timedelta(days=_PERSIST_RETENTION_DAYS)).isoformat()
+            self._persisted = {
+                key: entry for key, entry in data.get("entries", {}).items()
+                if entry.get("timestamp", "") > cutoff and "result" in entry
+            }
+            logging.debug(f"DecompositionGate loaded {len(self._persisted)} cached segmentations")
+            
+        except Exception as e:
+            logging.debug(f"Failed to load DecompositionGate cache: {e}")
+    
+    def _save_persisted(self) -> None:
+        """Write persisted segmentations to disk (non-fatal on failure)."""
+        try:
+            with self._persist_lock:
+                data = json.dumps({
+                    "version": "1.0",
+                    "fingerprint": self._fingerprint,
+                    "entries": self._persisted,
+                })
+            
+            # Write a sibling temp file and swap it in, so a crash or a concurrent
+            # writer never leaves a truncated cache behind
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_path.parent, prefix=".gate_cache.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+                
+        except Exception as e:
+            logging.debug(f"Failed to persist DecompositionGate cache: {e}")
+    
     def get_action_descriptions(self, user_input: str) -> List[str]:
         """Convenience method to get just action descriptions.
         
@@ -3,13 +3,81 @@
 CRITICAL: This is the FIRST gate in the pipeline.
 Wrong classification = wrong tools = wrong execution.
 
-Uses mistral:7b for better reasoning.
-Includes 2-3 few-shot examples per intent for reliability.
+Asks the small intent model (phi3:mini) first and escalates to mistral:7b
+when it is unsure. Includes 2-3 few-shot examples per intent for reliability.
+Obvious phrasings are matched by anchored rules, and (when
+sentence-transformers is installed) inputs that clearly match one intent's
+example centroid are classified locally - both without the LLM.
 """
 
 import logging
-from typing import Dict, Any
+import re
+from functools import lru_cache
+from typing import Dict, Any, List
 from models.model_manager import get_model_manager
+from core.intent_router import CONFIDENCE_THRESHOLD
+
+# Optional: local sentence embeddings for the nearest-centroid fast path
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    EMBEDDINGS_AVAILABLE = True
+except ImportError:
+    EMBEDDINGS_AVAILABLE = False
+
+
+# Fast-model answers the router would not act on (below its confidence
+# threshold, "unknown" or not a known intent) go to the planner model
+_ESCALATE_BELOW = CONFIDENCE_THRESHOLD
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# RULE FAST PATH
+# Short, fully-matched phrasings whose intent is unambiguous (each agrees with
+# the labelled few-shot examples). Patterns are anchored at both ends, so any
+# extra words ("...and type hello", "...earlier") fall through to the model.
+# ═══════════════════════════════════════════════════════════════════════════════
+_BROWSERS = r"(?:chrome|firefox|edge|brave|opera|browser)"
+# Desktop apps that "open/launch/start <name>" unambiguously launches - other
+# names may be websites ("open youtube"), settings pages or actions ("start timer")
+_APPS = r"(?:notepad|calculator|calc|paint|spotify|discord|slack|zoom|teams|vscode|vlc|steam)"
+
+_INTENT_RULES = tuple((re.compile(pattern), intent, confidence) for pattern, intent, confidence in (
+    (r"^(?:take|capture|grab) (?:a |my |the )?(?:screenshot|screen)$|^screenshot(?: this)?$",
+     "screen_capture", 0.97),
+    (r"^(?:snap|move) (?:this |the )?(?:window )?(?:to (?:the )?)?(?:left|right)$"
+     r"|^(?:maximize|minimize) (?:this|this window|the window|all|all windows)$"
+     r"|^(?:open )?task view$|^switch (?:to the next )?window$",
+     "window_management", 0.95),
+    (r"^what(?:'s| is) (?:my |the )?(?:current )?(?:time|date|battery|battery level|volume)(?: today)?$"
+     r"|^what (?:time|day|year) is (?:it|this)$",
+     "system_query", 0.93),
+    (r"^(?:set|change) (?:the )?(?:volume|brightness) to \d{1,3}%?$"
+     r"|^(?:mute|unmute)(?: the)?(?: audio| sound| volume)?$|^lock (?:my |the )?(?:computer|pc)$",
+     "system_control", 0.95),
+    (r"^press (?:enter|tab|escape|esc|space|backspace|delete|up|down|left|right)$",
+     "input_control", 0.95),
+    (rf"^open {_BROWSERS}$|^(?:open|go to|visit) [\w-]+\.(?:com|org|net|io|dev|edu|gov|ai)$",
+     "browser_control", 0.93),
+    (rf"^(?:open|launch|start) {_APPS}$",
+     "application_launch", 0.93),
+))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CENTROID FAST PATH
+# Each intent's few-shot examples are embedded once and mean-pooled into a
+# centroid. An input that lands clearly closest to one centroid is classified
+# without the LLM; anything close or ambiguous still goes to the model.
+# The cosine score is reported as the confidence, so a hit must clear the
+# router's threshold - a weaker match would skip the LLM only to be sent to
+# the fallback handler.
+# ═══════════════════════════════════════════════════════════════════════════════
+_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+_CENTROID_MIN_SCORE = CONFIDENCE_THRESHOLD
+_CENTROID_MIN_MARGIN = 0.15
+
+_EXAMPLE_RE = re.compile(r'User: "([^"]+)"\n→ \{"intent": "(\w+)"')
 
 
 class IntentAgent:
@@ -57,6 +125,10 @@ class IntentAgent:
         "required": ["intent", "confidence", "reasoning"]
     }
     
+    # Intents a fast-model answer may be accepted for (streamed answers skip
+    # the provider's schema check, so off-label names must be caught here)
+    _ACCEPTED_INTENTS = frozenset(INTENT_SCHEMA["properties"]["intent"]["enum"]) - {"unknown"}
+    
     # Few-shot examples for reliable classification
     FEW_SHOT_EXAMPLES = """
 ## FEW-SHOT EXAMPLES (learn from these):
@@ -266,35 +338,20 @@ Examples that MUST be window_management:
 - "close this window" → window_management (NOT application_control)
 """
     
-    def __init__(self):
-        # Use planner model (mistral:7b) for better reasoning
-        # Intent classification is too critical for phi3:mini
-        self.model = get_model_manager().get_planner_model()
-        logging.info("IntentAgent initialized with planner model for reliability")
-    
-    def classify(self, user_input: str) -> Dict[str, Any]:
-        """Classify user intent with few-shot examples
-        
-        Args:
-            user_input: Raw user text
-            
-        Returns:
-            {
-                "intent": "screen_capture",
-                "confidence": 0.95,
-                "reasoning": "User wants to capture the screen"
-            }
-        """
-        prompt = f"""You are an intent classifier for a desktop assistant.
+    # Static prompt around the user input - built once so every call shares
+    # a byte-identical prefix the backend can reuse from its prompt cache
+    _PROMPT_PREFIX = """You are an intent classifier for a desktop assistant.
 
 Your job: Classify the user's intent into ONE category.
 
-{self.FEW_SHOT_EXAMPLES}
+""" + FEW_SHOT_EXAMPLES + """
 
 ---
 
 NOW CLASSIFY THIS INPUT:
-User: "{user_input}"
+User: \""""
+
+    _PROMPT_SUFFIX = """\"
 
 Respond with JSON:
 - intent: exactly one of the enum values
@@ -306,18 +363,152 @@ REMEMBER:
 - "what time" = system_query, NOT information_query  
 - "focus/close window" = application_control, NOT application_launch
 """
+    
+    def __init__(self):
+        # The small intent model (phi3:mini) answers first; anything it is
+        # unsure about is re-asked of the planner model (mistral:7b), since
+        # intent classification is too critical to trust a guess
+        manager = get_model_manager()
+        self.fast_model = manager.get_intent_model()
+        self.model = manager.get_planner_model()
+        self.fast_hits = 0
+        self.escalations = 0
+        self.rule_hits = 0
+        self.centroid_hits = 0
         
+        self._encoder = None
+        self._centroids = None
+        self._intent_names: List[str] = []
+        self._embed_cached = lru_cache(maxsize=4096)(self._embed)
+        if EMBEDDINGS_AVAILABLE:
+            self._build_centroids()
+        
+        logging.info("IntentAgent initialized: fast intent model, escalating to planner model when unsure")
+    
+    @classmethod
+    def examples_by_intent(cls) -> Dict[str, List[str]]:
+        """Group the few-shot example inputs by their labelled intent"""
+        examples: Dict[str, List[str]] = {}
+        for text, intent in _EXAMPLE_RE.findall(cls.FEW_SHOT_EXAMPLES):
+            examples.setdefault(intent, []).append(text)
+        return examples
+    
+    def _build_centroids(self) -> None:
+        """Embed the few-shot examples and mean-pool them per intent"""
         try:
-            result = self.model.generate(prompt, schema=self.INTENT_SCHEMA)
+            self._encoder = SentenceTransformer(_EMBEDDING_MODEL)
+            names, centroids = [], []
+            for intent, texts in self.examples_by_intent().items():
+                vectors = self._encoder.encode(texts, normalize_embeddings=True)
+                centroid = np.asarray(vectors, dtype=np.float32).mean(axis=0)
+                names.append(intent)
+                centroids.append(centroid / np.linalg.norm(centroid))
+            self._intent_names = names
+            self._centroids = np.stack(centroids)
+            logging.info(f"IntentAgent: {len(names)} intent centroids ready")
+        except Exception as e:
+            logging.warning(f"IntentAgent: embedding model unavailable, using LLM only: {e}")
+            self._encoder = None
+            self._centroids = None
+    
+    def _embed(self, normalized_input: str):
+        vector = self._encoder.encode([normalized_input], normalize_embeddings=True)[0]
+        return np.asarray(vector, dtype=np.float32)
+    
+    def _generate(self, model, prompt: str) -> Dict[str, Any]:
+        # Routing only needs intent + confidence - streaming providers stop
+        # decoding there instead of generating the reasoning sentence
+        result = model.generate(prompt, schema=self.INTENT_SCHEMA,
+                                stop_after=("intent", "confidence"))
+        
+        # Ensure expected types
+        if "confidence" in result:
+            result["confidence"] = float(result["confidence"])
+        if "reasoning" not in result:
+            result["reasoning"] = "No reasoning provided"
+        return result
+    
+    @staticmethod
+    def _match_rule(user_input: str):
+        """Return a classification if a fast-path rule matches, else None"""
+        text = " ".join(user_input.lower().split()).rstrip("?.!")
+        for pattern, intent, confidence in _INTENT_RULES:
+            if pattern.match(text):
+                return {
+                    "intent": intent,
+                    "confidence": confidence,
+                    "reasoning": "matched rule"
+                }
+        return None
+    
+    def _match_centroid(self, user_input: str):
+        """Return a classification if one intent centroid clearly wins, else None"""
+        if self._centroids is None or len(self._intent_names) < 2:
+            return None
+        
+        query = self._embed_cached(" ".join(user_input.lower().split()))
+        scores = self._centroids @ query
+        second, best = np.argsort(scores)[-2:]
+        top = float(scores[best])
+        if top < _CENTROID_MIN_SCORE or top - float(scores[second]) < _CENTROID_MIN_MARGIN:
+            return None
+        
+        return {
+            "intent": self._intent_names[best],
+            "confidence": top,
+            "reasoning": "matched centroid"
+        }
+    
+    def classify(self, user_input: str) -> Dict[str, Any]:
+        """Classify user intent (rules, then embedding centroids, then few-shot LLM)
+        
+        Args:
+            user_input: Raw user text
             
-            # Ensure expected types
-            if "confidence" in result:
-                result["confidence"] = float(result["confidence"])
-            if "reasoning" not in result:
-                result["reasoning"] = "No reasoning provided"
+        Returns:
+            {
+                "intent": "screen_capture",
+                "confidence": 0.95,
+                "reasoning": "User wants to capture the screen"
+            }
+        """
+        match = self._match_rule(user_input)
+        if match is not None:
+            self.rule_hits += 1
+            logging.info("Intent classified: %s (%.2f, rule)", match["intent"], match["confidence"])
+            return match
+        
+        try:
+            match = self._match_centroid(user_input)
+        except Exception as e:
+            logging.debug(f"Centroid match failed, falling back to LLM: {e}")
+            match = None
+        if match is not None:
+            self.centroid_hits += 1
+            logging.info("Intent classified: %s (%.2f, centroid)", match["intent"], match["confidence"])
+            return match
+        
+        prompt = self._PROMPT_PREFIX + user_input + self._PROMPT_SUFFIX
+        
+        if self.fast_model is not self.model:
+            try:
+                result = self._generate(self.fast_model, prompt)
+                if result["intent"] in self._ACCEPTED_INTENTS and result["confidence"] >= _ESCALATE_BELOW:
+                    self.fast_hits += 1
+                    logging.info("Intent classified: %s (%.2f, fast model)", result["intent"], result["confidence"])
+                    return result
+                logging.info("Fast intent model unsure or off-label: %s (%.2f)", result["intent"], result["confidence"])
+            except Exception as e:
+                logging.warning(f"Fast intent model failed: {e}")
+            self.escalations += 1
+            logging.info("Escalating to planner model (%d/%d fast-model calls so far)",
+                         self.escalations, self.escalations + self.fast_hits)
+        
+        try:
+            result = self._generate(self.model, prompt)
             
-            logging.info(f"Intent classified: {result['intent']} ({result['confidence']:.2f})")
-            logging.debug(f"Reasoning: {result.get('reasoning', 'N/A')}")
+            logging.info("Intent classified: %s (%.2f)", result["intent"], result["confidence"])
+            logging.debug("Reasoning: %s", result.get("reasoning", "N/A"))
             return result
             
         except Exception as e:
@@ -18,7 +18,8 @@ KEPT:
 """
 
 import logging
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
 from models.model_manager import get_model_manager
 from tools.registry import get_registry
 
@@ -75,6 +76,9 @@ class PlannerAgent:
     def __init__(self):
         self.model = get_model_manager().get_planner_model()
         self.registry = get_registry()
+        self._schema_cached = lru_cache(maxsize=8)(self._build_schema)
+        self._tools_cache = None
+        self._tools_version = -1
         logging.info("PlannerAgent initialized (reasoning-only mode)")
     
     def reason(self, user_input: str, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -94,21 +98,12 @@ class PlannerAgent:
                 "clarification_question": "..." if needs_clarification
             }
         """
-        # Get available tools
-        all_tools = self.registry.get_tools_for_llm()
-        tool_names = [t['name'] for t in all_tools]
-        
-        # Build tools description
-        tools_desc = "\n".join([
-            f"- {t['name']}: {t['description']}" for t in all_tools
-        ])
+        # Available tools, their description and the tool-enum schema
+        tool_names, tools_desc, schema = self._get_tools_bundle()
         
         # Build context description
         context_desc = self._format_context(context)
         
-        # Add tool enum constraint to schema
-        schema = self._generate_schema(tool_names)
-        
         prompt = f"""You are a reasoning agent. Your job is to understand ambiguous or complex requests and determine how to handle them.
 
 User request: "{user_input}"
@@ -172,8 +167,8 @@ Respond with JSON containing:
                 result["confidence"] = min(result.get("confidence", 0.5), 0.3)
             
             logging.info(
-                f"PlannerAgent reasoning: type={result.get('action_type')}, "
-                f"steps={len(valid_steps)}, confidence={result.get('confidence', 0):.2f}"
+                "PlannerAgent reasoning: type=%s, steps=%d, confidence=%.2f",
+                result.get("action_type"), len(valid_steps), result.get("confidence", 0)
             )
             
             return result
@@ -189,18 +184,42 @@ Respond with JSON containing:
                 "clarification_question": "Could you please rephrase your request?"
             }
     
+    def _get_tools_bundle(self) -> Tuple[Tuple[str, ...], str, Dict[str, Any]]:
+        """(tool names, prompt description, schema), rebuilt only when tools are registered"""
+        version = self.registry.version()
+        if self._tools_cache is None or version != self._tools_version:
+            all_tools = self.registry.get_tools_for_llm()
+            tool_names = tuple(t['name'] for t in all_tools)
+            tools_desc = "\n".join([
+                f"- {t['name']}: {t['description']}" for t in all_tools
+            ])
+            self._tools_cache = (tool_names, tools_desc, self._generate_schema(tool_names))
+            self._tools_version = version
+        return self._tools_cache
+    
     def _generate_schema(self, tool_names: List[str]) -> Dict[str, Any]:
-        """Generate schema with tool enum constraint."""
-        import copy
-        schema = copy.deepcopy(self.REASONING_SCHEMA)
+        """Generate schema with tool enum constraint.
         
-        if tool_names:
-            schema["properties"]["steps"]["items"]["properties"]["tool"] = {
-                "type": "string",
-                "enum": tool_names
-            }
+        Memoized per tool list - the returned schema is shared, do not mutate.
+        """
+        return self._schema_cached(tuple(tool_names))
+    
+    def _build_schema(self, tool_names: Tuple[str, ...]) -> Dict[str, Any]:
+        if not tool_names:
+            return self.REASONING_SCHEMA
         
-        return schema
+        # Copy only the path down to the patched "tool" property
+        properties = self.REASONING_SCHEMA["properties"]
+        steps = properties["steps"]
+        items = steps["items"]
+        tool = {"type": "string", "enum": list(tool_names)}
+        return {
+            **self.REASONING_SCHEMA,
+            "properties": {
+                **properties,
+                "steps": {**steps, "items": {**items, "properties": {**items["properties"], "tool": tool}}}
+            }
+        }
     
     def _format_context(self, context: Dict[str, Any]) -> str:
         """Format context for prompt."""
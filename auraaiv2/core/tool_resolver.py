@@ -10,7 +10,8 @@ Key principle: Wrong intent should DEGRADE performance, not DOOM execution.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from tools.registry import get_registry
 from models.model_manager import get_model_manager
 
@@ -100,6 +101,7 @@ class ToolResolver:
     def __init__(self):
         self.registry = get_registry()
         self.model = get_model_manager().get_planner_model()
+        self._schema_cached = lru_cache(maxsize=32)(self._build_schema)
         logging.info("ToolResolver initialized (two-stage mode)")
     
     def resolve(self, description: str, intent: str, 
@@ -287,17 +289,18 @@ Return JSON with tool, params, confidence, and reason.
             }
     
     def _generate_schema(self, tool_names: List[str]) -> Dict[str, Any]:
-        """Generate schema with tool enum constraint."""
-        import copy
-        schema = copy.deepcopy(RESOLUTION_SCHEMA)
+        """Generate schema with tool enum constraint.
         
-        if tool_names:
-            schema["properties"]["tool"] = {
-                "type": ["string", "null"],
-                "enum": [None] + tool_names
-            }
+        Memoized per tool list - the returned schema is shared, do not mutate.
+        """
+        return self._schema_cached(tuple(tool_names))
+    
+    def _build_schema(self, tool_names: Tuple[str, ...]) -> Dict[str, Any]:
+        if not tool_names:
+            return RESOLUTION_SCHEMA
         
-        return schema
+        tool = {"type": ["string", "null"], "enum": [None, *tool_names]}
+        return {**RESOLUTION_SCHEMA, "properties": {**RESOLUTION_SCHEMA["properties"], "tool": tool}}
     
     def _format_context(self, context: Dict[str, Any]) -> str:
         """Format context for prompt."""
@@ -1,9 +1,46 @@
 """Base LLM provider interface - ALL providers must implement this"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+import re
+from typing import Dict, Any, Optional, Sequence, Tuple
 import json
 
+# orjson parses model output several times faster; stdlib json is the fallback.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# A complete "key": scalar pair in partial JSON - the trailing , or } guarantees
+# the value (e.g. a number still being decoded) is finished.
+_FIELD_RE = re.compile(r'"(\w+)"\s*:\s*("(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?|true|false|null)\s*[,}]')
+
+
+def _extract_fields(partial: str, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+    """Return {field: value} once every field is complete in a partial JSON reply"""
+    found = {}
+    for match in _FIELD_RE.finditer(partial):
+        if match.group(1) in fields and match.group(1) not in found:
+            found[match.group(1)] = _json_loads(match.group(2))
+    return found if len(found) == len(fields) else None
+
+
+# Rendered schema text, keyed by id() of the (module/class-level) schema dict.
+# The dict itself is kept in the entry so its id can't be reused while cached.
+_schema_text_cache: Dict[int, Tuple[Dict[str, Any], str]] = {}
+
+
+def _schema_text(schema: Dict[str, Any]) -> str:
+    """json.dumps(schema, indent=2), computed once per schema object"""
+    entry = _schema_text_cache.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        entry = (schema, json.dumps(schema, indent=2))
+        _schema_text_cache[id(schema)] = entry
+    return entry[1]
+
 
 class BaseLLMProvider(ABC):
     """Abstract base class for all LLM providers
@@ -19,13 +56,17 @@ class BaseLLMProvider(ABC):
         self.config = kwargs
     
     @abstractmethod
-    def generate(self, prompt: str, schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def generate(self, prompt: str, schema: Optional[Dict[str, Any]] = None,
+                 stop_after: Optional[Sequence[str]] = None) -> Dict[str, Any]:
         """
         Generate a response from the LLM
         
         Args:
             prompt: The input prompt
             schema: Optional JSON schema for structured output
+            stop_after: Optional top-level keys the caller actually needs.
+                Streaming providers may stop decoding once all of them are
+                complete and return just those keys; others ignore it.
             
         Returns:
             Dict containing the response. Must be valid JSON.
@@ -66,7 +107,7 @@ class BaseLLMProvider(ABC):
                 json_str = raw_response.strip()
             
             # Parse JSON
-            response = json.loads(json_str)
+            response = _json_loads(json_str)
             
             # Validate schema
             if not self._validate_schema(response, schema):
@@ -90,7 +131,7 @@ CRITICAL RULES:
 """
         
         if schema:
-            base_prompt += f"\nRequired JSON Schema:\n{json.dumps(schema, indent=2)}\n"
+            base_prompt += f"\nRequired JSON Schema:\n{_schema_text(schema)}\n"
         
         base_prompt += f"\nUser Request: {user_prompt}\n\nRespond with JSON only:"
         
@@ -2,7 +2,7 @@
 
 import requests
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 from .base import BaseLLMProvider
 
 
@@ -11,13 +11,16 @@ class GeminiProvider(BaseLLMProvider):
     
     def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.5-flash", **kwargs):
         super().__init__(api_key, **kwargs)
+        # One pooled connection per provider - successive agent calls skip the reconnect
+        self._session = requests.Session()
         self.model = model
         self.api_url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
         
         if not self.api_key:
             raise ValueError("Gemini API key is required")
     
-    def generate(self, prompt: str, schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def generate(self, prompt: str, schema: Optional[Dict[str, Any]] = None,
+                 stop_after: Optional[Sequence[str]] = None) -> Dict[str, Any]:
         """Generate response using Gemini API"""
         
         # Build system prompt with schema constraints
@@ -41,7 +44,7 @@ class GeminiProvider(BaseLLMProvider):
         }
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.api_url,
                 headers=headers,
                 json=payload,
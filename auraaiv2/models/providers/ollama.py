@@ -6,8 +6,8 @@ NO import ollama - pure HTTP client.
 
 import requests
 import logging
-from typing import Dict, Any, Optional
-from .base import BaseLLMProvider
+from typing import Dict, Any, Optional, Sequence, Tuple
+from .base import BaseLLMProvider, _extract_fields, _json_loads
 
 
 class OllamaProvider(BaseLLMProvider):
@@ -15,12 +15,19 @@ class OllamaProvider(BaseLLMProvider):
     
     def __init__(self, api_key: Optional[str] = None, model: str = "phi-3-mini", base_url: str = "http://localhost:11434", **kwargs):
         super().__init__(api_key, **kwargs)
+        # One pooled connection per provider - successive agent calls skip the reconnect
+        self._session = requests.Session()
         self.model = model
         self.base_url = base_url.rstrip('/')
         self.api_url = f"{self.base_url}/api/chat"
     
-    def generate(self, prompt: str, schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Generate response using Ollama /api/chat endpoint (HTTP only)"""
+    def generate(self, prompt: str, schema: Optional[Dict[str, Any]] = None,
+                 stop_after: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """Generate response using Ollama /api/chat endpoint (HTTP only)
+        
+        With stop_after, the reply is streamed and the connection closed (which
+        stops Ollama decoding) as soon as those top-level keys are complete.
+        """
         
         # Build system prompt
         system_prompt = self._build_system_prompt(prompt, schema)
@@ -46,22 +53,28 @@ class OllamaProvider(BaseLLMProvider):
         }
         
         try:
-            response = requests.post(
-                self.api_url,
-                json=payload,
-                timeout=120  # 120s timeout as specified
-            )
-            
-            response.raise_for_status()
-            response_data = response.json()
-            
-            # Extract text from response (Ollama chat format)
-            if "message" in response_data:
-                raw_text = response_data["message"].get("content", "").strip()
-            elif "response" in response_data:
-                raw_text = response_data["response"].strip()
+            if stop_after:
+                payload["stream"] = True
+                raw_text, fields = self._stream_until(payload, stop_after)
+                if fields is not None:
+                    return fields
             else:
-                raise ValueError("No response in API data")
+                response = self._session.post(
+                    self.api_url,
+                    json=payload,
+                    timeout=120  # 120s timeout as specified
+                )
+                
+                response.raise_for_status()
+                response_data = response.json()
+                
+                # Extract text from response (Ollama chat format)
+                if "message" in response_data:
+                    raw_text = response_data["message"].get("content", "").strip()
+                elif "response" in response_data:
+                    raw_text = response_data["response"].strip()
+                else:
+                    raise ValueError("No response in API data")
             
             if not raw_text:
                 raise ValueError("Empty response from Ollama")
@@ -80,10 +93,37 @@ class OllamaProvider(BaseLLMProvider):
             logging.error(f"Ollama provider error: {e}")
             raise
     
+    def _stream_until(self, payload: Dict[str, Any], fields: Sequence[str]) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Stream a chat reply; returns (text so far, fields) or (full text, None)"""
+        parts = []
+        with self._session.post(self.api_url, json=payload, timeout=120, stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = _json_loads(line)
+                content = chunk.get("message", {}).get("content", "")
+                parts.append(content)
+                if chunk.get("done"):
+                    break
+                # A value can only have just completed if a , or } arrived
+                if "," in content or "}" in content:
+                    found = _extract_fields("".join(parts), fields)
+                    if found is not None:
+                        # Closing the unread stream is what makes Ollama stop decoding.
+                        # The trade-off: that socket cannot go back to the session's
+                        # pool, so the next call opens a new local TCP connection
+                        # (~1 ms) - far cheaper than the tokens it saves. Replies read
+                        # to the end (no early stop) still reuse the connection.
+                        response.close()
+                        logging.debug(f"Ollama: stopped decoding after {len(parts)} chunks")
+                        return "".join(parts), found
+        return "".join(parts).strip(), None
+    
     def check_available(self) -> bool:
         """Check if Ollama is available and model exists (HTTP only)"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=5)
             if response.status_code == 200:
                 models = response.json().get("models", [])
                 model_names = [m.get("name", "") for m in models]
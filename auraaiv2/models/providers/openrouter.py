@@ -2,7 +2,7 @@
 
 import requests
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 from .base import BaseLLMProvider
 
 
@@ -11,13 +11,16 @@ class OpenRouterProvider(BaseLLMProvider):
     
     def __init__(self, api_key: Optional[str] = None, model: str = "mistralai/mistral-7b-instruct", **kwargs):
         super().__init__(api_key, **kwargs)
+        # One pooled connection per provider - successive agent calls skip the reconnect
+        self._session = requests.Session()
         self.model = model
         self.api_url = "https://openrouter.ai/api/v1/chat/completions"
         
         if not self.api_key:
             raise ValueError("OpenRouter API key is required")
     
-    def generate(self, prompt: str, schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def generate(self, prompt: str, schema: Optional[Dict[str, Any]] = None,
+                 stop_after: Optional[Sequence[str]] = None) -> Dict[str, Any]:
         """Generate response using OpenRouter API"""
         
         # Build system prompt
@@ -46,7 +49,7 @@ class OpenRouterProvider(BaseLLMProvider):
         }
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.api_url,
                 headers=headers,
                 json=payload,
@@ -0,0 +1,161 @@
+"""Unit Tests for the DecompositionGate fast path and caching
+
+Mock-based - the planner model is never called for real.
+"""
+
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "gate_cache.json"
+
+
+@pytest.fixture
+def make_gate(cache_path):
+    """Factory for DecompositionGates sharing one mocked planner model"""
+    model = MagicMock()
+    model.model = "test-model"
+    model.generate.return_value = {
+        "classification": "multi",
+        "reasoning": "Two actions",
+        "actions": [
+            {"description": "open notepad", "depends_on_previous": False},
+            {"description": "type hello", "depends_on_previous": True},
+        ],
+    }
+    manager = MagicMock()
+    manager.get_planner_model.return_value = model
+
+    def make():
+        with patch("agents.decomposition_gate.get_model_manager", return_value=manager):
+            from agents.decomposition_gate import DecompositionGate
+            return DecompositionGate(cache_path=cache_path)
+    return make
+
+
+@pytest.fixture
+def gate(make_gate):
+    return make_gate()
+
+
+class TestFastPath:
+    """Obviously-single commands are classified without the LLM"""
+
+    @pytest.mark.parametrize("user_input", [
+        "take a screenshot",
+        "what time is it",
+        "increase the volume",
+        "open notepad",
+        "write hello world into notes.txt",
+        "delete the old logs",
+        "list files in downloads",
+    ])
+    def test_single_skips_model(self, gate, user_input):
+        result = gate.classify_with_actions(user_input)
+
+        assert result["classification"] == "single"
+        assert result["actions"] == [{"description": user_input, "depends_on_previous": False}]
+        gate.model.generate.assert_not_called()
+        assert gate.fast_path_hits == 1
+
+    @pytest.mark.parametrize("user_input", [
+        "open notepad and type hello",
+        "focus notepad, type hello, and press enter",
+        "open notepad then type hi",
+        "open chrome search for cats",
+        "create a folder called projects and put a readme.txt inside it",
+        "type hello in notepad",
+        "search for AI in chrome",
+        "play despacito on youtube",
+        "paste this into word",
+    ])
+    def test_ambiguous_goes_to_model(self, gate, user_input):
+        assert gate.classify(user_input) == "multi"
+        gate.model.generate.assert_called_once()
+        assert gate.fast_path_hits == 0
+
+
+class TestMemoization:
+    """Repeated commands reuse the model result"""
+
+    def test_repeat_uses_cache(self, gate):
+        first = gate.classify_with_actions("open notepad and type hello")
+        first["actions"].clear()  # Callers get their own copy
+        second = gate.classify_with_actions("open  notepad and type hello")
+
+        assert len(second["actions"]) == 2
+        gate.model.generate.assert_called_once()
+
+    def test_failures_are_not_cached(self, gate):
+        gate.model.generate.side_effect = RuntimeError("model offline")
+
+        result = gate.classify_with_actions("open notepad and type hello")
+        assert result["classification"] == "single"
+        assert "model offline" in result["reasoning"]
+
+        gate.model.generate.side_effect = None
+        assert gate.classify("open notepad and type hello") == "multi"
+        assert gate.model.generate.call_count == 2
+
+    def test_clear_cache(self, gate):
+        gate.classify("open notepad and type hello")
+        gate.clear_cache()
+        gate.classify("open notepad and type hello")
+
+        assert gate.model.generate.call_count == 2
+
+
+class TestPersistence:
+    """Model results survive a restart (a new gate instance)"""
+
+    def test_restart_reuses_result(self, gate, make_gate, cache_path):
+        gate.classify("open notepad and type hello")
+        gate.flush_cache()
+        assert cache_path.exists()
+
+        restarted = make_gate()
+        assert restarted.classify("open notepad and type hello") == "multi"
+        gate.model.generate.assert_called_once()
+
+    def test_prompt_change_invalidates(self, gate, make_gate):
+        gate.classify("open notepad and type hello")
+        gate.flush_cache()
+
+        gate.model.model = "other-model"
+        restarted = make_gate()
+        restarted.classify("open notepad and type hello")
+        assert gate.model.generate.call_count == 2
+
+    def test_corrupt_file_is_ignored(self, make_gate, cache_path):
+        cache_path.write_text("{not json")
+
+        gate = make_gate()
+        assert gate.classify("open notepad and type hello") == "multi"
+        gate.model.generate.assert_called_once()
+
+    def test_saves_are_batched(self, gate, cache_path):
+        with patch.object(gate, "_save_persisted", wraps=gate._save_persisted) as save:
+            gate.classify("open notepad and type hello")
+            gate.classify("open chrome then search for cats")
+            assert not cache_path.exists()  # Debounced, nothing written yet
+
+            gate.flush_cache()
+            gate.flush_cache()  # Nothing pending, no second write
+
+        save.assert_called_once()
+        assert len(json.loads(cache_path.read_text())["entries"]) == 2
+
+    def test_write_is_atomic(self, gate, cache_path):
+        gate.classify("open notepad and type hello")
+        gate.flush_cache()
+        original = cache_path.read_text()
+
+        gate.classify("open chrome then search for cats")
+        with patch("agents.decomposition_gate.os.replace", side_effect=OSError("disk full")):
+            gate.flush_cache()
+
+        assert cache_path.read_text() == original
+        assert [p.name for p in cache_path.parent.iterdir()] == [cache_path.name]
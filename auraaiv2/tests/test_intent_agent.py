@@ -0,0 +1,241 @@
+"""Unit Tests for the IntentAgent centroid fast path
+
+Mock-based - neither the planner model nor a real embedding model is loaded.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+
+@pytest.fixture
+def model():
+    model = MagicMock()
+    model.generate.return_value = {
+        "intent": "information_query",
+        "confidence": 0.9,
+        "reasoning": "General question"
+    }
+    return model
+
+
+def _make_agent(model, fast_model=None):
+    manager = MagicMock()
+    manager.get_planner_model.return_value = model
+    manager.get_intent_model.return_value = fast_model or model
+    with patch("agents.intent_agent.get_model_manager", return_value=manager):
+        from agents.intent_agent import IntentAgent
+        return IntentAgent()
+
+
+class TestExamples:
+    """Few-shot examples parse into per-intent groups"""
+
+    def test_examples_by_intent(self):
+        from agents.intent_agent import IntentAgent
+
+        examples = IntentAgent.examples_by_intent()
+
+        assert "take a screenshot" in examples["screen_capture"]
+        assert "snap right" in examples["window_management"]
+        assert set(examples) <= set(IntentAgent.INTENT_SCHEMA["properties"]["intent"]["enum"])
+
+
+class TestFallback:
+    """Without embeddings every input goes to the LLM"""
+
+    def test_no_embeddings_uses_model(self, model):
+        with patch("agents.intent_agent.EMBEDDINGS_AVAILABLE", False):
+            agent = _make_agent(model)
+
+        result = agent.classify("what is the capital of France")
+
+        assert result["intent"] == "information_query"
+        model.generate.assert_called_once()
+        assert agent.centroid_hits == 0
+
+
+class TestEscalation:
+    """The small intent model answers first; unsure answers escalate"""
+
+    @pytest.fixture
+    def fast_model(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def agent(self, model, fast_model):
+        with patch("agents.intent_agent.EMBEDDINGS_AVAILABLE", False):
+            return _make_agent(model, fast_model)
+
+    def test_confident_fast_answer(self, agent, model, fast_model):
+        fast_model.generate.return_value = {"intent": "file_operation", "confidence": 0.9}
+
+        result = agent.classify("delete the old logs")
+
+        assert result["intent"] == "file_operation"
+        model.generate.assert_not_called()
+        assert (agent.fast_hits, agent.escalations) == (1, 0)
+
+    @pytest.mark.parametrize("fast_result", [
+        {"intent": "file_operation", "confidence": 0.5, "reasoning": "guess"},
+        {"intent": "unknown", "confidence": 0.9, "reasoning": "no idea"},
+        {"intent": "app_launch", "confidence": 0.95},
+        RuntimeError("model offline"),
+    ])
+    def test_unsure_fast_answer_escalates(self, agent, model, fast_model, fast_result):
+        fast_model.generate.side_effect = [fast_result]
+
+        result = agent.classify("what is the capital of France")
+
+        assert result["intent"] == "information_query"
+        assert fast_model.generate.call_args[0][0] == model.generate.call_args[0][0]
+        assert (agent.fast_hits, agent.escalations) == (0, 1)
+
+
+class TestPrompt:
+    """The LLM prompt keeps a byte-identical prefix across inputs"""
+
+    def test_static_prefix(self, model):
+        with patch("agents.intent_agent.EMBEDDINGS_AVAILABLE", False):
+            agent = _make_agent(model)
+
+        prompts = []
+        for user_input in ("open notepad and type hello", "explain quantum physics"):
+            agent.classify(user_input)
+            prompts.append(model.generate.call_args[0][0])
+
+        for prompt, user_input in zip(prompts, ("open notepad and type hello", "explain quantum physics")):
+            assert prompt == agent._PROMPT_PREFIX + user_input + agent._PROMPT_SUFFIX
+        assert agent.FEW_SHOT_EXAMPLES in agent._PROMPT_PREFIX
+
+
+class TestCentroids:
+    """Clear centroid matches skip the LLM, ambiguous ones do not"""
+
+    @pytest.fixture
+    def agent(self, model):
+        np = pytest.importorskip("numpy")
+        intents = ["screen_capture", "system_query", "input_control"]
+
+        def encode(texts, normalize_embeddings=True):
+            # One axis per intent keyword; anything else is spread evenly
+            vectors = []
+            for text in texts:
+                hits = [float(text.count(word)) for word in ("screen", "time", "type")]
+                vector = np.array(hits if any(hits) else [1.0, 1.0, 1.0])
+                vectors.append(vector / np.linalg.norm(vector))
+            return np.array(vectors)
+
+        encoder = MagicMock()
+        encoder.encode.side_effect = encode
+        examples = {
+            "screen_capture": ["capture my screen"],
+            "system_query": ["what time is it"],
+            "input_control": ["type hello world"],
+        }
+        with patch("agents.intent_agent.EMBEDDINGS_AVAILABLE", True), \
+             patch("agents.intent_agent.np", np, create=True), \
+             patch("agents.intent_agent.SentenceTransformer", return_value=encoder, create=True), \
+             patch("agents.intent_agent.IntentAgent.examples_by_intent", return_value=examples):
+            agent = _make_agent(model)
+            assert agent._intent_names == intents
+            yield agent
+
+    def test_clear_match_skips_model(self, agent, model):
+        result = agent.classify("screenshot the whole screen")
+
+        assert result["intent"] == "screen_capture"
+        assert result["reasoning"] == "matched centroid"
+        model.generate.assert_not_called()
+        assert agent.centroid_hits == 1
+
+    def test_ambiguous_goes_to_model(self, agent, model):
+        result = agent.classify("explain quantum physics")
+
+        assert result["intent"] == "information_query"
+        model.generate.assert_called_once()
+        assert agent.centroid_hits == 0
+
+    def test_weak_match_goes_to_model(self, agent, model):
+        # Clear winner (margin ~0.24) but a score of ~0.73, under the router threshold
+        result = agent.classify("screen screen screen time time type type")
+
+        assert result["intent"] == "information_query"
+        model.generate.assert_called_once()
+        assert agent.centroid_hits == 0
+
+    def test_hit_reaches_intent_pipeline(self, agent, model):
+        from core.intent_router import IntentRouter
+
+        router = IntentRouter()
+        pipeline, fallback = MagicMock(return_value={"status": "success"}), MagicMock()
+        router.register("screen_capture", pipeline)
+        router.set_fallback(fallback)
+
+        user_input = "screenshot the whole screen"
+        router.route(agent.classify(user_input), user_input, {})
+
+        pipeline.assert_called_once_with(user_input, {})
+        fallback.assert_not_called()
+        model.generate.assert_not_called()
+
+    def test_repeat_embeds_once(self, agent):
+        agent.classify("Show  my screen please")
+        agent.classify("show my screen please")
+
+        assert agent._embed_cached.cache_info().hits == 1
+
+
+class TestRules:
+    """Unambiguous phrasings are classified by rule, without the LLM"""
+
+    @pytest.fixture
+    def agent(self, model):
+        with patch("agents.intent_agent.EMBEDDINGS_AVAILABLE", False):
+            return _make_agent(model)
+
+    @pytest.mark.parametrize("user_input,intent", [
+        ("take a screenshot", "screen_capture"),
+        ("Snap this window to the left", "window_management"),
+        ("what time is it?", "system_query"),
+        ("set volume to 50", "system_control"),
+        ("press enter", "input_control"),
+        ("open google.com", "browser_control"),
+        ("launch spotify", "application_launch"),
+    ])
+    def test_rule_skips_model(self, agent, model, user_input, intent):
+        result = agent.classify(user_input)
+
+        assert result["intent"] == intent
+        assert result["reasoning"] == "matched rule"
+        model.generate.assert_not_called()
+        assert agent.rule_hits == 1
+
+    @pytest.mark.parametrize("user_input", [
+        "open notepad and type hello",
+        "what was my battery level earlier",
+        "start chrome",
+        "open downloads",
+        "open youtube",
+        "open gmail",
+        "open netflix",
+        "open google",
+        "open settings",
+        "open bluetooth",
+        "open wifi",
+        "start recording",
+        "start timer",
+        "open notes.txt",
+    ])
+    def test_ambiguous_goes_to_model(self, agent, model, user_input):
+        agent.classify(user_input)
+
+        model.generate.assert_called_once()
+        assert agent.rule_hits == 0
+
+    def test_rules_agree_with_examples(self):
+        from agents.intent_agent import IntentAgent
+
+        for intent, texts in IntentAgent.examples_by_intent().items():
+            for text in texts:
+                match = IntentAgent._match_rule(text)
+                assert match is None or match["intent"] == intent, text
@@ -0,0 +1,70 @@
+"""Unit Tests for OllamaProvider early-stop streaming
+
+Mock-based - no Ollama server is contacted.
+"""
+
+import json
+import pytest
+from unittest.mock import MagicMock
+
+
+def _stream(*pieces):
+    """Fake streamed /api/chat response yielding one NDJSON line per piece"""
+    lines = [json.dumps({"message": {"content": piece}, "done": False}).encode() for piece in pieces]
+    lines.append(json.dumps({"message": {"content": ""}, "done": True}).encode())
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.iter_lines.return_value = iter(lines)
+    return response
+
+
+@pytest.fixture
+def provider():
+    from models.providers.ollama import OllamaProvider
+
+    provider = OllamaProvider(model="test-model")
+    provider._session = MagicMock()
+    return provider
+
+
+class TestStopAfter:
+    """Decoding stops once the requested fields are complete"""
+
+    SCHEMA = {"required": ["intent", "confidence", "reasoning"]}
+
+    def test_stops_early(self, provider):
+        response = _stream('{"intent": "screen_capture', '", "confidence": 0.9', '5, "reas', 'oning": "x"}')
+        provider._session.post.return_value = response
+
+        result = provider.generate("classify", schema=self.SCHEMA, stop_after=("intent", "confidence"))
+
+        assert result == {"intent": "screen_capture", "confidence": 0.95}
+        assert provider._session.post.call_args[1]["json"]["stream"] is True
+        assert next(response.iter_lines.return_value)  # Remaining chunks were never read
+        response.close.assert_called_once()
+        response.__exit__.assert_called_once()
+
+    def test_falls_back_to_full_parse(self, provider):
+        provider._session.post.return_value = _stream('{"reasoning": "no intent key", ', '"confidence": 0.4}')
+
+        with pytest.raises(ValueError):
+            provider.generate("classify", schema=self.SCHEMA, stop_after=("intent", "confidence"))
+
+    def test_full_stream_is_not_cut_short(self, provider):
+        response = _stream('{"intent": "unknown", ', '"reasoning": "no confidence given"}')
+        provider._session.post.return_value = response
+
+        result = provider.generate("classify", stop_after=("intent", "confidence"))
+
+        assert result == {"intent": "unknown", "reasoning": "no confidence given"}
+        response.close.assert_not_called()  # Read to the end, connection stays pooled
+
+    def test_without_stop_after_is_not_streamed(self, provider):
+        response = MagicMock()
+        response.json.return_value = {"message": {"content": '{"intent": "unknown", "confidence": 0, "reasoning": "x"}'}}
+        provider._session.post.return_value = response
+
+        result = provider.generate("classify", schema=self.SCHEMA)
+
+        assert result["reasoning"] == "x"
+        assert provider._session.post.call_args[1]["json"]["stream"] is False
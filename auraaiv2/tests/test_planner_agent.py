@@ -0,0 +1,65 @@
+"""Unit Tests for PlannerAgent tool-set caching
+
+Mock-based - the planner model is never called for real.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+
+@pytest.fixture
+def registry():
+    from tools.registry import ToolRegistry
+    from tools.base import Tool
+
+    registry = ToolRegistry()
+    for name in ("system.display.screenshot", "system.input.keyboard.type"):
+        tool = MagicMock(spec=Tool)
+        tool.name = name
+        tool.to_dict.return_value = {"name": name, "description": f"{name} tool", "schema": {}}
+        registry.register(tool)
+    return registry
+
+
+@pytest.fixture
+def planner(registry):
+    model = MagicMock()
+    model.generate.return_value = {"action_type": "information", "explanation": "ok", "steps": []}
+    with patch("agents.planner_agent.get_model_manager") as mock_mm, \
+         patch("agents.planner_agent.get_registry", return_value=registry):
+        mock_mm.return_value.get_planner_model.return_value = model
+        from agents.planner_agent import PlannerAgent
+        return PlannerAgent()
+
+
+class TestToolsBundle:
+    """Tool names, description and schema are built once per tool set"""
+
+    def test_reused_between_calls(self, planner, registry):
+        with patch.object(registry, "get_tools_for_llm", wraps=registry.get_tools_for_llm) as spy:
+            planner.reason("do something", {})
+            planner.reason("do something else", {})
+
+        spy.assert_called_once()
+        schema = planner.model.generate.call_args[1]["schema"]
+        tool = schema["properties"]["steps"]["items"]["properties"]["tool"]
+        assert tool["enum"] == ["system.display.screenshot", "system.input.keyboard.type"]
+        assert "- system.input.keyboard.type: system.input.keyboard.type tool" in \
+            planner.model.generate.call_args[0][0]
+
+    def test_rebuilt_after_registration(self, planner, registry):
+        from tools.base import Tool
+
+        names, _, _ = planner._get_tools_bundle()
+        tool = MagicMock(spec=Tool)
+        tool.name = "system.audio.mute"
+        tool.to_dict.return_value = {"name": "system.audio.mute", "description": "Mute", "schema": {}}
+        registry.register(tool)
+
+        assert planner._get_tools_bundle()[0] == names + ("system.audio.mute",)
+
+    def test_class_schema_untouched(self, planner):
+        from agents.planner_agent import PlannerAgent
+
+        planner.reason("do something", {})
+        assert PlannerAgent.REASONING_SCHEMA["properties"]["steps"]["items"]["properties"]["tool"] == {"type": "string"}
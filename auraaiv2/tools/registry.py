@@ -12,6 +12,7 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: Dict[str, Tool] = {}
+        self._version = 0
     
     def register(self, tool: Tool):
         """Register a tool"""
@@ -22,6 +23,11 @@ class ToolRegistry:
             raise ValueError(f"Tool '{tool.name}' is already registered")
         
         self._tools[tool.name] = tool
+        self._version += 1
+    
+    def version(self) -> int:
+        """Counter bumped on every registration (for caches of the tool set)"""
+        return self._version
     
     def get(self, tool_name: str) -> Optional[Tool]:
         """Get a tool by name"""
@@ -14,7 +14,7 @@ The 'Unified Brain' contract:
 """
 
 import logging
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, Tuple, Optional, Callable
 
 # Layer 1 Components (Routing)
 from routing.intent_router import get_intent_router
@@ -38,6 +38,13 @@ except ImportError:
     AI_CLIENT_AVAILABLE = False
     ai_client = None
 
+# Returned once the caller's is_cancelled() says the command was stopped
+_CANCELLED = ("Stopped.", False, False)
+
+
+def _never_cancelled() -> bool:
+    return False
+
 
 class HybridOrchestrator:
     """
@@ -85,17 +92,23 @@ class HybridOrchestrator:
                 logging.error(f"Failed to load V2 Brain: {e}")
         return self._v2_brain
 
-    def process(self, user_input: str, context: Optional[Dict[str, Any]] = None) -> Tuple[str, bool, bool]:
+    def process(self, user_input: str, context: Optional[Dict[str, Any]] = None,
+                is_cancelled: Optional[Callable[[], bool]] = None) -> Tuple[str, bool, bool]:
         """
         Main entry point for command execution.
+        is_cancelled is polled before every tool execution and between layers;
+        once it returns True nothing else is executed.
         Returns: (response_text, success, used_llm)
         """
+        is_cancelled = is_cancelled or _never_cancelled
         logging.info(f"Hybrid Brain: '{user_input[:50]}'")
         
         # =========================================================================
         # LAYER 1: LOCAL REFLEX (Outside) - 0 Tokens
         # =========================================================================
-        local_result = self._handle_layer_1_local(user_input, context)
+        local_result = self._handle_layer_1_local(user_input, context, is_cancelled)
+        if is_cancelled():
+            return _CANCELLED
         if local_result:
             self.stats["layer1_local"] += 1
             return local_result[0], local_result[1], False
@@ -105,7 +118,9 @@ class HybridOrchestrator:
         # =========================================================================
         # If Layer 1 doesn't have a strong match, use Gemini to generate code.
         # This restores v1 behavior where ANY command can work.
-        gemini_result = self._handle_layer_1_gemini_fallback(user_input, context)
+        gemini_result = self._handle_layer_1_gemini_fallback(user_input, context, is_cancelled)
+        if is_cancelled():
+            return _CANCELLED
         if gemini_result[1]:  # If successful
             self.stats["layer1_gemini_fallback"] += 1
             return gemini_result
@@ -117,13 +132,16 @@ class HybridOrchestrator:
         logging.info("LAYER 2: Falling back to Agentic Reasoning")
         self.stats["layer2_agentic"] += 1
         v2_result = self._handle_layer_2_agentic(user_input, context)
+        if is_cancelled():
+            return _CANCELLED
         
         # =========================================================================
         # LAYER 3: SAFE EXECUTION + SELF-HEALING (Learning Loop)
         # =========================================================================
         return self._handle_layer_3_execution(v2_result, user_input, context)
 
-    def _handle_layer_1_local(self, user_input: str, context: Optional[Dict[str, Any]]) -> Optional[Tuple[str, bool]]:
+    def _handle_layer_1_local(self, user_input: str, context: Optional[Dict[str, Any]],
+                              is_cancelled: Callable[[], bool] = _never_cancelled) -> Optional[Tuple[str, bool]]:
         """
         Attempts to route the command via regex/keyword mapping.
         Returns Tuple[response, success] if matched, else None.
@@ -143,6 +161,8 @@ class HybridOrchestrator:
                 
                 if resolved_plan:
                     logging.info(f"Resolved to Tool: {resolved_plan.tool_name}")
+                    if is_cancelled():
+                        return None
                     
                     # DELEGATE TO V2 EXECUTOR (The SSOT Executor)
                     exec_result = self.v2_brain.executor.execute_step(
@@ -178,7 +198,8 @@ class HybridOrchestrator:
             
         return None
 
-    def _handle_layer_1_gemini_fallback(self, user_input: str, context: Optional[Dict[str, Any]]) -> Tuple[str, bool, bool]:
+    def _handle_layer_1_gemini_fallback(self, user_input: str, context: Optional[Dict[str, Any]],
+                                        is_cancelled: Callable[[], bool] = _never_cancelled) -> Tuple[str, bool, bool]:
         """
         Uses Gemini to generate and execute code for any command.
         This is the v1-like behavior for handling arbitrary commands.
@@ -188,7 +209,8 @@ class HybridOrchestrator:
             
         try:
             code = ai_client.generate_code(user_input, context=context or {})
-            if code:
+            # Never execute generated code for a command that was stopped meanwhile
+            if code and not is_cancelled():
                 # DELEGATE TO V2 EXECUTOR (SSOT for Code Execution)
                 exec_result = self.v2_brain.executor.execute_step(
                     tool_name="run_python",
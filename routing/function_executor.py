@@ -128,8 +128,15 @@ class LocalIntentResolver:
         logging.warning(f"LocalIntentResolver: No mapping for intent '{intent_name}'")
         return None
 
-def get_intent_resolver():
-    return LocalIntentResolver()
+_intent_resolver_instance = None
+
+
+def get_intent_resolver() -> LocalIntentResolver:
+    """Return the shared (stateless) LocalIntentResolver."""
+    global _intent_resolver_instance
+    if _intent_resolver_instance is None:
+        _intent_resolver_instance = LocalIntentResolver()
+    return _intent_resolver_instance
 
 
 # ---------------------------------------------------------------------------
@@ -143,7 +150,7 @@ class FunctionExecutor:
     """
 
     def __init__(self):
-        self._resolver = LocalIntentResolver()
+        self._resolver = get_intent_resolver()
         self._v2_executor = None
         self._v2_path = Path(__file__).resolve().parent.parent / "auraaiv2"
 
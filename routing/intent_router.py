@@ -12,7 +12,8 @@ Routing Logic:
 
 import re
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Callable, Tuple
 
 # Try to import fuzzy matching
@@ -984,6 +985,9 @@ class IntentRouter:
     
     def __init__(self):
         self._compile_patterns()
+        self._fuzzy_choices = list(self.FUZZY_PHRASES)
+        # Classification depends only on the normalized text - repeated commands hit the cache
+        self._classify_cached = lru_cache(maxsize=256)(self._classify_normalized)
     
     def _compile_patterns(self):
         """Pre-compile regex patterns for speed"""
@@ -1005,8 +1009,12 @@ class IntentRouter:
         - confidence 0.50-0.85: Ask Gemini for intent only
         - confidence < 0.50: Full Gemini reasoning
         """
-        command_lower = command.lower().strip()
-        
+        result = self._classify_cached(command.lower().strip())
+        # Cached results are shared - hand out a copy carrying this call's command
+        return replace(result, args=dict(result.args), raw_command=command)
+    
+    def _classify_normalized(self, command_lower: str) -> RouteResult:
+        """Uncached classification of an already lowercased/stripped command"""
         # ═══════════════════════════════════════════════════════════════
         # CHECK 1: Is this a conversation/question?
         # ═══════════════════════════════════════════════════════════════
@@ -1015,8 +1023,7 @@ class IntentRouter:
                 return RouteResult(
                     confidence=0.95,
                     is_conversation=True,
-                    match_type="conversation",
-                    raw_command=command
+                    match_type="conversation"
                 )
         
         # ═══════════════════════════════════════════════════════════════
@@ -1032,8 +1039,7 @@ class IntentRouter:
                             confidence=0.95,
                             function=func_name,
                             args=args,
-                            match_type="pattern",
-                            raw_command=command
+                            match_type="pattern"
                         )
                     except Exception as e:
                         logging.warning(f"Extractor error for {func_name}: {e}")
@@ -1050,8 +1056,7 @@ class IntentRouter:
                         confidence=0.75,
                         function=func_name,
                         args={},
-                        match_type="keyword",
-                        raw_command=command
+                        match_type="keyword"
                     )
         
         # ═══════════════════════════════════════════════════════════════
@@ -1060,7 +1065,7 @@ class IntentRouter:
         if FUZZY_AVAILABLE:
             best_match = process.extractOne(
                 command_lower,
-                list(self.FUZZY_PHRASES.keys()),
+                self._fuzzy_choices,
                 scorer=fuzz.ratio
             )
             
@@ -1072,8 +1077,7 @@ class IntentRouter:
                     confidence=confidence,
                     function=func_name,
                     args=args,
-                    match_type="fuzzy",
-                    raw_command=command
+                    match_type="fuzzy"
                 )
         
         # ═══════════════════════════════════════════════════════════════
@@ -1089,8 +1093,7 @@ class IntentRouter:
                         confidence=0.50,
                         function=func_name,
                         args={},
-                        match_type="partial",
-                        raw_command=command
+                        match_type="partial"
                     )
         
         # ═══════════════════════════════════════════════════════════════
@@ -1098,8 +1101,7 @@ class IntentRouter:
         # ═══════════════════════════════════════════════════════════════
         return RouteResult(
             confidence=0.0,
-            match_type="none",
-            raw_command=command
+            match_type="none"
         )
     
     def get_function_mapping(self, intent_name: str) -> Optional[str]:
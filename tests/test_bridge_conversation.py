@@ -0,0 +1,205 @@
+"""Unit Tests for the butler conversation of AuraV2Bridge
+
+History bookkeeping and reply streaming - the bridge is built without its
+router or executor, and Gemini is replaced by a fake streaming client.
+"""
+
+import types
+
+import pytest
+
+pytest.importorskip("google.genai")
+
+
+@pytest.fixture
+def bridge(monkeypatch, tmp_path):
+    # Importing the bridge loads ~/.aura/.env and builds the AI client, which
+    # refuses a missing key - use an empty home and a dummy key (never sent)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key-" + "0" * 20)
+    from ui.bridge import AuraV2Bridge
+    bridge = AuraV2Bridge.__new__(AuraV2Bridge)  # Skip the heavy __init__
+    bridge.max_history = 20
+    bridge.clear_conversation_history()
+    return bridge
+
+
+def _exchange(bridge, user, assistant):
+    bridge._commit_turn("user", user)
+    bridge._commit_turn("assistant", assistant)
+    bridge._trim_history()
+
+
+def _assert_consistent(bridge):
+    history = bridge.conversation_history
+    assert len(bridge._history_turns) == len(history) == len(bridge._history_tokens)
+    assert bridge._history_token_total == sum(bridge._history_tokens)
+    if history:
+        assert history[0]["role"] == "user"
+    for message, turn in zip(history, bridge._history_turns):
+        assert turn["role"] == ("user" if message["role"] == "user" else "model")
+        assert turn["parts"] == [{"text": message["content"]}]
+
+
+class TestCommitTurn:
+    """Committed turns are formatted once and counted"""
+
+    def test_turn_is_formatted_and_counted(self, bridge):
+        bridge._commit_turn("user", "hello")
+        bridge._commit_turn("assistant", "Good evening, sir.")
+
+        assert [turn["role"] for turn in bridge._history_turns] == ["user", "model"]
+        assert all(tokens > 0 for tokens in bridge._history_tokens)
+        _assert_consistent(bridge)
+
+
+class TestTrimHistory:
+    """History is trimmed in blocks, by message count and by token budget"""
+
+    def test_under_budget_is_untouched(self, bridge):
+        for i in range(bridge.max_history // 2):
+            _exchange(bridge, f"question {i}", f"answer {i}")
+
+        assert len(bridge.conversation_history) == bridge.max_history
+        _assert_consistent(bridge)
+
+    def test_message_limit_trims_down_to_half(self, bridge):
+        for i in range(bridge.max_history // 2 + 1):
+            _exchange(bridge, f"question {i}", f"answer {i}")
+
+        assert len(bridge.conversation_history) == bridge.max_history // 2
+        assert bridge.conversation_history[-1]["content"] == f"answer {bridge.max_history // 2}"
+        _assert_consistent(bridge)
+
+    def test_prefix_is_stable_between_trims(self, bridge):
+        for i in range(bridge.max_history // 2 + 1):
+            _exchange(bridge, f"question {i}", f"answer {i}")
+        prefix = list(bridge._history_turns)
+
+        _exchange(bridge, "one more", "certainly")
+
+        assert bridge._history_turns[:len(prefix)] == prefix
+
+    def test_token_budget_trims_down_to_half(self, bridge):
+        from ui.bridge import _CHARS_PER_TOKEN, _HISTORY_TOKEN_BUDGET
+        reply = "x" * (_HISTORY_TOKEN_BUDGET * _CHARS_PER_TOKEN // 5)
+        for i in range(5):
+            _exchange(bridge, f"question {i}", reply)
+
+        assert bridge._history_token_total <= _HISTORY_TOKEN_BUDGET // 2
+        assert len(bridge.conversation_history) < 10
+        _assert_consistent(bridge)
+
+    def test_very_long_reply_keeps_latest_exchange(self, bridge):
+        from ui.bridge import _CHARS_PER_TOKEN, _HISTORY_TOKEN_BUDGET
+        _exchange(bridge, "hello", "Good evening, sir.")
+        long_reply = "x" * (3 * _HISTORY_TOKEN_BUDGET * _CHARS_PER_TOKEN)
+        _exchange(bridge, "tell me everything", long_reply)
+
+        # Over budget on its own, but the latest exchange is never dropped
+        assert [m["content"] for m in bridge.conversation_history] == ["tell me everything", long_reply]
+        _assert_consistent(bridge)
+
+        _exchange(bridge, "thanks", "My pleasure.")
+
+        assert [m["content"] for m in bridge.conversation_history] == ["thanks", "My pleasure."]
+        _assert_consistent(bridge)
+
+
+class _FakeStream:
+    """generate_content_stream() stand-in yielding text chunks, then maybe failing"""
+
+    def __init__(self, texts, error=None):
+        self._texts = iter(texts)
+        self._error = error
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        for text in self._texts:
+            return types.SimpleNamespace(text=text)
+        if self._error:
+            raise self._error
+        raise StopIteration
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def chat(bridge):
+    """The bridge with a fake Gemini client; chat.requests records each call"""
+    chat = types.SimpleNamespace(bridge=bridge, requests=[], stream=None)
+
+    def generate_content_stream(**kwargs):
+        chat.requests.append(kwargs)
+        return chat.stream
+
+    bridge._memory = None
+    bridge._ai_client = types.SimpleNamespace(
+        model="test-model",
+        client=types.SimpleNamespace(models=types.SimpleNamespace(
+            generate_content_stream=generate_content_stream)),
+    )
+    return chat
+
+
+class TestHandleConversation:
+    """Butler replies stream through on_token and are committed only when complete"""
+
+    def test_chunks_stream_and_reply_is_committed(self, chat):
+        chat.stream = _FakeStream(["Good ", "", "evening, ", "sir."])
+        tokens = []
+
+        response, success, used_gemini = chat.bridge._handle_conversation("hello", tokens.append)
+
+        assert tokens == ["Good ", "evening, ", "sir."]
+        assert (response, success, used_gemini) == ("Good evening, sir.", True, True)
+        assert chat.bridge.conversation_history == [
+            {"role": "user", "content": "hello"},
+            {"role": "assistant", "content": "Good evening, sir."},
+        ]
+        _assert_consistent(chat.bridge)
+
+    def test_history_is_sent_before_the_new_message(self, chat):
+        chat.bridge._commit_turn("user", "hello")
+        chat.bridge._commit_turn("assistant", "Good evening, sir.")
+        chat.stream = _FakeStream(["Certainly."])
+
+        chat.bridge._handle_conversation("what time is it")
+
+        contents = chat.requests[0]["contents"]
+        assert contents[:2] == chat.bridge._history_turns[:2]
+        assert contents[2]["role"] == "user"
+        assert "what time is it" in contents[2]["parts"][0]["text"]
+
+    def test_failed_stream_commits_nothing(self, chat):
+        chat.bridge._commit_turn("user", "hello")
+        chat.bridge._commit_turn("assistant", "Good evening, sir.")
+        history = list(chat.bridge.conversation_history)
+        chat.stream = _FakeStream(["Partial "], error=ConnectionError("stream dropped"))
+        tokens = []
+
+        response, success, used_gemini = chat.bridge._handle_conversation("tell me a story", tokens.append)
+
+        assert tokens == ["Partial "]
+        assert not success
+        assert chat.bridge.conversation_history == history
+        _assert_consistent(chat.bridge)
+
+    def test_cancel_closes_stream_and_commits_nothing(self, chat):
+        from ui.bridge import CommandCancelled
+        chat.stream = _FakeStream(["One ", "two ", "three"])
+
+        def on_token(text):
+            raise CommandCancelled()
+
+        with pytest.raises(CommandCancelled):
+            chat.bridge._handle_conversation("count for me", on_token)
+
+        assert chat.stream.closed
+        assert chat.bridge.conversation_history == []
+        _assert_consistent(chat.bridge)
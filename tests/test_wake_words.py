@@ -0,0 +1,42 @@
+"""Unit Tests for hands-free wake word matching
+
+No microphone or event loop - only the text matching of ContinuousListeningThread.
+"""
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+
+@pytest.fixture
+def listener():
+    from aura_floating_widget.aura_widget import ContinuousListeningThread
+    return ContinuousListeningThread()
+
+
+class TestWakeWord:
+    """Wake words and their misrecognitions match as whole words"""
+
+    @pytest.mark.parametrize("text", [
+        "aura open notepad",
+        "Hey Aura what time is it",
+        "ok aura",
+        "laura",
+        "or a play music",
+        "for a moment",
+    ])
+    def test_detected(self, listener, text):
+        assert listener._check_wake_word(text)
+
+    @pytest.mark.parametrize("text", [
+        "change the color and size",
+        "thanks for all the help",
+        "hello there",
+        "explorer",
+        "ask for advice",
+    ])
+    def test_false_positives_ignored(self, listener, text):
+        assert not listener._check_wake_word(text)
+
+    def test_extract_command(self, listener):
+        assert listener._extract_command("Hey Aura, open notepad") == "open notepad"
@@ -5,7 +5,9 @@ Drop-in replacement for the current processing pipeline.
 """
 
 import logging
-from typing import Optional, Dict, Any, Tuple
+import re
+import threading
+from typing import Optional, Dict, Any, Tuple, Callable
 
 # AURA v2 Components
 from core.context import get_context, AuraState, AuraMode
@@ -25,6 +27,57 @@ except ImportError:
     def get_memory_manager(): return None
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# BUTLER CONVERSATION PROMPT
+# Static persona is sent as the system instruction so every conversation turn
+# shares the same prefix; only the length hint and current message vary.
+# ═══════════════════════════════════════════════════════════════════════════════
+_BUTLER_SYSTEM_PROMPT = """You are AURA, an sophisticated AI butler assistant with these characteristics:
+
+PERSONALITY:
+- Polite, refined, and attentive like a traditional British butler
+- Warm and engaging, making conversation feel natural
+- Knowledgeable and well-informed across many topics
+- Proactive in offering help and suggestions
+- Uses phrases like "Certainly, sir/madam", "I'd be delighted to assist"
+- Remembers context from previous messages in the conversation
+
+CONVERSATION STYLE:
+- Be conversational and engaging, not robotic
+- Provide detailed, informative responses when appropriate
+- Ask follow-up questions to continue the dialogue when relevant
+- Show genuine interest in the user's inquiries
+- Use natural language, avoid being too formal or stiff
+
+MEMORY & CONTEXT:
+The earlier turns of this conversation are provided as chat history.
+
+Respond as AURA, the helpful AI butler. Be informative, engaging, and conversational. Remember what was discussed before."""
+
+_BRIEF_KEYWORDS = ("briefly", "short", "quick", "tl;dr", "in a nutshell", "summarize", "one sentence", "keep it short")
+_DETAILED_KEYWORDS = ("in detail", "detailed", "explain fully", "elaborate", "comprehensive", "thorough", "tell me everything")
+
+# One pass per keyword set (substring semantics, like the plain `in` checks)
+_BRIEF_RE = re.compile("|".join(map(re.escape, _BRIEF_KEYWORDS)), re.IGNORECASE)
+_DETAILED_RE = re.compile("|".join(map(re.escape, _DETAILED_KEYWORDS)), re.IGNORECASE)
+
+# Butler replies longer than this are truncated for display (history keeps all)
+_MAX_DISPLAY_WORDS = 500
+
+# Committed history is capped by (estimated) tokens as well as message count,
+# so a few long replies can't blow up every later prompt
+_HISTORY_TOKEN_BUDGET = 2000
+_CHARS_PER_TOKEN = 4  # Rough English average; only used for budgeting
+
+_LENGTH_BRIEF = "RESPONSE LENGTH: User wants a BRIEF answer. Keep it to 1-3 sentences maximum. Be concise."
+_LENGTH_DETAILED = "RESPONSE LENGTH: User wants a DETAILED answer. Provide comprehensive information with examples if relevant."
+_LENGTH_BALANCED = "RESPONSE LENGTH: Provide a balanced response - informative but not overly long. 3-5 sentences for simple questions, more for complex topics."
+
+
+class CommandCancelled(Exception):
+    """Raised from an on_token callback to abandon a command the user stopped"""
+
+
 class AuraV2Bridge:
     """
     Bridge between AURA v2 and the existing floating widget.
@@ -55,11 +108,16 @@ class AuraV2Bridge:
             except Exception as e:
                 logging.warning(f"Memory manager not available: {e}")
         
-        # Gemini client (lazy load)
+        # Gemini client (lazy load - the widget's prewarm thread and its
+        # processing worker may both ask for it first)
         self._ai_client = None
+        self._ai_client_lock = threading.Lock()
         
         # Conversation memory for butler mode
         self.conversation_history = []
+        self._history_turns = []  # Same messages, pre-formatted as Gemini content turns
+        self._history_tokens = []  # Estimated token count per message
+        self._history_token_total = 0
         self.max_history = 20  # Keep last 20 exchanges
         
         # Stats
@@ -79,14 +137,18 @@ class AuraV2Bridge:
     def ai_client(self):
         """Lazy load AI client"""
         if self._ai_client is None:
-            try:
-                from ai.client import ai_client
-                self._ai_client = ai_client
-            except Exception as e:
-                logging.error(f"Could not load AI client: {e}")
+            with self._ai_client_lock:
+                if self._ai_client is None:
+                    try:
+                        from ai.client import ai_client
+                        self._ai_client = ai_client
+                    except Exception as e:
+                        logging.error(f"Could not load AI client: {e}")
         return self._ai_client
     
-    def process(self, command: str, context: Dict[str, Any] = None) -> Tuple[str, bool, bool]:
+    def process(self, command: str, context: Dict[str, Any] = None,
+                on_token: Optional[Callable[[str], None]] = None,
+                is_cancelled: Optional[Callable[[], bool]] = None) -> Tuple[str, bool, bool]:
         """
         Process a command using AURA v2 intelligent routing.
         
@@ -95,6 +157,11 @@ class AuraV2Bridge:
         Args:
             command: The user's voice command
             context: Optional context dict (filename, etc.)
+            on_token: Optional callback receiving conversational reply text
+                      as it streams in (called from the calling thread); it
+                      may raise CommandCancelled to abort the stream
+            is_cancelled: Optional check polled before any tool is executed;
+                          once it returns True nothing more is executed
             
         Returns:
             Tuple of (response_text, success, used_gemini)
@@ -117,12 +184,12 @@ class AuraV2Bridge:
         # ═══════════════════════════════════════════════════════════════
         if route_result.is_conversation:
             self.stats["gemini_chat"] += 1
-            return self._handle_conversation(command)
+            return self._handle_conversation(command, on_token)
         
         # ═══════════════════════════════════════════════════════════════
         # v2.5 HYBRID ROUTING: Fast Local -> Agentic Planning -> Learning
         # ═══════════════════════════════════════════════════════════════
-        return hybrid_brain.process(command, context)
+        return hybrid_brain.process(command, context, is_cancelled)
     
     def _execute_local(self, route_result: RouteResult) -> Tuple[str, bool, bool]:
         """Execute command locally (0 tokens)"""
@@ -213,7 +280,8 @@ class AuraV2Bridge:
             logging.error(f"Gemini error: {e}")
             return self.response_gen.failure(), False, True
     
-    def _handle_conversation(self, message: str) -> Tuple[str, bool, bool]:
+    def _handle_conversation(self, message: str,
+                             on_token: Optional[Callable[[str], None]] = None) -> Tuple[str, bool, bool]:
         """Handle conversational message with memory and butler personality"""
         logging.info(f"BUTLER CONVERSATION: {message}")
         
@@ -221,33 +289,13 @@ class AuraV2Bridge:
             return "I apologize, but I'm experiencing connectivity difficulties at the moment, sir.", False, False
         
         try:
-            # Add user message to history
-            self.conversation_history.append({"role": "user", "content": message})
-            
-            # Keep only recent history
-            if len(self.conversation_history) > self.max_history:
-                self.conversation_history = self.conversation_history[-self.max_history:]
-            
-            # Build conversation context
-            conversation_context = "\n".join([
-                f"{'User' if msg['role'] == 'user' else 'AURA'}: {msg['content']}"
-                for msg in self.conversation_history[-10:]  # Last 10 messages for context
-            ])
-            
             # Detect user intent for response length
-            brief_keywords = ["briefly", "short", "quick", "tl;dr", "in a nutshell", "summarize", "one sentence", "keep it short"]
-            detailed_keywords = ["in detail", "detailed", "explain fully", "elaborate", "comprehensive", "thorough", "tell me everything"]
-            
-            wants_brief = any(kw in message.lower() for kw in brief_keywords)
-            wants_detailed = any(kw in message.lower() for kw in detailed_keywords)
-            
-            length_instruction = ""
-            if wants_brief:
-                length_instruction = "\n\nRESPONSE LENGTH: User wants a BRIEF answer. Keep it to 1-3 sentences maximum. Be concise."
-            elif wants_detailed:
-                length_instruction = "\n\nRESPONSE LENGTH: User wants a DETAILED answer. Provide comprehensive information with examples if relevant."
+            if _BRIEF_RE.search(message):
+                length_instruction = _LENGTH_BRIEF
+            elif _DETAILED_RE.search(message):
+                length_instruction = _LENGTH_DETAILED
             else:
-                length_instruction = "\n\nRESPONSE LENGTH: Provide a balanced response - informative but not overly long. 3-5 sentences for simple questions, more for complex topics."
+                length_instruction = _LENGTH_BALANCED
             
             # Get long-term memory context from Supermemory
             memory_context = ""
@@ -255,69 +303,109 @@ class AuraV2Bridge:
                 try:
                     memory_context = self._memory.build_context_prompt(message)
                     if memory_context:
-                        memory_context = f"\n\nLONG-TERM MEMORY:\n{memory_context}"
+                        memory_context = f"LONG-TERM MEMORY:\n{memory_context}\n\n"
                 except Exception as e:
                     logging.debug(f"Could not fetch memory context: {e}")
             
-            # Enhanced butler personality prompt
-            prompt = f"""You are AURA, an sophisticated AI butler assistant with these characteristics:
-
-PERSONALITY:
-- Polite, refined, and attentive like a traditional British butler
-- Warm and engaging, making conversation feel natural
-- Knowledgeable and well-informed across many topics
-- Proactive in offering help and suggestions
-- Uses phrases like "Certainly, sir/madam", "I'd be delighted to assist"
-- Remembers context from previous messages in the conversation
-
-CONVERSATION STYLE:
-- Be conversational and engaging, not robotic
-- Provide detailed, informative responses when appropriate
-- Ask follow-up questions to continue the dialogue when relevant
-- Show genuine interest in the user's inquiries
-- Use natural language, avoid being too formal or stiff
-{length_instruction}
+            # Only the per-turn parts go in the final (uncached) message
+            contents = self._history_turns + [{"role": "user", "parts": [{"text": (
+                f"{memory_context}{length_instruction}\n\n"
+                f"Current user message: {message}"
+            )}]}]
 
-MEMORY & CONTEXT:
-You remember this conversation:
-{conversation_context}
-{memory_context}
-
-Current user message: {message}
-
-Respond as AURA, the helpful AI butler. Be informative, engaging, and conversational. Remember what was discussed before."""
-
-            # Use the same google-genai client pattern as the main AI client.
-            # Note: current client API does not accept generation_config here,
-            # so we rely on the model's defaults for now.
-            response = self.ai_client.client.models.generate_content(
+            # Stream the reply so the caller can start speaking the first
+            # sentence while the rest is still being generated
+            stream = self.ai_client.client.models.generate_content_stream(
                 model=self.ai_client.model,
-                contents=prompt,
+                contents=contents,
+                config={"system_instruction": _BUTLER_SYSTEM_PROMPT},
             )
+            chunks = []
+            try:
+                for chunk in stream:
+                    text = chunk.text
+                    if not text:
+                        continue
+                    chunks.append(text)
+                    if on_token:
+                        on_token(text)
+            except CommandCancelled:
+                # Stop generating now; nothing is committed to history
+                close = getattr(stream, "close", None)
+                if close:
+                    close()
+                raise
             
-            response_text = response.text.strip()
+            response_text = "".join(chunks).strip()
             
-            # Truncate very long responses for better UX (keep first 500 words)
-            words = response_text.split()
-            if len(words) > 500:
-                truncated = ' '.join(words[:500]) + "\n\n[Response truncated - full answer available in conversation history]"
-                logging.info(f"BUTLER RESPONSE (truncated from {len(words)} words): {truncated[:160]}...")
-            else:
+            # Truncate very long responses for better UX (keep first 500 words).
+            # Words need a separator, so text this short can't exceed the
+            # limit - only long replies pay for the split.
+            display_response = response_text
+            if len(response_text) > 2 * _MAX_DISPLAY_WORDS:
+                words = response_text.split()
+                if len(words) > _MAX_DISPLAY_WORDS:
+                    display_response = ' '.join(words[:_MAX_DISPLAY_WORDS]) + "\n\n[Response truncated - full answer available in conversation history]"
+                    logging.info(f"BUTLER RESPONSE (truncated from {len(words)} words): {display_response[:160]}...")
+            if display_response is response_text:
                 logging.info(f"BUTLER RESPONSE: {response_text[:160]}{'...' if len(response_text) > 160 else ''}")
             
-            # Store full response in history, but return truncated version for display
-            full_response = response_text
-            display_response = truncated if len(words) > 500 else response_text
-            
-            # Add assistant response to history (full version)
-            self.conversation_history.append({"role": "assistant", "content": full_response})
+            # Commit the exchange (full response). History is trimmed in blocks
+            # rather than sliding every turn so the cached prefix survives
+            self._commit_turn("user", message)
+            self._commit_turn("assistant", response_text)
+            self._trim_history()
             
             return display_response, True, True
             
+        except CommandCancelled:
+            raise
         except Exception as e:
             logging.error(f"Conversation error: {e}")
             return "I apologize, but I'm experiencing a momentary difficulty. Could you please repeat that?", False, True
     
+    def _commit_turn(self, role: str, content: str) -> None:
+        """Append a message to history, formatting its Gemini turn once.
+        
+        Committed turns form a byte-stable prefix after the system
+        instruction, so Gemini's implicit prefix cache can reuse it.
+        """
+        self.conversation_history.append({"role": role, "content": content})
+        self._history_turns.append({
+            "role": "user" if role == "user" else "model",
+            "parts": [{"text": content}],
+        })
+        tokens = len(content) // _CHARS_PER_TOKEN + 1
+        self._history_tokens.append(tokens)
+        self._history_token_total += tokens
+    
+    def _trim_history(self) -> None:
+        """Drop the oldest exchanges once history is over its message or token budget.
+        
+        Trims down to half of both budgets in one go (never past the latest
+        exchange) so the committed prefix stays byte-stable between trims.
+        """
+        count = len(self.conversation_history)
+        if count <= self.max_history and self._history_token_total <= _HISTORY_TOKEN_BUDGET:
+            return
+        
+        start = max(0, count - self.max_history // 2)
+        total = sum(self._history_tokens[start:])
+        # Whole user/assistant exchanges only, so history always starts with a user turn
+        while start < count - 2 and total > _HISTORY_TOKEN_BUDGET // 2:
+            total -= self._history_tokens[start] + self._history_tokens[start + 1]
+            start += 2
+        
+        self.conversation_history = self.conversation_history[start:]
+        self._history_turns = self._history_turns[start:]
+        self._history_tokens = self._history_tokens[start:]
+        self._history_token_total = total
+    
+    def warm_up(self) -> None:
+        """Pre-open the Gemini connection (blocking - call from a background thread)"""
+        if self.ai_client:
+            self.ai_client.warm_up()
+    
     def get_acknowledgment(self) -> str:
         """Get a wake word acknowledgment"""
         return self.response_gen.acknowledgment()
@@ -357,6 +445,9 @@ Respond as AURA, the helpful AI butler. Be informative, engaging, and conversati
     def clear_conversation_history(self) -> None:
         """Clear conversation memory - useful for starting fresh"""
         self.conversation_history = []
+        self._history_turns = []
+        self._history_tokens = []
+        self._history_token_total = 0
         logging.info("Conversation history cleared")
     
     def get_conversation_length(self) -> int:
@@ -368,14 +459,16 @@ Respond as AURA, the helpful AI butler. Be informative, engaging, and conversati
 aura_bridge = AuraV2Bridge()
 
 
-def process_command(command: str, context: Dict = None) -> Tuple[str, bool, bool]:
+def process_command(command: str, context: Dict = None,
+                    on_token: Optional[Callable[[str], None]] = None,
+                    is_cancelled: Optional[Callable[[], bool]] = None) -> Tuple[str, bool, bool]:
     """
     Process a command using AURA v2.
     
     Returns:
         (response, success, used_gemini)
     """
-    return aura_bridge.process(command, context)
+    return aura_bridge.process(command, context, on_token, is_cancelled)
 
 
 def get_acknowledgment() -> str:
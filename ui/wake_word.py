@@ -233,6 +233,10 @@ class WakeWordDetector:
                 pass
 
 
+# Greeting prefixes accepted before the base wake word
+_WAKE_VARIATIONS = ("hey ", "ok ", "hi ", "hello ")
+
+
 # Simple keyword-based detector for when no audio backend is available
 class KeywordWakeDetector:
     """
@@ -247,6 +251,9 @@ class KeywordWakeDetector:
     def _normalize_wake_words(self):
         """Normalize wake words for matching"""
         self.wake_words_normalized = [w.lower().strip() for w in self.wake_words]
+        # "hey/ok/hi/hello <base word>" prefixes, built once for a single startswith()
+        base_word = self.wake_words_normalized[0].replace("hey ", "").replace("ok ", "")
+        self._variation_prefixes = tuple(var + base_word for var in _WAKE_VARIATIONS)
     
     def check(self, text: str) -> bool:
         """
@@ -266,14 +273,7 @@ class KeywordWakeDetector:
                 return True
         
         # Check for common variations
-        variations = ["hey ", "ok ", "hi ", "hello "]
-        base_word = self.wake_words_normalized[0].replace("hey ", "").replace("ok ", "")
-        
-        for var in variations:
-            if text_lower.startswith(var + base_word):
-                return True
-        
-        return False
+        return text_lower.startswith(self._variation_prefixes)
     
     def extract_command(self, text: str) -> str:
         """
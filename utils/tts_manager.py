@@ -126,13 +126,20 @@ class TTSManager:
                 if text is None:
                     break
                 
+                # on_idle() callback - everything queued before it has been spoken
+                if callable(text):
+                    text()
+                    continue
+                
                 # Check if we should stop before speaking
                 if self._should_stop:
                     self._should_stop = False
-                    # Clear queue of pending messages
+                    # Clear queue of pending messages (idle callbacks still fire)
                     try:
                         while True:
-                            self._queue.get_nowait()
+                            pending = self._queue.get_nowait()
+                            if callable(pending):
+                                pending()
                     except queue.Empty:
                         pass
                     continue
@@ -183,6 +190,13 @@ class TTSManager:
         if TTS_AVAILABLE and text and text.strip():
             self._queue.put(text)
     
+    def on_idle(self, callback):
+        """Call callback (on the TTS thread) once everything queued so far is spoken"""
+        if self._thread is None or not self._thread.is_alive():
+            callback()
+            return
+        self._queue.put(callback)
+    
     def stop_speaking(self):
         """Stop current speech immediately"""
         self._should_stop = True
@@ -224,11 +238,17 @@ def stop_speaking():
     """Stop current TTS playback immediately"""
     get_tts_manager().stop_speaking()
 
+def on_speech_idle(callback):
+    """Call callback from the TTS thread once all queued speech has finished"""
+    get_tts_manager().on_idle(callback)
+
 
 def speak_chunked(text: str, max_chunk_words: int = 50):
     """
     Speak text in manageable chunks for interruptibility.
     Splits by sentences, then by word count if sentences are too long.
+    The first sentence is queued on its own so playback starts as soon
+    as possible; later sentences are grouped up to max_chunk_words.
     
     Args:
         text: The text to speak
@@ -246,6 +266,11 @@ def speak_chunked(text: str, max_chunk_words: int = 50):
     current_chunk = []
     current_word_count = 0
     
+    # Queue the first sentence immediately - it plays while the rest is chunked
+    first_words = sentences[0].split()
+    if len(first_words) <= max_chunk_words:
+        tts.speak(sentences.pop(0))
+    
     for sentence in sentences:
         words = sentence.split()
         